@@ -12,9 +12,10 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
-from naverblog.config import inject_secrets
+from naverblog.config import DEFAULT_BLOG_ID, inject_secrets
 inject_secrets()
 
+from naverblog.crawl_worker import get_crawl_progress, job_is_active, start_crawl_if_empty
 from naverblog.database import Database
 from naverblog.image_gen import (
     generate_blog_images,
@@ -275,15 +276,41 @@ db = get_db()
 seed_default_styles(db)
 registry = get_skill_registry(db)
 
-# ─── 자동 크롤링 ───
-if db.count_blog_posts() == 0:
-    from naverblog.crawler import crawl_blog
-    with st.spinner("첫 실행: 보보쌤 블로그 글 50개를 수집하고 있습니다..."):
-        result = crawl_blog(db)
-    if result["success"] > 0:
-        st.toast(f"블로그 글 {result['success']}개 자동 수집 완료!", icon="✅")
-        st.cache_resource.clear()
-        st.rerun()
+# ─── 자동 크롤링 (백그라운드) ───
+# 글이 없으면 프로세스당 한 번 백그라운드로 수집을 시작하고, 그동안에도 글 생성은 가능
+# (레퍼런스 글 없이 스타일 가이드만으로 생성).
+start_crawl_if_empty(db)
+
+
+def render_crawl_status(job: dict | None) -> None:
+    if job_is_active(job):
+        st.info(
+            f"📥 블로그 글을 백그라운드에서 수집하고 있습니다. 수집이 끝나기 전에는 "
+            f"레퍼런스 글 없이 스타일 가이드만으로 글을 생성합니다.\n\n{job['message']}"
+        )
+        st.session_state["watching_crawl_job"] = job["id"]
+    elif job and st.session_state.get("watching_crawl_job") == job["id"]:
+        # 이 세션에서 진행 중인 걸 보던 작업이 끝났을 때 한 번만 알림
+        if job["status"] == "done":
+            st.toast(f"블로그 글 {job['success']}개 수집 완료!", icon="✅")
+        else:
+            st.toast(f"블로그 글 수집 실패: {job['error']}", icon="⚠️")
+        del st.session_state["watching_crawl_job"]
+
+
+def poll_crawl_status() -> None:
+    job = get_crawl_progress(db)
+    if not job_is_active(job):
+        st.rerun()  # 끝났으면 앱 전체를 다시 실행해 폴링 없이 (완료 알림과 함께) 그린다
+    render_crawl_status(job)
+
+
+# 수집이 진행 중이고 st.fragment(run_every)가 있는 버전일 때만 이 부분을 주기적으로 다시 그린다
+crawl_job = get_crawl_progress(db)
+if job_is_active(crawl_job) and hasattr(st, "fragment"):
+    st.fragment(run_every=2)(poll_crawl_status)()
+else:
+    render_crawl_status(crawl_job)
 
 
 # ═══════════════════════════════════════
@@ -302,9 +329,24 @@ with st.sidebar:
 
     st.markdown("")
 
+    # ─ 블로그 (여러 블로그를 등록한 경우에만) ─
+    selected_blog_id = ""
+    blog_sources = db.list_blog_sources()
+    if len(blog_sources) > 1:
+        st.markdown('<p class="sidebar-section-label">블로그</p>', unsafe_allow_html=True)
+        blog_labels = {f"{src['name']} ({src['blog_id']})": src["blog_id"] for src in blog_sources}
+        selected_blog_id = blog_labels[st.selectbox(
+            "블로그", list(blog_labels), index=0, label_visibility="collapsed",
+            help="레퍼런스 글과 카테고리를 이 블로그의 글에서 가져옵니다",
+        )]
+        st.markdown("")
+
     # ─ 카테고리 ─
     st.markdown('<p class="sidebar-section-label">카테고리</p>', unsafe_allow_html=True)
-    db_categories = get_available_categories(db)
+    if selected_blog_id and selected_blog_id != DEFAULT_BLOG_ID:
+        db_categories = db.get_blog_post_categories(selected_blog_id)
+    else:
+        db_categories = get_available_categories(db)
     category_options = ["선택 안함"] + (db_categories or AVAILABLE_CATEGORIES) + ["직접 입력"]
     selected_category_label = st.selectbox(
         "블로그 카테고리", category_options, index=0, label_visibility="collapsed",
@@ -578,6 +620,7 @@ if submitted and topic.strip():
                 skip_search=not use_search,
                 category=selected_category,
                 ref_post_count=ref_post_count if use_ref_posts else 0,
+                blog_id=selected_blog_id,
             )
         except Exception as e:
             st.error(f"글 생성 중 오류가 발생했습니다: {e}")
@@ -730,6 +773,13 @@ if submitted and topic.strip():
 
         total_len = len(generation.prompt_used)
         st.metric("전체 프롬프트 길이", f"{total_len:,}자 (~{total_len//4:,} 토큰)")
+
+        if generation.skill_runs:
+            run_labels = {"ok": "✅", "timeout": "⏱️ 시간 초과", "error": "❌ 오류"}
+            st.caption(" · ".join(
+                f"{run.name} {run_labels.get(run.status, run.status)} {run.elapsed_ms / 1000:.1f}초"
+                for run in generation.skill_runs
+            ))
     tab_idx += 1
 
     with tabs[tab_idx]:
@@ -744,21 +794,79 @@ st.divider()
 # ─── 이전 생성 기록 ───
 st.markdown('<p class="history-label">이전 생성 기록</p>', unsafe_allow_html=True)
 
-history = db.list_generations(limit=10)
+HISTORY_PAGE_SIZE = 10
+POST_TYPE_LABELS = {"general": "일반", "review": "리뷰", "listicle": "리스트"}
+
+filter_values = db.list_generation_filter_values()
+hist_cols = st.columns([3, 2, 2, 2, 2])
+with hist_cols[0]:
+    history_query = st.text_input(
+        "기록 검색", placeholder="주제/본문 검색", label_visibility="collapsed",
+    )
+history_filters = {}
+for col, (key, label) in zip(hist_cols[1:], (
+    ("persona_name", "페르소나"), ("llm_model", "모델"),
+    ("category", "카테고리"), ("post_type", "글 유형"),
+)):
+    with col:
+        options = [""] + filter_values[key]
+        history_filters[key] = st.selectbox(
+            label, options, label_visibility="collapsed",
+            format_func=lambda v, label=label, key=key: (
+                f"{label}: 전체" if not v else POST_TYPE_LABELS.get(v, v) if key == "post_type" else v
+            ),
+        )
+
+# 필터/검색이 바뀌면 첫 페이지부터. 커서 스택으로 이전 페이지로 돌아간다.
+history_key = (history_query, tuple(history_filters.values()))
+if st.session_state.get("history_key") != history_key:
+    st.session_state["history_key"] = history_key
+    st.session_state["history_cursors"] = [None]
+    st.session_state.pop("history_open", None)
+cursors = st.session_state["history_cursors"]
+
+history, next_cursor = db.list_generation_summaries(
+    limit=HISTORY_PAGE_SIZE, cursor=cursors[-1], query=history_query, **history_filters,
+)
 
 if not history:
-    st.info("아직 생성된 글이 없습니다. 위에서 주제를 입력하고 생성해보세요!")
+    if len(cursors) == 1 and not history_query and not any(history_filters.values()):
+        st.info("아직 생성된 글이 없습니다. 위에서 주제를 입력하고 생성해보세요!")
+    else:
+        st.info("조건에 맞는 생성 기록이 없습니다.")
 else:
     for gen in history:
-        with st.expander(
-            f"#{gen.id}  ·  {gen.topic}  ·  {gen.llm_model}  ·  "
-            f"{gen.created_at.strftime('%m/%d %H:%M')}"
-        ):
-            tab1, tab2 = st.tabs(["미리보기", "HTML"])
-            with tab1:
-                st.markdown(gen.output_markdown)
-            with tab2:
-                st.code(gen.output_html, language="html")
+        row_cols = st.columns([8, 1])
+        with row_cols[0]:
+            category_label = f"  ·  {gen.category}" if gen.category else ""
+            st.markdown(
+                f"**#{gen.id}**  ·  {gen.topic}  ·  {gen.llm_model}{category_label}  ·  "
+                f"{gen.created_at.strftime('%m/%d %H:%M')}"
+            )
+        with row_cols[1]:
+            is_open = st.session_state.get("history_open") == gen.id
+            if st.button("닫기" if is_open else "보기", key=f"hist_{gen.id}"):
+                st.session_state["history_open"] = None if is_open else gen.id
+                st.rerun()
+        # 본문은 연 기록만 읽는다
+        if st.session_state.get("history_open") == gen.id:
+            opened = db.get_generation(gen.id)
+            if opened:
+                tab1, tab2 = st.tabs(["미리보기", "HTML"])
+                with tab1:
+                    st.markdown(opened.output_markdown)
+                with tab2:
+                    st.code(opened.output_html, language="html")
+
+    nav_cols = st.columns([1, 1, 6])
+    with nav_cols[0]:
+        if st.button("← 이전", disabled=len(cursors) == 1, key="hist_prev"):
+            cursors.pop()
+            st.rerun()
+    with nav_cols[1]:
+        if st.button("다음 →", disabled=next_cursor is None, key="hist_next"):
+            cursors.append(next_cursor)
+            st.rerun()
 
 # ─── 푸터 ───
 st.markdown("")
@@ -15,6 +15,7 @@ load_dotenv()
 from naverblog.config import inject_secrets
 inject_secrets()
 
+from naverblog.crawl_worker import get_crawl_progress, job_is_active, start_background_crawl
 from naverblog.database import Database
 
 st.set_page_config(
@@ -41,6 +42,9 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 
+POSTS_PER_PAGE = 20
+
+
 @st.cache_resource
 def get_db() -> Database:
     return Database()
@@ -55,9 +59,41 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+# ─── 크롤링 진행 상황 ───
+def render_crawl_status(job: dict | None) -> None:
+    if not job:
+        return
+    if job_is_active(job):
+        st.info(f"📥 백그라운드 크롤링 진행 중 (시작 {job['started_at']})\n\n{job['message']}")
+    elif job["status"] == "done":
+        st.caption(
+            f"마지막 크롤링: {job['finished_at']} · 새 글 {job['success']}개, "
+            f"이미 저장됨 {job['skip']}개, 실패 {job['fail']}개"
+        )
+    else:
+        st.warning(f"마지막 크롤링 실패 ({job['finished_at'] or job['updated_at']}): {job['error'] or job['message']}")
+
+
+def poll_crawl_status() -> None:
+    job = get_crawl_progress(db)
+    if not job_is_active(job):
+        st.rerun()  # 끝났으면 페이지 전체(통계 포함)를 다시 그리고 폴링을 멈춘다
+    render_crawl_status(job)
+
+
+# 진행 중일 때만 이 부분을 2초마다 다시 그린다 (st.fragment가 없는 버전은 한 번만)
+crawl_job = get_crawl_progress(db)
+if job_is_active(crawl_job) and hasattr(st, "fragment"):
+    st.fragment(run_every=2)(poll_crawl_status)()
+else:
+    render_crawl_status(crawl_job)
+
 # ─── 통계 ───
-total = db.count_blog_posts()
-categories = db.get_blog_post_categories()
+# 통계는 트리거로 유지되는 corpus_stats에서 (글 수와 관계없이 일정한 비용)
+stats = db.get_corpus_stats()
+total = stats["total_posts"]
+category_stats = {c["category"]: c for c in stats["categories"]}
+categories = list(category_stats)
 
 col1, col2, col3 = st.columns(3)
 with col1:
@@ -65,8 +101,7 @@ with col1:
 with col2:
     st.metric("카테고리 수", f"{len(categories)}개")
 with col3:
-    total_chars = sum(len(p["content"]) for p in db.list_blog_posts())
-    st.metric("총 글자 수", f"{total_chars:,}자")
+    st.metric("총 글자 수", f"{stats['total_chars']:,}자")
 
 st.divider()
 
@@ -81,30 +116,48 @@ with tab_list:
         st.info("저장된 레퍼런스 글이 없습니다. '글 추가' 탭에서 추가하거나 크롤링 스크립트를 실행해주세요.")
     else:
         filter_options = ["전체"] + categories
-        selected_filter = st.selectbox("카테고리 필터", filter_options)
-
-        if selected_filter == "전체":
-            posts = db.list_blog_posts()
+        search_col, filter_col = st.columns([3, 2])
+        with search_col:
+            search_query = st.text_input("검색", placeholder="제목/본문 검색 (예: 자기소개서 면접)")
+        with filter_col:
+            selected_filter = st.selectbox("카테고리 필터", filter_options)
+        filter_category = "" if selected_filter == "전체" else selected_filter
+
+        if search_query.strip():
+            results = db.search_blog_posts(search_query, category=filter_category, limit=50)
+            st.markdown(f"### '{search_query.strip()}' 검색 결과 ({len(results)}개)")
+            for r in results:
+                st.markdown(f"**{r['title']}** · {r['category']}")
+                st.caption(r["snippet"])
+            # 검색 결과 글만 아래에서 편집/삭제할 수 있도록
+            posts = results
+            st.divider()
         else:
-            posts = db.list_blog_posts(category=selected_filter)
-
-        st.markdown(f"### {selected_filter} ({len(posts)}개)")
+            filtered_count = category_stats[filter_category]["post_count"] if filter_category else total
+            st.markdown(f"### {selected_filter} ({filtered_count}개)")
+            # 현재 페이지 글만 읽는다
+            page_count = max(1, -(-filtered_count // POSTS_PER_PAGE))
+            page = st.number_input("페이지", min_value=1, max_value=page_count, value=1) if page_count > 1 else 1
+            posts = db.list_blog_post_meta(
+                category=filter_category, limit=POSTS_PER_PAGE, offset=(page - 1) * POSTS_PER_PAGE,
+            )
 
+        contents = db.get_blog_post_contents([p["post_id"] for p in posts])
         for post in posts:
-            with st.expander(f"📝 {post['title']} | {post['category']} ({len(post['content']):,}자)"):
+            content = contents.get(post["post_id"], "")
+            with st.expander(f"📝 {post['title']} | {post['category']} ({len(content):,}자)"):
                 # 메타 정보
                 meta_cols = st.columns([2, 2, 1, 1])
                 with meta_cols[0]:
                     st.caption(f"카테고리: {post['category']}")
                 with meta_cols[1]:
-                    st.caption(f"글자 수: {len(post['content']):,}자")
+                    st.caption(f"글자 수: {len(content):,}자")
                 with meta_cols[2]:
                     if post.get("link"):
                         st.markdown(f"[원문 보기]({post['link']})")
                 with meta_cols[3]:
                     if st.button("🗑️ 삭제", key=f"del_{post['post_id']}", type="secondary"):
-                        with db._get_conn() as conn:
-                            conn.execute("DELETE FROM blog_posts WHERE post_id = ?", (post["post_id"],))
+                        db.delete_blog_posts([post["post_id"]])
                         st.success(f"'{post['title'][:20]}...' 삭제됨")
                         st.rerun()
 
@@ -116,7 +169,7 @@ with tab_list:
                     new_category = st.text_input("카테고리", value=post["category"], key=f"cat_{post['post_id']}")
                     new_content = st.text_area(
                         "본문",
-                        value=post["content"],
+                        value=content,
                         height=300,
                         key=f"content_{post['post_id']}",
                     )
@@ -130,6 +183,7 @@ with tab_list:
                         content=new_content,
                         pub_date=post.get("pub_date", ""),
                         link=post.get("link", ""),
+                        blog_id=post["blog_id"],
                     )
                     st.success(f"'{new_title[:30]}' 수정 저장됨!")
                     st.rerun()
@@ -192,10 +246,8 @@ with tab_bulk:
 
     with col1:
         st.markdown("#### 카테고리별 현황")
-        for cat in categories:
-            cat_posts = db.list_blog_posts(category=cat)
-            cat_chars = sum(len(p["content"]) for p in cat_posts)
-            st.markdown(f"- **{cat}**: {len(cat_posts)}개 ({cat_chars:,}자)")
+        for cat, cat_stat in category_stats.items():
+            st.markdown(f"- **{cat}**: {cat_stat['post_count']}개 ({cat_stat['total_chars']:,}자)")
 
     with col2:
         st.markdown("#### 도구")
@@ -204,12 +256,7 @@ with tab_bulk:
         if categories:
             del_cat = st.selectbox("삭제할 카테고리", categories, key="bulk_del_cat")
             if st.button(f"🗑️ '{del_cat}' 카테고리 전체 삭제", type="secondary"):
-                with db._get_conn() as conn:
-                    cnt = conn.execute(
-                        "SELECT COUNT(*) as cnt FROM blog_posts WHERE category = ?",
-                        (del_cat,),
-                    ).fetchone()["cnt"]
-                    conn.execute("DELETE FROM blog_posts WHERE category = ?", (del_cat,))
+                cnt = db.delete_blog_posts_by_category(del_cat)
                 st.success(f"'{del_cat}' 카테고리 {cnt}개 글 삭제됨")
                 st.rerun()
 
@@ -218,5 +265,11 @@ with tab_bulk:
         # 크롤링 안내
         st.markdown("#### 블로그 재크롤링")
         st.caption("새 글이 추가되었거나 기존 글을 업데이트하려면 크롤링을 다시 실행하세요.")
-        st.code("python scripts/crawl_blog.py", language="bash")
-        st.caption("이미 저장된 글은 건너뛰고 새 글만 추가됩니다.")
+        if st.button("📥 백그라운드 크롤링 시작", disabled=job_is_active(get_crawl_progress(db))):
+            if start_background_crawl(db, full=True):
+                st.success("크롤링을 시작했습니다. 진행 상황은 페이지 상단에 표시됩니다.")
+            else:
+                st.info("이미 크롤링이 진행 중입니다.")
+        st.caption("또는 터미널에서 직접 실행:")
+        st.code("python scripts/crawl_blog.py --sources --force --full", language="bash")
+        st.caption("RSS 피드 전체를 다시 확인해 새 글과 삭제했던 글을 추가하고, 이미 저장된 글은 건너뜁니다.")
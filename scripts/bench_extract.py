@@ -0,0 +1,134 @@
+"""본문 추출 벤치마크: 정규식 기반(이전 구현) vs 단일 패스 이벤트 추출기.
+
+이전 구현은 SE 컨테이너 앞 200KB만 보므로, 그보다 큰 글에서는 같은 분량을 처리하도록
+제한을 없앤 정규식 구현과의 배율을 기준으로 본다 (200KB 제한 그대로의 시간도 함께 출력).
+
+Usage:
+    python scripts/bench_extract.py                 # 합성 SE 문서로 측정
+    python scripts/bench_extract.py page1.html ...  # 저장해 둔 PostView HTML로 측정
+"""
+from __future__ import annotations
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from naverblog.crawler import strip_html
+from naverblog.extractor import extract_post_content, normalize_text
+
+
+REGEX_REGION_LIMIT = 200000  # 이전 구현의 SE 영역 제한
+
+
+def extract_post_content_regex(html: str, region_limit: int | None = REGEX_REGION_LIMIT) -> str:
+    """이전 fetch_post_content의 추출 로직 (비교 기준). region_limit=None이면 제한 없이."""
+    start_marker = '<div class="se-main-container">'
+    start_idx = html.find(start_marker)
+    if start_idx >= 0:
+        end_idx = None if region_limit is None else start_idx + region_limit
+        region = html[start_idx:end_idx]
+        paragraphs = re.findall(
+            r'<p[^>]*class="[^"]*se-text-paragraph[^"]*"[^>]*>(.*?)</p>',
+            region, re.DOTALL,
+        )
+        if paragraphs:
+            texts = [strip_html(p) for p in paragraphs]
+            return "\n".join(t for t in texts if t.strip())
+
+        end_marker = "<!-- SE_DOC_FOOTER"
+        end_idx = region.find(end_marker)
+        if end_idx > 0:
+            content = region[:end_idx]
+        else:
+            content = region[:100000]
+        return strip_html(content)
+
+    m = re.search(
+        r'<div[^>]*id="postViewArea"[^>]*>(.*?)<!-- // -->',
+        html, re.DOTALL,
+    )
+    if m:
+        return strip_html(m.group(1))
+
+    m = re.search(r"<body[^>]*>(.*)</body>", html, re.DOTALL)
+    if m:
+        text = strip_html(m.group(1))
+        if len(text) > 200:
+            return text[:8000]
+
+    return ""
+
+
+def make_synthetic_post(paragraphs: int) -> str:
+    """실제 PostView와 비슷한 구조의 큰 SE 문서."""
+    head = (
+        "<html><head><script>var x = '<p>not content</p>';</script>"
+        "<style>.se-text-paragraph{color:red}</style></head><body>"
+        + '<div class="nav">' + "<a href='#'>메뉴</a>" * 200 + "</div>"
+    )
+    body = ['<div id="post-area"><div class="se-main-container">']
+    for i in range(paragraphs):
+        if i % 25 == 0:
+            body.append(
+                '<div class="se-component se-image"><img src="https://example.com/a.png"></div>'
+            )
+        body.append(
+            '<div class="se-component se-text"><div class="se-module se-module-text">'
+            f'<p class="se-text-paragraph se-text-paragraph-align-"><span class="se-fs-">'
+            f"{i}번째 문단입니다. 수능 국어 &amp; 수학 공부법을 <b>정리</b>했어요!</span></p>"
+            "</div></div>"
+        )
+    body.append("</div><!-- SE_DOC_FOOTER --></div>")
+    tail = '<div class="footer">' + "<span>푸터</span>" * 500 + "</div></body></html>"
+    return head + "".join(body) + tail
+
+
+def extract_post_content_regex_unlimited(html: str) -> str:
+    return extract_post_content_regex(html, region_limit=None)
+
+
+def bench(fn, html: str, repeat: int) -> float:
+    """repeat회 실행의 최솟값 (ms). 다른 프로세스 부하에 덜 흔들리게 평균 대신 최솟값."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(html)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="본문 추출 벤치마크")
+    parser.add_argument("files", nargs="*", help="PostView HTML 파일")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.files:
+        docs = [(Path(f).name, Path(f).read_text(encoding="utf-8", errors="replace")) for f in args.files]
+    else:
+        docs = [(f"synthetic-{n}p", make_synthetic_post(n)) for n in (50, 500, 3000)]
+
+    print(
+        f"{'문서':<20} {'크기':>9} {'regex(ms)':>10} {'제한없음(ms)':>12} {'parser(ms)':>11} "
+        f"{'배율':>6}  결과"
+    )
+    for name, html in docs:
+        capped_ms = bench(extract_post_content_regex, html, args.repeat)
+        old_ms = bench(extract_post_content_regex_unlimited, html, args.repeat)
+        new_ms = bench(extract_post_content, html, args.repeat)
+        old_text = extract_post_content_regex_unlimited(html)
+        new_text = extract_post_content(html)
+        # 이전 구현은 문단 안 인라인 태그마다 줄을 바꾸므로 공백을 무시하고 비교
+        same = re.sub(r"\s+", "", normalize_text(old_text)) == re.sub(r"\s+", "", new_text)
+        verdict = "일치" if same else f"다름 (이전 {len(old_text):,}자 / 새 {len(new_text):,}자)"
+        print(
+            f"{name:<20} {len(html) // 1024:>7}KB {capped_ms:>10.2f} {old_ms:>12.2f} "
+            f"{new_ms:>11.2f} {old_ms / new_ms if new_ms else 0:>5.1f}x  {verdict}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,179 @@
 """보보쌤 네이버 블로그 RSS 크롤링 → DB 저장.
 
 Usage:
-    python scripts/crawl_blog.py
+    python scripts/crawl_blog.py [--workers 4] [--rate 2.0] [--full] [--blog ID]
+    python scripts/crawl_blog.py --archive [--restart]   # RSS 범위 밖 과거 글 전체 수집
+    python scripts/crawl_blog.py --reextract [--jobs N]  # 캐시된 원본 HTML로 본문 재추출 (네트워크 없음)
+    python scripts/crawl_blog.py --refresh [--budget 50] # 저장된 글 재확인, 수정된 글만 갱신
+    python scripts/crawl_blog.py --sources [--force] [--full]  # 등록된 블로그 중 갱신 주기가 된 것 모두
+    python scripts/crawl_blog.py --add-source ID [--name 이름] [--priority 0] [--interval 60]
+    python scripts/crawl_blog.py --list-sources
 """
 from __future__ import annotations
 
+import argparse
 import sys
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from naverblog.crawler import crawl_blog
+from naverblog.crawler import (
+    BLOG_ID,
+    DEFAULT_CONCURRENCY,
+    DEFAULT_RATE_PER_HOST,
+    DEFAULT_REFRESH_BUDGET,
+    crawl_archive,
+    crawl_blog,
+    crawl_sources,
+    reextract,
+    refresh_posts,
+)
 from naverblog.database import Database
 
 
 def main():
+    parser = argparse.ArgumentParser(description="보보쌤 블로그 크롤링")
+    parser.add_argument(
+        "--workers", type=int, default=DEFAULT_CONCURRENCY,
+        help=f"동시 요청 수 (기본 {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=DEFAULT_RATE_PER_HOST,
+        help=f"호스트당 초당 요청 수 (기본 {DEFAULT_RATE_PER_HOST})",
+    )
+    parser.add_argument(
+        "--full", action="store_true",
+        help="저장된 RSS 상태(ETag/최신 pubDate)를 무시하고 피드 전체를 확인",
+    )
+    parser.add_argument(
+        "--archive", action="store_true",
+        help="글 목록을 페이지 단위로 훑어 전체 아카이브 수집 (중단 시 이어서 진행)",
+    )
+    parser.add_argument(
+        "--restart", action="store_true",
+        help="--archive와 함께 사용: 저장된 체크포인트를 무시하고 1페이지부터 다시 시작",
+    )
+    parser.add_argument(
+        "--reextract", action="store_true",
+        help="저장된 원본 HTML에서 본문을 다시 추출 (추출 로직 변경 후 사용)",
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=None,
+        help="--reextract 병렬 프로세스 수 (기본: CPU 코어 수)",
+    )
+    parser.add_argument(
+        "--refresh", action="store_true",
+        help="저장된 글을 최근 발행순 → 오래전 확인순으로 다시 가져와 수정된 글만 갱신",
+    )
+    parser.add_argument(
+        "--budget", type=int, default=DEFAULT_REFRESH_BUDGET,
+        help=f"--refresh 한 번에 보낼 최대 요청 수 (기본 {DEFAULT_REFRESH_BUDGET})",
+    )
+    parser.add_argument(
+        "--blog", default=BLOG_ID,
+        help=f"크롤링할 블로그 ID (기본 {BLOG_ID})",
+    )
+    parser.add_argument(
+        "--sources", action="store_true",
+        help="blog_sources에 등록된 블로그 중 갱신 주기가 된 것을 우선순위대로 함께 크롤링",
+    )
+    parser.add_argument(
+        "--force", action="store_true",
+        help="--sources와 함께 사용: 갱신 주기를 무시하고 등록된 블로그 전부",
+    )
+    parser.add_argument("--add-source", metavar="ID", help="크롤링 대상 블로그 등록/수정")
+    parser.add_argument("--name", default="", help="--add-source: 표시 이름")
+    parser.add_argument("--priority", type=int, default=0, help="--add-source: 우선순위 (클수록 먼저)")
+    parser.add_argument("--interval", type=int, default=60, help="--add-source: 갱신 주기(분)")
+    parser.add_argument("--list-sources", action="store_true", help="등록된 블로그 목록")
+    args = parser.parse_args()
+
     db = Database()
+
+    if args.add_source:
+        db.save_blog_source(
+            args.add_source, name=args.name, priority=args.priority,
+            refresh_interval_min=args.interval,
+        )
+        print(f"✅ 블로그 등록: {args.add_source}")
+        args.list_sources = True
+
+    if args.list_sources:
+        print(f"📚 등록된 블로그:")
+        for src in db.list_blog_sources():
+            state = "" if src["enabled"] else " (비활성)"
+            print(
+                f"  - {src['blog_id']} [{src['name']}] 우선순위 {src['priority']}, "
+                f"{src['refresh_interval_min']}분마다, 마지막 크롤링 {src['last_crawled_at'] or '-'}"
+                f"{state}, 저장된 글 {db.count_blog_posts(src['blog_id'])}개"
+            )
+        return
+
     print(f"📊 현재 DB에 저장된 포스트: {db.count_blog_posts()}개\n")
 
-    result = crawl_blog(db, progress_callback=lambda msg: print(f"  {msg}"))
+    progress = lambda msg: print(f"  {msg}")
+    if args.reextract:
+        result = reextract(db, workers=args.jobs, progress_callback=progress)
+        print(f"\n{'='*50}")
+        print(f"📊 재추출 결과:")
+        print(f"  ✅ 갱신: {result['updated']}개")
+        print(f"  ⏭️ 변경 없음: {result['unchanged']}개")
+        print(f"  ❌ 실패: {result['fail']}개")
+        return
+
+    if args.refresh:
+        result = refresh_posts(
+            db,
+            progress_callback=progress,
+            budget=args.budget,
+            max_workers=args.workers,
+            rate_per_host=args.rate,
+        )
+        print(f"\n{'='*50}")
+        print(f"📊 재확인 결과:")
+        print(f"  ✏️ 수정됨: {result['changed']}개")
+        print(f"  ⏭️ 변경 없음: {result['unchanged']}개")
+        print(f"  ❌ 실패: {result['fail']}개")
+        return
+
+    if args.sources:
+        results = crawl_sources(
+            db,
+            progress_callback=progress,
+            max_workers=args.workers,
+            rate_per_host=args.rate,
+            force=args.force,
+            full=args.full,
+        )
+        print(f"\n{'='*50}")
+        print(f"📊 블로그별 크롤링 결과:")
+        for blog_id, result in results.items():
+            error = f" (RSS 실패: {result['error']})" if "error" in result else ""
+            print(
+                f"  - {blog_id}: 성공 {result['success']}, 이미 저장됨 {result['skip']}, "
+                f"실패 {result['fail']}{error}"
+            )
+        print(f"  📦 총 DB 포스트: {db.count_blog_posts()}개")
+        return
+
+    if args.archive:
+        result = crawl_archive(
+            db,
+            progress_callback=progress,
+            max_workers=args.workers,
+            rate_per_host=args.rate,
+            restart=args.restart,
+            blog_id=args.blog,
+        )
+    else:
+        result = crawl_blog(
+            db,
+            progress_callback=progress,
+            max_workers=args.workers,
+            rate_per_host=args.rate,
+            full=args.full,
+            blog_id=args.blog,
+        )
 
     print(f"\n{'='*50}")
     print(f"📊 크롤링 결과:")
@@ -28,9 +183,8 @@ def main():
     print(f"  📦 총 DB 포스트: {db.count_blog_posts()}개")
 
     print(f"\n📂 카테고리별 저장된 글 수:")
-    for cat in db.get_blog_post_categories():
-        posts_in_cat = db.list_blog_posts(category=cat)
-        print(f"  - {cat}: {len(posts_in_cat)}개")
+    for cat in db.get_corpus_stats()["categories"]:
+        print(f"  - {cat['category']}: {cat['post_count']}개 ({cat['total_chars']:,}자)")
 
 
 if __name__ == "__main__":
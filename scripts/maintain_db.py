@@ -0,0 +1,98 @@
+"""naverblog.db 유지보수: 백업, 오래된 생성 기록 보관, 증분 VACUUM.
+
+Usage:
+    python scripts/maintain_db.py                     # 보관(180일) → 정리 → VACUUM → 백업
+    python scripts/maintain_db.py --stats             # DB 파일 크기만 출력
+    python scripts/maintain_db.py --backup [--keep 5] # 백업만
+    python scripts/maintain_db.py --archive [--days 180]
+    python scripts/maintain_db.py --vacuum [--enable-vacuum]
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from naverblog.config import BACKUP_KEEP, GENERATION_RETENTION_DAYS
+from naverblog.database import Database
+from naverblog.maintenance import (
+    archive_generations,
+    backup_database,
+    compact_database,
+    run_maintenance,
+)
+
+
+def _mb(n: int) -> str:
+    return f"{n / 1024 / 1024:.1f}MB"
+
+
+def print_stats(db: Database) -> None:
+    stats = db.file_stats()
+    mode = {0: "꺼짐", 1: "FULL", 2: "INCREMENTAL"}.get(stats["auto_vacuum"], "?")
+    print(
+        f"📦 DB {_mb(stats['size_bytes'])} (빈 공간 {_mb(stats['free_bytes'])}, "
+        f"WAL {_mb(stats['wal_bytes'])}, auto_vacuum {mode})"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="naverblog DB 유지보수")
+    parser.add_argument("--stats", action="store_true", help="DB 파일 크기만 출력")
+    parser.add_argument("--backup", action="store_true", help="온라인 백업만 실행")
+    parser.add_argument("--archive", action="store_true", help="오래된 생성 기록 보관만 실행")
+    parser.add_argument("--vacuum", action="store_true", help="증분 VACUUM만 실행")
+    parser.add_argument(
+        "--days", type=int, default=GENERATION_RETENTION_DAYS,
+        help=f"이 일수보다 오래된 생성 기록을 보관 (기본 {GENERATION_RETENTION_DAYS})",
+    )
+    parser.add_argument(
+        "--keep", type=int, default=BACKUP_KEEP,
+        help=f"남길 최근 백업 수 (기본 {BACKUP_KEEP})",
+    )
+    parser.add_argument(
+        "--enable-vacuum", action="store_true",
+        help="auto_vacuum이 꺼진 기존 DB를 INCREMENTAL로 전환 (전체 VACUUM 한 번)",
+    )
+    args = parser.parse_args()
+
+    db = Database()
+    print_stats(db)
+    if args.stats:
+        return
+
+    progress = lambda msg: print(f"  {msg}")
+    start = time.perf_counter()
+
+    if not (args.backup or args.archive or args.vacuum):
+        if args.enable_vacuum:
+            compact_database(db, enable=True, progress_callback=progress)
+        result = run_maintenance(
+            db, retention_days=args.days, keep_backups=args.keep, progress_callback=progress,
+        )
+        print(f"\n{'='*50}")
+        print(f"🗄️ 보관: {result['archived']}개 → {result['path'] or '-'}")
+        print(f"🧹 정리된 blob: {result['pruned_blobs']}개")
+        print(f"📉 VACUUM으로 줄어든 크기: {_mb(result['reclaimed_bytes'])}")
+        print(f"💾 백업: {result['backup']}")
+    else:
+        if args.archive:
+            result = archive_generations(db, args.days, progress_callback=progress)
+            print(f"🗄️ 보관: {result['archived']}개 → {result['path'] or '-'}")
+            print(f"🧹 정리된 blob: {result['pruned_blobs']}개")
+        if args.vacuum:
+            reclaimed = compact_database(db, enable=args.enable_vacuum, progress_callback=progress)
+            print(f"📉 VACUUM으로 줄어든 크기: {_mb(reclaimed)}")
+        if args.backup:
+            path = backup_database(db, keep=args.keep, progress_callback=progress)
+            print(f"💾 백업: {path}")
+
+    print(f"⏱️ {time.perf_counter() - start:.1f}초")
+    print_stats(db)
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,13 @@ from pathlib import Path
 
 APP_DIR = Path.home() / ".naverblog"
 DB_PATH = APP_DIR / "naverblog.db"
+DEFAULT_BLOG_ID = "byhur99"  # blog_sources가 비어 있을 때 시드하는 기본 블로그
+HTML_CACHE_DIR = APP_DIR / "html_cache"
+HTML_CACHE_MAX_BYTES = 512 * 1024 * 1024  # 압축 후 기준
+BACKUP_DIR = APP_DIR / "backups"
+BACKUP_KEEP = 5  # 보관할 최근 백업 수
+ARCHIVE_DIR = APP_DIR / "archive"  # 오래된 생성 기록 (gzip JSONL)
+GENERATION_RETENTION_DAYS = 180
 PRESETS_DIR = Path(__file__).resolve().parent.parent.parent / "data" / "presets"
 
 REQUIRED_ENV_VARS = {
@@ -0,0 +1,107 @@
+"""백그라운드 크롤링 워커.
+
+Streamlit은 세션마다 스크립트를 다시 실행하므로, 크롤링은 프로세스당 한 번만
+데몬 스레드로 시작하고 진행 상황은 crawl_jobs 테이블에 기록한다.
+화면(app.py, 레퍼런스 글 관리 페이지)은 get_crawl_progress로 상태를 읽어 보여준다.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+
+from naverblog.crawler import crawl_sources
+from naverblog.database import Database
+
+# 진행 메시지를 DB에 쓰는 최소 간격(초) - 글마다 쓰지 않도록
+PROGRESS_WRITE_INTERVAL = 0.5
+# running 상태인데 이 시간 동안 갱신이 없으면 (프로세스가 죽은 것으로 보고) 새로 시작
+STALE_JOB_SECONDS = 10 * 60
+
+_lock = threading.Lock()
+_thread: threading.Thread | None = None
+_startup_checked = False
+
+
+def is_crawl_running() -> bool:
+    """이 프로세스에서 백그라운드 크롤링이 진행 중인지."""
+    return _thread is not None and _thread.is_alive()
+
+
+def job_is_active(job: dict | None) -> bool:
+    """running이면서 최근에 갱신된 작업인지 (죽은 프로세스가 남긴 running은 제외)."""
+    if not job or job["status"] != "running":
+        return False
+    try:
+        updated = datetime.fromisoformat(job["updated_at"]).replace(tzinfo=timezone.utc)
+    except (TypeError, ValueError):
+        return False
+    return (datetime.now(timezone.utc) - updated).total_seconds() < STALE_JOB_SECONDS
+
+
+def start_background_crawl(db: Database, force: bool = True, full: bool = False) -> bool:
+    """백그라운드 크롤링 시작. 이미 진행 중이면 아무것도 하지 않고 False.
+
+    force=True면 blog_sources의 갱신 주기와 관계없이 등록된 블로그를 모두 확인하고,
+    full=True면 저장된 RSS 상태(ETag/최신 pubDate)를 무시하고 피드 전체를 확인한다.
+    """
+    global _thread
+    with _lock:
+        if is_crawl_running() or job_is_active(db.get_latest_crawl_job()):
+            return False
+        job_id = db.create_crawl_job()
+        _thread = threading.Thread(
+            target=_run, args=(db, job_id, force, full), name="naverblog-crawl", daemon=True,
+        )
+        _thread.start()
+    return True
+
+
+def start_crawl_if_empty(db: Database) -> bool:
+    """DB에 글이 없으면 백그라운드 크롤링 시작 (프로세스당 한 번만 확인).
+
+    수집이 실패해도 화면이 다시 그려질 때마다 재시도하지 않도록, 재시도는
+    레퍼런스 글 관리 페이지에서 직접 시작한다.
+    """
+    global _startup_checked
+    with _lock:
+        if _startup_checked:
+            return False
+        _startup_checked = True
+    if db.count_blog_posts() > 0:
+        return False
+    return start_background_crawl(db, full=True)
+
+
+def _run(db: Database, job_id: int, force: bool, full: bool) -> None:
+    last_write = 0.0
+    write_lock = threading.Lock()
+
+    def progress(msg: str):
+        nonlocal last_write
+        with write_lock:
+            now = time.monotonic()
+            if now - last_write < PROGRESS_WRITE_INTERVAL:
+                return
+            last_write = now
+        db.update_crawl_job(job_id, msg)
+
+    try:
+        results = crawl_sources(db, progress_callback=progress, force=force, full=full)
+    except Exception as e:
+        db.finish_crawl_job(job_id, error=str(e))
+        return
+
+    totals = {
+        key: sum(r[key] for r in results.values()) for key in ("success", "skip", "fail")
+    }
+    errors = [f"{blog_id}: {r['error']}" for blog_id, r in results.items() if "error" in r]
+    # 일부 블로그만 실패했으면 완료로 두고, 모두 실패했을 때만 실패로 기록
+    error = "; ".join(errors) if errors and len(errors) == len(results) else None
+    db.finish_crawl_job(job_id, error=error, **totals)
+
+
+def get_crawl_progress(db: Database) -> dict | None:
+    """가장 최근 크롤링 작업 상태 (없으면 None). running인지는 status로 확인."""
+    return db.get_latest_crawl_job()
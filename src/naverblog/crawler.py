@@ -1,55 +1,159 @@
-"""보보쌤 네이버 블로그 RSS 크롤링 모듈.
+"""네이버 블로그 RSS 크롤링 모듈 (기본: 보보쌤 byhur99).
 
 app.py 시작 시 DB가 비어있으면 자동 실행됩니다.
+여러 블로그는 blog_sources 테이블에 등록해 두고 crawl_sources로 함께 갱신합니다.
+RSS에 없는 과거 글은 crawl_archive로 전체 글 목록을 훑어 수집합니다.
+추출 로직을 바꾼 뒤에는 reextract로 저장해 둔 원본 HTML에서 본문을 다시 만듭니다.
 """
 from __future__ import annotations
 
+import heapq
+import itertools
+import json
+import os
 import re
+import threading
 import time
 import xml.etree.ElementTree as ET
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from html import unescape
-from urllib.request import Request, urlopen
+from pathlib import Path
+from urllib.parse import unquote_plus, urlsplit
 
-from naverblog.database import Database
+from naverblog.config import DEFAULT_BLOG_ID
+from naverblog.database import Database, content_hash, pub_date_to_ts
+from naverblog.extractor import extract_post_content
+from naverblog.html_cache import HtmlCache, read_html
+from naverblog.http_session import HTTPError, HTTPResponse, get_session
 
-BLOG_ID = "byhur99"
-RSS_URL = f"https://rss.blog.naver.com/{BLOG_ID}.xml"
+BLOG_ID = DEFAULT_BLOG_ID
+RSS_URL = "https://rss.blog.naver.com/{blog_id}.xml"
 POST_VIEW_URL = "https://blog.naver.com/PostView.naver?blogId={blog_id}&logNo={post_id}&directAccess=false"
 
+# 동시 크롤링 기본값 (crawl_blog 인자로 덮어쓸 수 있음)
+DEFAULT_CONCURRENCY = 4
+DEFAULT_RATE_PER_HOST = 2.0  # 호스트당 초당 요청 수
+DEFAULT_BURST = 2
+INGEST_BATCH_SIZE = 20  # 이만큼 모이면 한 트랜잭션으로 저장
 
-def fetch_url(url: str) -> str:
-    req = Request(url, headers={
-        "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                      "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-    })
-    with urlopen(req, timeout=15) as resp:
-        return resp.read().decode("utf-8", errors="replace")
 
+class TokenBucket:
+    """토큰 버킷 - 초당 rate개씩 토큰을 채우고, 최대 burst개까지 모아둔다."""
 
-def parse_rss(xml_text: str) -> list[dict]:
-    root = ET.fromstring(xml_text)
-    posts = []
-    for item in root.findall(".//item"):
-        title = item.findtext("title", "").strip()
-        link = item.findtext("link", "").strip()
-        desc = item.findtext("description", "").strip()
-        pub_date = item.findtext("pubDate", "").strip()
-        category = item.findtext("category", "").strip()
-
-        post_id = ""
-        if link:
-            m = re.search(r"/(\d{10,})", link)
-            if m:
-                post_id = m.group(1)
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
 
-        posts.append({
-            "post_id": post_id,
-            "title": unescape(title),
-            "category": unescape(category),
-            "link": link,
-            "description": unescape(desc),
-            "pub_date": pub_date,
-        })
+    def acquire(self) -> None:
+        """토큰 하나를 얻을 때까지 대기."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class HostRateLimiter:
+    """호스트별 토큰 버킷 모음 (예의상 요청 간격 유지)."""
+
+    def __init__(self, rate: float = DEFAULT_RATE_PER_HOST, burst: int = DEFAULT_BURST):
+        self.rate = rate
+        self.burst = burst
+        self._buckets: dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, url: str) -> None:
+        host = urlsplit(url).netloc
+        with self._lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                bucket = self._buckets[host] = TokenBucket(self.rate, self.burst)
+        bucket.acquire()
+
+
+def fetch_url(url: str, limiter: HostRateLimiter | None = None) -> str:
+    """URL 본문을 문자열로 반환. 공용 keep-alive 세션을 사용한다."""
+    if limiter:
+        limiter.acquire(url)
+    resp = get_session().get(url)
+    if resp.status >= 400:
+        raise HTTPError(resp.status, url)
+    return resp.text()
+
+
+def fetch_rss(
+    url: str, state: dict | None = None, limiter: HostRateLimiter | None = None,
+) -> HTTPResponse:
+    """RSS 조건부 GET. state에 ETag/Last-Modified가 있으면 304가 올 수 있다."""
+    headers = {}
+    if state:
+        if state.get("etag"):
+            headers["If-None-Match"] = state["etag"]
+        if state.get("last_modified"):
+            headers["If-Modified-Since"] = state["last_modified"]
+    if limiter:
+        limiter.acquire(url)
+    resp = get_session().get(url, headers=headers)
+    if resp.status >= 400:
+        raise HTTPError(resp.status, url)
+    return resp
+
+
+def _parse_rss_item(item: ET.Element) -> dict:
+    title = item.findtext("title", "").strip()
+    link = item.findtext("link", "").strip()
+    desc = item.findtext("description", "").strip()
+    pub_date = item.findtext("pubDate", "").strip()
+    category = item.findtext("category", "").strip()
+
+    post_id = ""
+    if link:
+        m = re.search(r"/(\d{10,})", link)
+        if m:
+            post_id = m.group(1)
+
+    return {
+        "post_id": post_id,
+        "title": unescape(title),
+        "category": unescape(category),
+        "link": link,
+        "description": unescape(desc),
+        "pub_date": pub_date,
+    }
+
+
+def parse_rss(xml_text: str, since_ts: int = 0) -> list[dict]:
+    """RSS item 목록 파싱.
+
+    since_ts가 주어지면 pubDate가 그 시각 이하인 첫 item에서 파싱을 멈춘다
+    (RSS는 최신 글부터 나열되므로 이후 item은 이미 본 글).
+    """
+    parser = ET.XMLPullParser(events=("end",))
+    posts = []
+    chunk_size = 16384
+    for offset in range(0, len(xml_text), chunk_size):
+        parser.feed(xml_text[offset:offset + chunk_size])
+        for _event, elem in parser.read_events():
+            if elem.tag != "item":
+                continue
+            post = _parse_rss_item(elem)
+            elem.clear()
+            if since_ts and 0 < pub_date_to_ts(post["pub_date"]) <= since_ts:
+                return posts
+            posts.append(post)
+    parser.close()
     return posts
 
 
@@ -62,107 +166,651 @@ def strip_html(html: str) -> str:
     return text.strip()
 
 
-def fetch_post_content(blog_id: str, post_id: str) -> str:
+def fetch_post_page(
+    blog_id: str, post_id: str, limiter: HostRateLimiter | None = None,
+) -> str:
+    """PostView HTML 원문. 실패 시 빈 문자열."""
     url = POST_VIEW_URL.format(blog_id=blog_id, post_id=post_id)
     try:
-        html = fetch_url(url)
+        return fetch_url(url, limiter)
     except Exception:
         return ""
 
-    start_marker = '<div class="se-main-container">'
-    start_idx = html.find(start_marker)
-    if start_idx >= 0:
-        region = html[start_idx:start_idx + 200000]
-        paragraphs = re.findall(
-            r'<p[^>]*class="[^"]*se-text-paragraph[^"]*"[^>]*>(.*?)</p>',
-            region, re.DOTALL,
-        )
-        if paragraphs:
-            texts = [strip_html(p) for p in paragraphs]
-            return "\n".join(t for t in texts if t.strip())
-
-        end_marker = "<!-- SE_DOC_FOOTER"
-        end_idx = region.find(end_marker)
-        if end_idx > 0:
-            content = region[:end_idx]
-        else:
-            content = region[:100000]
-        return strip_html(content)
 
-    m = re.search(
-        r'<div[^>]*id="postViewArea"[^>]*>(.*?)<!-- // -->',
-        html, re.DOTALL,
-    )
-    if m:
-        return strip_html(m.group(1))
+_CATEGORY_RE = re.compile(
+    r'class="blog2_series".{0,2000}?<a[^>]*class="pcol2"[^>]*>(.*?)</a>', re.DOTALL,
+)
 
-    m = re.search(r"<body[^>]*>(.*)</body>", html, re.DOTALL)
-    if m:
-        text = strip_html(m.group(1))
-        if len(text) > 200:
-            return text[:8000]
 
-    return ""
+def extract_category(html: str) -> str:
+    """PostView HTML 상단 카테고리 링크에서 카테고리명 추출 (없으면 빈 문자열)."""
+    m = _CATEGORY_RE.search(html)
+    if not m:
+        return ""
+    return unescape(re.sub(r"<[^>]+>", "", m.group(1))).strip()
 
 
-def crawl_blog(db: Database, progress_callback=None) -> dict:
-    """블로그 크롤링 실행. progress_callback(message)로 진행 상황 전달."""
-    def log(msg: str):
-        if progress_callback:
-            progress_callback(msg)
+def fetch_post_content(
+    blog_id: str, post_id: str, limiter: HostRateLimiter | None = None,
+) -> str:
+    html = fetch_post_page(blog_id, post_id, limiter)
+    if not html:
+        return ""
+    return extract_post_content(html)
 
-    log("RSS 피드 가져오는 중...")
-    try:
-        rss_xml = fetch_url(RSS_URL)
-    except Exception as e:
-        log(f"RSS 가져오기 실패: {e}")
-        return {"success": 0, "skip": 0, "fail": 0}
 
-    posts = parse_rss(rss_xml)
-    log(f"RSS에서 {len(posts)}개 포스트 발견")
+def _fetch_post(
+    blog_id: str, post_id: str, limiter: HostRateLimiter | None, html_cache: HtmlCache | None,
+) -> dict:
+    """워커 스레드에서 실행: 본문과 (RSS에 없을 때 쓸) 카테고리 추출."""
+    html = fetch_post_page(blog_id, post_id, limiter)
+    if not html:
+        return {"content": "", "category": ""}
+    if html_cache:
+        try:
+            html_cache.put(post_id, html)
+        except OSError:
+            pass
+    return {"content": extract_post_content(html), "category": extract_category(html)}
 
+
+def _crawl_posts(
+    db: Database,
+    posts: list[dict],
+    blog_id: str,
+    executor: Executor,
+    limiter: HostRateLimiter,
+    log,
+    html_cache: HtmlCache | None = None,
+) -> dict:
+    """RSS/아카이브 공용 수집 루프.
+
+    이미 저장된 글은 쿼리 한 번으로 걸러내고, 나머지 글의 본문을 executor로 동시에 가져온다.
+    진행 메시지는 호출 스레드에서 posts 순서대로 처리하고, 수집한 글은
+    INGEST_BATCH_SIZE개씩 모아 한 트랜잭션으로 저장한다.
+    실패한 글의 pubDate(epoch)를 failed_ts로 함께 반환한다.
+    """
     success = 0
     skip = 0
     fail = 0
+    failed_ts: list[int] = []
 
+    existing = db.existing_blog_post_ids([p["post_id"] for p in posts])
+    futures = {}
+    for post in posts:
+        post_id = post["post_id"]
+        if post_id and post_id not in futures and post_id not in existing:
+            futures[post_id] = executor.submit(
+                _fetch_post, blog_id, post_id, limiter, html_cache,
+            )
+
+    batch: list[dict] = []
     for i, post in enumerate(posts, 1):
         post_id = post["post_id"]
         if not post_id:
             fail += 1
             continue
 
-        if db.get_blog_post(post_id):
+        if post_id not in futures:
             skip += 1
             continue
 
         log(f"[{i}/{len(posts)}] 크롤링: {post['title'][:30]}...")
 
-        content = fetch_post_content(BLOG_ID, post_id)
+        fetched = futures.pop(post_id).result()
+        content = fetched["content"]
+        if not (content and len(content) >= 50):
+            content = post["description"] if len(post["description"]) > 20 else ""
 
-        if content and len(content) >= 50:
-            db.save_blog_post(
-                post_id=post_id,
-                title=post["title"],
-                category=post["category"],
-                content=content,
-                pub_date=post["pub_date"],
-                link=post["link"],
-            )
-            success += 1
-        elif post["description"] and len(post["description"]) > 20:
-            db.save_blog_post(
-                post_id=post_id,
-                title=post["title"],
-                category=post["category"],
-                content=post["description"],
-                pub_date=post["pub_date"],
-                link=post["link"],
-            )
+        if content:
+            batch.append({
+                "post_id": post_id,
+                "title": post["title"],
+                "category": post["category"] or fetched["category"],
+                "content": content,
+                "pub_date": post["pub_date"],
+                "link": post["link"],
+                "blog_id": blog_id,
+            })
             success += 1
+            if len(batch) >= INGEST_BATCH_SIZE:
+                db.save_blog_posts(batch)
+                batch = []
         else:
             fail += 1
+            failed_ts.append(pub_date_to_ts(post["pub_date"]))
 
-        time.sleep(0.5)
+    db.save_blog_posts(batch)
+    return {"success": success, "skip": skip, "fail": fail, "failed_ts": failed_ts}
 
+
+def crawl_blog(
+    db: Database,
+    progress_callback=None,
+    max_workers: int = DEFAULT_CONCURRENCY,
+    rate_per_host: float = DEFAULT_RATE_PER_HOST,
+    full: bool = False,
+    html_cache: HtmlCache | None = None,
+    blog_id: str = BLOG_ID,
+    executor: Executor | None = None,
+    limiter: HostRateLimiter | None = None,
+) -> dict:
+    """블로그 크롤링 실행. progress_callback(message)로 진행 상황 전달.
+
+    본문 수집은 max_workers개 스레드로 동시에 진행하고, 요청 간격은
+    호스트별 토큰 버킷(rate_per_host 요청/초)으로 제한한다.
+    진행 메시지와 DB 저장은 호출 스레드에서 RSS 순서대로 처리한다.
+
+    crawl_state에 저장된 ETag/Last-Modified로 조건부 요청을 보내고(304면 즉시 종료),
+    마지막으로 본 pubDate 이후의 item만 파싱한다. full=True면 상태를 무시한다.
+    저장된 글이 없거나 상태를 저장할 때보다 적으면(글을 지웠으면) 지운 글을 다시
+    받을 수 있도록 상태를 무시한다.
+
+    가져온 원본 HTML은 html_cache(기본: APP_DIR/html_cache)에 저장되어 reextract에 쓰인다.
+
+    executor/limiter를 넘기면 (crawl_sources처럼) 여러 블로그가 동시 요청 수와
+    호스트별 속도 제한을 함께 쓴다. RSS를 가져오지 못하면 결과에 error가 들어간다.
+    """
+    def log(msg: str):
+        if progress_callback:
+            progress_callback(msg)
+
+    limiter = limiter or HostRateLimiter(rate_per_host)
+
+    state = None if full else db.get_crawl_state(blog_id)
+    if state is not None:
+        stored = db.count_blog_posts(blog_id=blog_id)
+        if stored == 0 or stored < state["post_count"]:
+            log(f"저장된 글이 {state['post_count']}개에서 {stored}개로 줄어 RSS 전체를 확인합니다")
+            state = None
+
+    log("RSS 피드 가져오는 중...")
+    try:
+        resp = fetch_rss(RSS_URL.format(blog_id=blog_id), state, limiter)
+    except Exception as e:
+        log(f"RSS 가져오기 실패: {e}")
+        return {"success": 0, "skip": 0, "fail": 0, "error": str(e)}
+
+    if resp.status == 304:
+        log("RSS 변경 없음 (304)")
+        return {"success": 0, "skip": 0, "fail": 0}
+
+    since_ts = state["newest_pub_ts"] if state else 0
+    posts = parse_rss(resp.text(), since_ts=since_ts)
+    log(f"RSS에서 {len(posts)}개 포스트 발견")
+
+    html_cache = html_cache or HtmlCache()
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as own_executor:
+            result = _crawl_posts(db, posts, blog_id, own_executor, limiter, log, html_cache)
+    else:
+        result = _crawl_posts(db, posts, blog_id, executor, limiter, log, html_cache)
+
+    _save_rss_state(db, blog_id, state, resp, posts, result["failed_ts"])
+
+    success, skip, fail = result["success"], result["skip"], result["fail"]
     log(f"완료! 성공: {success}, 스킵: {skip}, 실패: {fail}")
     return {"success": success, "skip": skip, "fail": fail}
+
+
+def _save_rss_state(
+    db: Database, blog_id: str, state: dict | None, resp: HTTPResponse,
+    posts: list[dict], failed_ts: list[int],
+) -> None:
+    """다음 증분 갱신을 위한 crawl_state 저장.
+
+    실패한 글이 있으면 그 글이 다시 파싱되도록 워터마크를 실패한 글 직전까지만 올리고,
+    ETag/Last-Modified도 갱신하지 않는다 (다음 요청이 304로 끝나지 않도록).
+    """
+    prev_ts = state["newest_pub_ts"] if state else 0
+    newest = max((pub_date_to_ts(p["pub_date"]) for p in posts), default=0)
+    failed = [ts for ts in failed_ts if ts > 0]
+    if failed_ts:
+        watermark = max(prev_ts, min(failed) - 1) if failed else prev_ts
+        etag = state["etag"] if state else None
+        last_modified = state["last_modified"] if state else None
+    else:
+        watermark = max(prev_ts, newest)
+        etag = resp.headers.get("etag")
+        last_modified = resp.headers.get("last-modified")
+    db.save_crawl_state(
+        blog_id, etag, last_modified, watermark, db.count_blog_posts(blog_id=blog_id),
+    )
+
+
+# ──────────────────────────────────────────────
+# 전체 아카이브 크롤링 (RSS 범위 밖의 과거 글)
+# ──────────────────────────────────────────────
+POST_LIST_URL = (
+    "https://blog.naver.com/PostTitleListAsync.naver?blogId={blog_id}&viewdate="
+    "&currentPage={page}&categoryNo=0&parentCategoryNo=&countPerPage={per_page}"
+)
+POST_LINK_URL = "https://blog.naver.com/{blog_id}/{post_id}"
+ARCHIVE_PAGE_SIZE = 30
+
+_KST = timezone(timedelta(hours=9))
+
+
+def _add_date_to_pub_date(add_date: str) -> str:
+    """글 목록의 addDate("2024. 1. 2." 또는 "3시간 전")를 RFC-822 문자열로 변환."""
+    now = datetime.now(_KST)
+    m = re.match(r"\s*(\d{4})\.\s*(\d{1,2})\.\s*(\d{1,2})", add_date or "")
+    if m:
+        dt = datetime(int(m.group(1)), int(m.group(2)), int(m.group(3)), tzinfo=_KST)
+    else:
+        m = re.match(r"\s*(\d+)\s*(분|시간)\s*전", add_date or "")
+        if m:
+            unit = timedelta(minutes=1) if m.group(2) == "분" else timedelta(hours=1)
+            dt = now - int(m.group(1)) * unit
+        else:
+            dt = now
+    return format_datetime(dt)
+
+
+def parse_post_list(text: str, blog_id: str) -> tuple[list[dict], int]:
+    """PostTitleListAsync 응답 → (posts, 전체 글 수).
+
+    네이버 응답은 JSON에 허용되지 않는 \\' 이스케이프를 포함하므로 먼저 정리한다.
+    제목은 URL 인코딩되어 있다.
+    """
+    data = json.loads(text.replace("\\'", "'"), strict=False)
+    posts = []
+    for item in data.get("postList", []):
+        post_id = str(item.get("logNo", ""))
+        posts.append({
+            "post_id": post_id,
+            "title": unescape(unquote_plus(item.get("title", ""))).strip(),
+            "category": "",
+            "link": POST_LINK_URL.format(blog_id=blog_id, post_id=post_id) if post_id else "",
+            "description": "",
+            "pub_date": _add_date_to_pub_date(item.get("addDate", "")),
+        })
+    try:
+        total = int(data.get("totalCount", 0))
+    except (TypeError, ValueError):
+        total = 0
+    return posts, total
+
+
+def fetch_post_list(
+    blog_id: str, page: int, limiter: HostRateLimiter | None = None,
+    per_page: int = ARCHIVE_PAGE_SIZE,
+) -> tuple[list[dict], int]:
+    url = POST_LIST_URL.format(blog_id=blog_id, page=page, per_page=per_page)
+    return parse_post_list(fetch_url(url, limiter), blog_id)
+
+
+def crawl_archive(
+    db: Database,
+    progress_callback=None,
+    max_workers: int = DEFAULT_CONCURRENCY,
+    rate_per_host: float = DEFAULT_RATE_PER_HOST,
+    restart: bool = False,
+    max_pages: int | None = None,
+    html_cache: HtmlCache | None = None,
+    blog_id: str = BLOG_ID,
+) -> dict:
+    """블로그 전체 글 목록을 페이지 단위로 훑어 과거 글까지 수집.
+
+    페이지 하나를 처리할 때마다 archive_checkpoints에 다음 페이지를 기록하므로,
+    중단되더라도 다시 호출하면 이어서 진행한다. restart=True면 1페이지부터 다시 시작.
+    본문 수집/속도 제한/원본 HTML 저장은 crawl_blog와 같은 경로(_crawl_posts)를 사용한다.
+    """
+    def log(msg: str):
+        if progress_callback:
+            progress_callback(msg)
+
+    checkpoint = None if restart else db.get_archive_checkpoint(blog_id)
+    if checkpoint and checkpoint["done"]:
+        log("아카이브 크롤링이 이미 완료되었습니다. (처음부터 다시 하려면 restart)")
+        return {"success": 0, "skip": 0, "fail": 0}
+
+    page = checkpoint["next_page"] if checkpoint else 1
+    total_count = checkpoint["total_count"] if checkpoint else 0
+    limiter = HostRateLimiter(rate_per_host)
+    html_cache = html_cache or HtmlCache()
+
+    success = 0
+    skip = 0
+    fail = 0
+    pages_done = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        while max_pages is None or pages_done < max_pages:
+            try:
+                posts, total_count = fetch_post_list(blog_id, page, limiter)
+            except Exception as e:
+                log(f"글 목록 {page}페이지 가져오기 실패: {e} (다음 실행 시 이어서 진행)")
+                break
+
+            if not posts:
+                db.save_archive_checkpoint(blog_id, page, total_count, done=True)
+                break
+
+            total_pages = max(1, -(-total_count // ARCHIVE_PAGE_SIZE))
+            log(f"글 목록 {page}/{total_pages}페이지: {len(posts)}개")
+
+            result = _crawl_posts(db, posts, blog_id, executor, limiter, log, html_cache)
+            success += result["success"]
+            skip += result["skip"]
+            fail += result["fail"]
+            pages_done += 1
+
+            done = page >= total_pages
+            page += 1
+            db.save_archive_checkpoint(blog_id, page, total_count, done=done)
+            if done:
+                break
+
+    log(f"완료! 성공: {success}, 스킵: {skip}, 실패: {fail}")
+    return {"success": success, "skip": skip, "fail": fail}
+
+
+# ──────────────────────────────────────────────
+# 재추출 (네트워크 없이 캐시된 원본 HTML에서 본문 재생성)
+# ──────────────────────────────────────────────
+def _reextract_one(item: tuple[str, str]) -> tuple[str, str, str]:
+    """프로세스 풀 워커: (post_id, 캐시 파일 경로) → (post_id, 본문, 카테고리)."""
+    post_id, path = item
+    try:
+        html = read_html(Path(path))
+    except (OSError, ValueError):
+        return post_id, "", ""
+    return post_id, extract_post_content(html), extract_category(html)
+
+
+def reextract(
+    db: Database,
+    html_cache: HtmlCache | None = None,
+    workers: int | None = None,
+    progress_callback=None,
+) -> dict:
+    """캐시된 원본 HTML로 blog_posts.content를 다시 만든다 (CPU 코어 수만큼 병렬).
+
+    추출 결과가 50자 미만이면 기존 본문을 유지한다. 카테고리는 비어 있을 때만 채운다.
+    """
+    def log(msg: str):
+        if progress_callback:
+            progress_callback(msg)
+
+    html_cache = html_cache or HtmlCache()
+    # 본문은 해시로 비교하므로 읽지 않는다
+    existing = {p["post_id"]: p for p in db.list_blog_post_verify_info()}
+    items = []
+    for post_id in html_cache.post_ids():
+        if post_id not in existing:
+            continue
+        path = html_cache.path(post_id)
+        if path:
+            items.append((post_id, str(path)))
+    log(f"캐시된 원본 HTML {len(items)}개 재추출 중...")
+
+    updates = []
+    unchanged = 0
+    fail = 0
+    workers = workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        chunksize = max(1, len(items) // (workers * 4))
+        for post_id, content, category in executor.map(_reextract_one, items, chunksize=chunksize):
+            post = existing[post_id]
+            if not content or len(content) < 50:
+                fail += 1
+            elif content_hash(content) == post["content_hash"] and (post["category"] or not category):
+                unchanged += 1
+            else:
+                updates.append((post_id, content, post["category"] or category))
+
+    db.update_blog_post_contents(updates)
+    log(f"완료! 갱신: {len(updates)}, 변경 없음: {unchanged}, 실패: {fail}")
+    return {"updated": len(updates), "unchanged": unchanged, "fail": fail}
+
+
+# ──────────────────────────────────────────────
+# 수정 감지 (이미 저장된 글 재확인)
+# ──────────────────────────────────────────────
+DEFAULT_REFRESH_BUDGET = 50
+REFRESH_RECENT_DAYS = 30
+REFRESH_RECENT_INTERVAL = timedelta(hours=24)
+
+
+def _sqlite_ts(verified_at: str | None) -> float:
+    if not verified_at:
+        return 0.0
+    try:
+        return datetime.fromisoformat(verified_at).replace(tzinfo=timezone.utc).timestamp()
+    except ValueError:
+        return 0.0
+
+
+def select_refresh_candidates(
+    posts: list[dict],
+    budget: int,
+    now: datetime | None = None,
+    recent_days: int = REFRESH_RECENT_DAYS,
+) -> list[dict]:
+    """재확인할 글을 우선순위대로 budget개 고른다.
+
+    1순위: 최근 recent_days일 안에 발행되어 아직 수정될 가능성이 큰 글 (최신 발행순),
+           단 REFRESH_RECENT_INTERVAL 안에 이미 확인한 글은 제외
+    2순위: 나머지 글 중 가장 오래전에 확인한 글부터
+    수동 추가 글(manual_*)은 원문이 없으므로 대상이 아니다.
+    """
+    now_ts = (now or datetime.now(timezone.utc)).timestamp()
+    recent_cutoff = now_ts - recent_days * 86400
+    recent_interval = REFRESH_RECENT_INTERVAL.total_seconds()
+
+    recent = []
+    rest = []
+    for p in posts:
+        if not p["post_id"].isdigit():
+            continue
+        pub_ts = p["published_at"]
+        verified_ts = _sqlite_ts(p.get("verified_at"))
+        if pub_ts >= recent_cutoff:
+            if now_ts - verified_ts >= recent_interval:
+                recent.append((-pub_ts, p))
+        else:
+            rest.append((verified_ts, p))
+
+    recent.sort(key=lambda x: x[0])
+    rest.sort(key=lambda x: x[0])
+    ordered = [p for _, p in recent] + [p for _, p in rest]
+    return ordered[:max(0, budget)]
+
+
+def refresh_posts(
+    db: Database,
+    progress_callback=None,
+    budget: int = DEFAULT_REFRESH_BUDGET,
+    max_workers: int = DEFAULT_CONCURRENCY,
+    rate_per_host: float = DEFAULT_RATE_PER_HOST,
+    html_cache: HtmlCache | None = None,
+) -> dict:
+    """이미 저장된 글을 최대 budget개 다시 가져와 본문 해시가 바뀐 글만 갱신.
+
+    바뀌지 않은 글은 verified_at만 갱신한다. 가져오기/추출에 실패한 글은 그대로 둔다.
+    """
+    def log(msg: str):
+        if progress_callback:
+            progress_callback(msg)
+
+    candidates = select_refresh_candidates(db.list_blog_post_verify_info(), budget)
+    log(f"재확인 대상 {len(candidates)}개 (요청 예산 {budget})")
+
+    limiter = HostRateLimiter(rate_per_host)
+    html_cache = html_cache or HtmlCache()
+    changed: list[tuple[str, str, str]] = []
+    unchanged: list[str] = []
+    fail = 0
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        futures = [
+            (p, executor.submit(
+                _fetch_post, p["blog_id"] or BLOG_ID, p["post_id"], limiter, html_cache,
+            ))
+            for p in candidates
+        ]
+        for i, (post, future) in enumerate(futures, 1):
+            fetched = future.result()
+            content = fetched["content"]
+            if not content or len(content) < 50:
+                fail += 1
+                continue
+            if content_hash(content) == post["content_hash"]:
+                unchanged.append(post["post_id"])
+            else:
+                log(f"[{i}/{len(futures)}] 수정됨: {post['post_id']}")
+                changed.append((post["post_id"], content, post["category"] or fetched["category"]))
+
+    db.update_blog_post_contents(changed, verified=True)
+    db.mark_blog_posts_verified(unchanged)
+
+    log(f"완료! 수정됨: {len(changed)}, 변경 없음: {len(unchanged)}, 실패: {fail}")
+    return {"changed": len(changed), "unchanged": len(unchanged), "fail": fail}
+
+
+# ──────────────────────────────────────────────
+# 여러 블로그 스케줄링 (blog_sources)
+# ──────────────────────────────────────────────
+class PriorityScheduler:
+    """여러 블로그가 max_workers개의 워커를 나눠 쓰는 우선순위 작업 큐.
+
+    블로그마다 lane(priority)을 받아 Executor처럼 submit한다. 우선순위가 높은 lane의
+    작업이 먼저 실행되고, 우선순위가 같은 lane끼리는 한 건씩 번갈아 실행된다.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_CONCURRENCY):
+        self._heap: list[tuple] = []
+        self._cond = threading.Condition()
+        self._seq = itertools.count()
+        self._shutdown = False
+        self._threads = [
+            threading.Thread(target=self._work, daemon=True)
+            for _ in range(max(1, max_workers))
+        ]
+        for t in self._threads:
+            t.start()
+
+    def lane(self, priority: int = 0) -> _Lane:
+        return _Lane(self, priority)
+
+    def _put(self, key: tuple, future: Future, fn, args, kwargs) -> None:
+        with self._cond:
+            if self._shutdown:
+                raise RuntimeError("스케줄러가 이미 종료되었습니다")
+            heapq.heappush(self._heap, (*key, next(self._seq), future, fn, args, kwargs))
+            self._cond.notify()
+
+    def _work(self) -> None:
+        while True:
+            with self._cond:
+                while not self._heap and not self._shutdown:
+                    self._cond.wait()
+                if not self._heap:
+                    return
+                *_key, future, fn, args, kwargs = heapq.heappop(self._heap)
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def shutdown(self) -> None:
+        """남은 작업을 모두 처리한 뒤 워커 종료."""
+        with self._cond:
+            self._shutdown = True
+            self._cond.notify_all()
+        for t in self._threads:
+            t.join()
+
+    def __enter__(self) -> PriorityScheduler:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.shutdown()
+
+
+class _Lane(Executor):
+    """PriorityScheduler에 한 블로그의 작업을 넣는 Executor."""
+
+    def __init__(self, scheduler: PriorityScheduler, priority: int):
+        self._scheduler = scheduler
+        self._priority = priority
+        self._count = itertools.count()
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        # (우선순위 높은 순, lane 안에서의 순번) → 같은 우선순위 lane끼리 번갈아 실행
+        key = (-self._priority, next(self._count))
+        self._scheduler._put(key, future, fn, args, kwargs)
+        return future
+
+
+def due_blog_sources(sources: list[dict], now: datetime | None = None) -> list[dict]:
+    """refresh_interval_min이 지난 블로그를 우선순위 높은 순(같으면 오래 밀린 순)으로."""
+    now_ts = (now or datetime.now(timezone.utc)).timestamp()
+    due = []
+    for src in sources:
+        if not src.get("enabled", True):
+            continue
+        overdue = now_ts - _sqlite_ts(src.get("last_crawled_at")) - src["refresh_interval_min"] * 60
+        if overdue >= 0:
+            due.append((-src["priority"], -overdue, src))
+    due.sort(key=lambda x: x[:2])
+    return [src for *_key, src in due]
+
+
+def crawl_sources(
+    db: Database,
+    progress_callback=None,
+    max_workers: int = DEFAULT_CONCURRENCY,
+    rate_per_host: float = DEFAULT_RATE_PER_HOST,
+    force: bool = False,
+    html_cache: HtmlCache | None = None,
+    full: bool = False,
+) -> dict[str, dict]:
+    """blog_sources에 등록된 블로그 중 갱신 주기가 된 것들을 함께 크롤링.
+
+    모든 블로그가 max_workers개의 본문 요청 워커와 호스트별 속도 제한을 공유하며,
+    우선순위(priority)가 높은 블로그의 요청이 먼저 나간다. force=True면 주기를 무시하고,
+    full=True면 저장된 RSS 상태를 무시한다 (crawl_blog 참고).
+    블로그별 결과를 {blog_id: crawl_blog 결과}로 반환한다.
+    """
+    def log(msg: str):
+        if progress_callback:
+            progress_callback(msg)
+
+    sources = db.list_blog_sources(enabled_only=True)
+    due = sources if force else due_blog_sources(sources)
+    if not due:
+        log("갱신 주기가 된 블로그가 없습니다.")
+        return {}
+    log(f"크롤링할 블로그 {len(due)}개: " + ", ".join(src["blog_id"] for src in due))
+
+    limiter = HostRateLimiter(rate_per_host)
+    html_cache = html_cache or HtmlCache()
+    results: dict[str, dict] = {}
+
+    def run(src: dict) -> dict:
+        blog_id = src["blog_id"]
+        return crawl_blog(
+            db,
+            progress_callback=lambda msg: log(f"[{blog_id}] {msg}"),
+            html_cache=html_cache,
+            blog_id=blog_id,
+            executor=scheduler.lane(src["priority"]),
+            limiter=limiter,
+            full=full,
+        )
+
+    with PriorityScheduler(max_workers) as scheduler:
+        # 블로그별 RSS 파싱/저장은 각자의 스레드에서, 본문 요청은 공용 스케줄러에서
+        with ThreadPoolExecutor(max_workers=len(due)) as coordinators:
+            futures = {src["blog_id"]: coordinators.submit(run, src) for src in due}
+            for blog_id, future in futures.items():
+                results[blog_id] = future.result()
+                if "error" not in results[blog_id]:
+                    db.mark_blog_source_crawled(blog_id)
+
+    return results
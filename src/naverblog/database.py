@@ -2,13 +2,39 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
+import re
 import sqlite3
+import threading
+import time
+import weakref
+import zlib
 from datetime import datetime
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 
-from naverblog.config import DB_PATH, PRESETS_DIR, ensure_app_dir
-from naverblog.models import Generation, Persona, SkillConfig
+from naverblog.config import DB_PATH, DEFAULT_BLOG_ID, PRESETS_DIR, ensure_app_dir
+from naverblog.models import Generation, GenerationSummary, Persona, SkillConfig
+from naverblog.terms import TERMS_VERSION, index_scope, index_text, query_terms, scope_token
+
+# SQLite 기본 바인드 변수 한도(구버전 999)보다 작게
+_MAX_SQL_VARS = 900
+
+# 연결마다 적용하는 PRAGMA. journal_mode=WAL은 DB 파일에 기록되므로 한 번이면 되지만
+# 매번 실행해도 비용이 거의 없다. WAL에서는 읽기와 쓰기가 서로 막지 않고,
+# synchronous=NORMAL은 WAL에서 커밋마다 fsync하지 않아도 손상되지 않는다.
+CONNECTION_PRAGMAS = (
+    # 새 DB 파일에만 적용된다 (WAL 전환보다 먼저 해야 함). 기존 DB는 전체 VACUUM이 필요해
+    # 그대로 두고 maintenance.compact_database(enable=True)로 전환한다.
+    "PRAGMA auto_vacuum = INCREMENTAL",
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",  # 다른 연결이 쓰는 중이면 바로 실패하지 않고 최대 5초 대기
+    "PRAGMA cache_size = -16000",  # 연결당 페이지 캐시 16MB
+    "PRAGMA mmap_size = 134217728",  # 128MB까지 메모리 매핑으로 읽기
+    "PRAGMA temp_store = MEMORY",
+)
 
 SCHEMA_SQL = """
 CREATE TABLE IF NOT EXISTS personas (
@@ -60,30 +86,868 @@ CREATE TABLE IF NOT EXISTS blog_posts (
     link TEXT,
     crawled_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
 );
+
+CREATE TABLE IF NOT EXISTS crawl_state (
+    blog_id TEXT PRIMARY KEY,
+    etag TEXT,
+    last_modified TEXT,
+    newest_pub_ts INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS blog_sources (
+    blog_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL DEFAULT '',
+    priority INTEGER NOT NULL DEFAULT 0,
+    refresh_interval_min INTEGER NOT NULL DEFAULT 60,
+    enabled BOOLEAN DEFAULT 1,
+    last_crawled_at TIMESTAMP,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS crawl_jobs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    status TEXT NOT NULL DEFAULT 'running',
+    message TEXT NOT NULL DEFAULT '',
+    success INTEGER NOT NULL DEFAULT 0,
+    skip INTEGER NOT NULL DEFAULT 0,
+    fail INTEGER NOT NULL DEFAULT 0,
+    error TEXT,
+    started_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+CREATE TABLE IF NOT EXISTS archive_checkpoints (
+    blog_id TEXT PRIMARY KEY,
+    next_page INTEGER NOT NULL DEFAULT 1,
+    total_count INTEGER NOT NULL DEFAULT 0,
+    done BOOLEAN DEFAULT 0,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+"""
+
+
+PRESETS_HASH_KEY = "presets_hash"  # app_config: 마지막으로 시드한 personas.json 해시
+TERMS_VERSION_KEY = "terms_version"  # app_config: blog_posts_terms를 만든 terms.TERMS_VERSION
+
+# blog_posts 전문 검색 인덱스. trigram 토크나이저는 글자 3개 단위로 색인하므로
+# 띄어쓰기/조사와 관계없이 한국어 부분 문자열 검색이 된다 (3글자 미만 검색어는 LIKE로 처리).
+FTS_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS blog_posts_fts USING fts5(
+    title, content, content='blog_posts', content_rowid='rowid', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS blog_posts_fts_ai AFTER INSERT ON blog_posts BEGIN
+    INSERT INTO blog_posts_fts (rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS blog_posts_fts_ad AFTER DELETE ON blog_posts BEGIN
+    INSERT INTO blog_posts_fts (blog_posts_fts, rowid, title, content)
+    VALUES ('delete', old.rowid, old.title, old.content);
+END;
+
+CREATE TRIGGER IF NOT EXISTS blog_posts_fts_au AFTER UPDATE OF title, content ON blog_posts BEGIN
+    INSERT INTO blog_posts_fts (blog_posts_fts, rowid, title, content)
+    VALUES ('delete', old.rowid, old.title, old.content);
+    INSERT INTO blog_posts_fts (rowid, title, content) VALUES (new.rowid, new.title, new.content);
+END;
+"""
+# 레퍼런스 글 BM25 순위용 역색인. 한국어 bigram + 단어(terms.index_text)는 SQLite
+# 토크나이저로 만들 수 없어 파이썬에서 만든 공백 구분 용어를 unicode61로 색인한다.
+# 본문은 이미 blog_posts에 있으므로 contentless로 두고, 트리거 대신 Database의 쓰기
+# 메서드가 같은 트랜잭션에서 갱신한다 (_sync_terms). 그래서 다른 도구가 blog_posts를
+# 직접 써도 실패하지 않으며, 어긋난 색인은 시작할 때 글 수로 확인해 다시 만든다.
+# scope 컬럼은 블로그/카테고리 필터 토큰 (점수에는 넣지 않음).
+BM25_TERMS_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS blog_posts_terms USING fts5(
+    title, body, scope, content='', tokenize='unicode61'
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS blog_posts_terms_vocab
+USING fts5vocab(blog_posts_terms, 'row');
+"""
+# 제목 일치는 본문보다 2배, scope는 필터 전용
+BM25_WEIGHTS = (2.0, 1.0, 0.0)
+# 이 비율보다 많은 글에 나오는 용어는 점수 기여(idf)가 작고 읽을 색인만 길어서 뺀다
+BM25_MAX_DF_RATIO = 0.3
+BM25_MAX_QUERY_TERMS = 16
+
+# 카테고리별 글 수/글자 수/최신 발행 시각. blog_posts 트리거로 항상 최신 상태라
+# 통계 화면이 글 수와 관계없이 이 작은 테이블만 읽는다.
+CORPUS_STATS_SQL = """
+CREATE TABLE IF NOT EXISTS corpus_stats (
+    category TEXT PRIMARY KEY,
+    post_count INTEGER NOT NULL DEFAULT 0,
+    total_chars INTEGER NOT NULL DEFAULT 0,
+    newest_published_at INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TRIGGER IF NOT EXISTS corpus_stats_ai AFTER INSERT ON blog_posts BEGIN
+    INSERT INTO corpus_stats (category, post_count, total_chars, newest_published_at)
+    VALUES (new.category, 1, new.content_length, new.published_at)
+    ON CONFLICT(category) DO UPDATE SET
+        post_count = post_count + 1,
+        total_chars = total_chars + excluded.total_chars,
+        newest_published_at = max(newest_published_at, excluded.newest_published_at);
+END;
+
+CREATE TRIGGER IF NOT EXISTS corpus_stats_ad AFTER DELETE ON blog_posts BEGIN
+    UPDATE corpus_stats SET
+        post_count = post_count - 1,
+        total_chars = total_chars - old.content_length,
+        newest_published_at = coalesce(
+            (SELECT max(published_at) FROM blog_posts WHERE category = old.category), 0)
+    WHERE category = old.category;
+    DELETE FROM corpus_stats WHERE category = old.category AND post_count <= 0;
+END;
+
+CREATE TRIGGER IF NOT EXISTS corpus_stats_au
+AFTER UPDATE OF category, content_length, published_at ON blog_posts BEGIN
+    UPDATE corpus_stats SET
+        post_count = post_count - 1,
+        total_chars = total_chars - old.content_length,
+        newest_published_at = coalesce(
+            (SELECT max(published_at) FROM blog_posts WHERE category = old.category), 0)
+    WHERE category = old.category;
+    DELETE FROM corpus_stats WHERE category = old.category AND post_count <= 0;
+    INSERT INTO corpus_stats (category, post_count, total_chars, newest_published_at)
+    VALUES (new.category, 1, new.content_length, new.published_at)
+    ON CONFLICT(category) DO UPDATE SET
+        post_count = post_count + 1,
+        total_chars = total_chars + excluded.total_chars,
+        newest_published_at = max(newest_published_at, excluded.newest_published_at);
+END;
+"""
+
+# 생성 기록 검색용 (주제 + 생성된 본문 Markdown)
+GENERATIONS_FTS_SQL = """
+CREATE VIRTUAL TABLE IF NOT EXISTS generations_fts USING fts5(
+    topic, output_markdown, content='generations', content_rowid='id', tokenize='trigram'
+);
+
+CREATE TRIGGER IF NOT EXISTS generations_fts_ai AFTER INSERT ON generations BEGIN
+    INSERT INTO generations_fts (rowid, topic, output_markdown)
+    VALUES (new.id, new.topic, new.output_markdown);
+END;
+
+CREATE TRIGGER IF NOT EXISTS generations_fts_ad AFTER DELETE ON generations BEGIN
+    INSERT INTO generations_fts (generations_fts, rowid, topic, output_markdown)
+    VALUES ('delete', old.id, old.topic, old.output_markdown);
+END;
+
+CREATE TRIGGER IF NOT EXISTS generations_fts_au
+AFTER UPDATE OF topic, output_markdown ON generations BEGIN
+    INSERT INTO generations_fts (generations_fts, rowid, topic, output_markdown)
+    VALUES ('delete', old.id, old.topic, old.output_markdown);
+    INSERT INTO generations_fts (rowid, topic, output_markdown)
+    VALUES (new.id, new.topic, new.output_markdown);
+END;
+"""
+
+# 프로세스 안에 통째로 캐시하는 작은 설정 테이블들. 트리거가 테이블별 버전을 올리므로
+# 다른 프로세스/연결(예: 스타일 편집 페이지)에서 고친 내용도 다음 읽기에서 바로 보인다.
+CACHED_TABLES = ("personas", "blog_styles", "skills", "app_config")
+
+
+def _table_versions_sql() -> str:
+    sql = "CREATE TABLE IF NOT EXISTS table_versions (name TEXT PRIMARY KEY, version INTEGER NOT NULL);\n"
+    for table in CACHED_TABLES:
+        sql += f"INSERT OR IGNORE INTO table_versions (name, version) VALUES ('{table}', 0);\n"
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            sql += (
+                f"CREATE TRIGGER IF NOT EXISTS {table}_version_{event.lower()} "
+                f"AFTER {event} ON {table} BEGIN\n"
+                f"    UPDATE table_versions SET version = version + 1 WHERE name = '{table}';\n"
+                "END;\n"
+            )
+    return sql
+
+
+# 히스토리 목록에서 읽는 컬럼 (prompt_used, output_* 같은 큰 컬럼 제외)
+GENERATION_SUMMARY_COLUMNS = (
+    "g.id, g.topic, g.persona_name, g.llm_model, g.post_type, g.category, g.created_at, g.tags"
+)
+
+# 내용 주소 blob 저장소: 생성 기록마다 반복되는 프롬프트 구간(페르소나 시스템 프롬프트,
+# 스타일 가이드, 레퍼런스 글)과 스킬 원본 데이터를 해시 키로 한 번만 압축 저장한다.
+BLOBS_SQL = """
+CREATE TABLE IF NOT EXISTS blobs (
+    hash TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
 """
+BLOB_COMPRESS_LEVEL = 6
+# 프롬프트를 나누는 경계: Markdown 제목 줄과 [SYSTEM]/[USER] 구분 줄 앞
+_PROMPT_SECTION_RE = re.compile(r"^(?=#{1,6} |\[(?:SYSTEM|USER)\]$)", re.MULTILINE)
+
+# 온라인 백업/증분 VACUUM을 나눠 실행하는 단위 (기본 4KB 페이지면 4MB씩)
+BACKUP_PAGES_PER_STEP = 1024
+BACKUP_STEP_SLEEP = 0.01  # 단계 사이에 쉬는 시간(초) - 그동안 다른 연결이 쓸 수 있다
+VACUUM_PAGES_PER_STEP = 1024
+
+FTS_MIN_TERM_LENGTH = 3  # trigram 토크나이저가 찾을 수 있는 최소 길이
+SNIPPET_CHARS = 60
+
+
+def content_hash(content: str) -> str:
+    """글 본문 해시 (수정 감지용)."""
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def pub_date_to_ts(pub_date: str) -> int:
+    """RFC-822 pubDate → epoch 초. 파싱 실패 시 0."""
+    if not pub_date:
+        return 0
+    try:
+        return int(parsedate_to_datetime(pub_date).timestamp())
+    except (TypeError, ValueError, IndexError):
+        return 0
+
+
+def split_prompt_sections(prompt: str) -> list[str]:
+    """프롬프트를 제목 단위 구간으로 나눈다. 이어 붙이면 원문과 같다."""
+    return [part for part in _PROMPT_SECTION_RE.split(prompt) if part]
+
+
+def _put_blobs(conn: sqlite3.Connection, texts: list[str]) -> list[str]:
+    """텍스트들을 blobs에 저장하고 각 해시를 반환 (이미 있는 내용은 압축/저장하지 않는다)."""
+    hashes = [content_hash(t) for t in texts]
+    unique = dict(zip(hashes, texts))
+    existing = set()
+    keys = list(unique)
+    for i in range(0, len(keys), _MAX_SQL_VARS):
+        chunk = keys[i:i + _MAX_SQL_VARS]
+        placeholders = ",".join("?" * len(chunk))
+        existing.update(
+            row[0] for row in conn.execute(
+                f"SELECT hash FROM blobs WHERE hash IN ({placeholders})", chunk
+            )
+        )
+    conn.executemany(
+        "INSERT OR IGNORE INTO blobs (hash, data, size) VALUES (?, ?, ?)",
+        [
+            (h, zlib.compress(t.encode("utf-8"), BLOB_COMPRESS_LEVEL), len(t))
+            for h, t in unique.items() if h not in existing
+        ],
+    )
+    return hashes
+
+
+def _get_blobs(conn: sqlite3.Connection, hashes: set[str]) -> dict[str, str]:
+    """해시 → 압축을 푼 텍스트."""
+    keys = list(hashes)
+    result = {}
+    for i in range(0, len(keys), _MAX_SQL_VARS):
+        chunk = keys[i:i + _MAX_SQL_VARS]
+        placeholders = ",".join("?" * len(chunk))
+        for row in conn.execute(
+            f"SELECT hash, data FROM blobs WHERE hash IN ({placeholders})", chunk
+        ):
+            result[row[0]] = zlib.decompress(row[1]).decode("utf-8")
+    return result
+
+
+def _store_generation_text(
+    conn: sqlite3.Connection, prompt_used: str, search_context: str | None,
+) -> tuple[str, str | None]:
+    """prompt_used/search_context를 blobs에 나눠 저장하고 (prompt_refs, context_refs) JSON 반환.
+
+    prompt_refs는 구간 해시 목록(순서대로 이어 붙이면 원문).
+    context_refs는 스킬 이름 → 원본 JSON 해시이며, search_context가 JSON 객체가
+    아니면 prompt_refs와 같은 해시 목록 형식으로 통째로 저장한다.
+    """
+    prompt_refs = json.dumps(_put_blobs(conn, split_prompt_sections(prompt_used)))
+    if search_context is None:
+        return prompt_refs, None
+    try:
+        payloads = json.loads(search_context)
+    except ValueError:
+        payloads = None
+    if isinstance(payloads, dict):
+        names = list(payloads)
+        hashes = _put_blobs(
+            conn, [json.dumps(payloads[name], ensure_ascii=False) for name in names]
+        )
+        return prompt_refs, json.dumps(dict(zip(names, hashes)), ensure_ascii=False)
+    return prompt_refs, json.dumps(_put_blobs(conn, [search_context]))
+
+
+def _ref_hashes(refs: str | None) -> list[str]:
+    if not refs:
+        return []
+    parsed = json.loads(refs)
+    return list(parsed.values()) if isinstance(parsed, dict) else parsed
+
+
+def _load_generation_text(conn: sqlite3.Connection, rows: list[sqlite3.Row]) -> list[dict]:
+    """generations 행들의 prompt_used/search_context를 blobs에서 복원한 dict 목록."""
+    needed = set()
+    for row in rows:
+        needed.update(_ref_hashes(row["prompt_refs"]))
+        needed.update(_ref_hashes(row["context_refs"]))
+    blobs = _get_blobs(conn, needed) if needed else {}
+
+    results = []
+    for row in rows:
+        data = dict(row)
+        prompt_refs = data.pop("prompt_refs")
+        context_refs = data.pop("context_refs")
+        if prompt_refs:
+            data["prompt_used"] = "".join(blobs[h] for h in json.loads(prompt_refs))
+        if context_refs:
+            parsed = json.loads(context_refs)
+            if isinstance(parsed, dict):
+                data["search_context"] = json.dumps(
+                    {name: json.loads(blobs[h]) for name, h in parsed.items()},
+                    ensure_ascii=False,
+                )
+            else:
+                data["search_context"] = "".join(blobs[h] for h in parsed)
+        data["tags"] = json.loads(data.get("tags") or "[]")
+        data["skill_runs"] = json.loads(data.get("skill_runs") or "[]")
+        results.append(data)
+    return results
+
+
+# ──────────────────────────────────────────────
+# 스키마 마이그레이션 (PRAGMA user_version)
+# ──────────────────────────────────────────────
+def _split_sql(script: str) -> list[str]:
+    """여러 문장으로 된 SQL을 문장 단위로 나눈다 (트리거 본문 안의 ;도 처리).
+
+    executescript는 실행 전에 COMMIT하므로 마이그레이션 트랜잭션 안에서는 쓰지 않는다.
+    """
+    statements = []
+    buf = ""
+    for line in script.splitlines(keepends=True):
+        buf += line
+        if sqlite3.complete_statement(buf):
+            statements.append(buf.strip())
+            buf = ""
+    if buf.strip():
+        statements.append(buf.strip())
+    return statements
+
+
+def _run_sql(conn: sqlite3.Connection, script: str) -> None:
+    for statement in _split_sql(script):
+        conn.execute(statement)
+
+
+def _add_column(conn: sqlite3.Connection, table: str, column: str, decl: str) -> None:
+    """컬럼이 없을 때만 추가 (user_version 도입 전 DB에는 이미 있을 수 있다)."""
+    columns = {row["name"] for row in conn.execute(f"PRAGMA table_info({table})")}
+    if column not in columns:
+        conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+
+
+def _migration_base(conn: sqlite3.Connection) -> None:
+    _run_sql(conn, SCHEMA_SQL)
+
+
+def _migration_post_hash(conn: sqlite3.Connection) -> None:
+    """수정 감지용 본문 해시/마지막 확인 시각."""
+    _add_column(conn, "blog_posts", "content_hash", "TEXT")
+    _add_column(conn, "blog_posts", "verified_at", "TIMESTAMP")
+    rows = conn.execute(
+        "SELECT post_id, content FROM blog_posts WHERE content_hash IS NULL"
+    ).fetchall()
+    conn.executemany(
+        "UPDATE blog_posts SET content_hash = ? WHERE post_id = ?",
+        [(content_hash(r["content"]), r["post_id"]) for r in rows],
+    )
+
+
+def _migration_blog_id(conn: sqlite3.Connection) -> None:
+    """여러 블로그 지원: 글마다 blog_id, 기본 블로그를 크롤링 대상으로 등록."""
+    _add_column(conn, "blog_posts", "blog_id", "TEXT NOT NULL DEFAULT ''")
+    # blog_id 컬럼 이전에 저장된 글은 모두 기본 블로그 글
+    conn.execute("UPDATE blog_posts SET blog_id = ? WHERE blog_id = ''", (DEFAULT_BLOG_ID,))
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_blog_posts_blog_id ON blog_posts(blog_id, category)"
+    )
+    if conn.execute("SELECT 1 FROM blog_sources LIMIT 1").fetchone() is None:
+        conn.execute(
+            "INSERT INTO blog_sources (blog_id, name) VALUES (?, ?)",
+            (DEFAULT_BLOG_ID, DEFAULT_BLOG_ID),
+        )
+
+
+def _has_fts5(conn: sqlite3.Connection, tokenize: str = "unicode61") -> bool:
+    """이 SQLite 빌드에서 FTS5와 tokenize 토크나이저를 쓸 수 있는지."""
+    try:
+        conn.execute(f"CREATE VIRTUAL TABLE temp._fts_probe USING fts5(x, tokenize='{tokenize}')")
+        conn.execute("DROP TABLE temp._fts_probe")
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+def _has_trigram(conn: sqlite3.Connection) -> bool:
+    """이 SQLite 빌드에서 FTS5 trigram 토크나이저를 쓸 수 있는지 (3.34+)."""
+    return _has_fts5(conn, "trigram")
+
+
+def _terms_row(rowid: int, title: str, content: str, blog_id: str, category: str) -> tuple:
+    """blog_posts 한 행의 blog_posts_terms 값 (rowid, title, body, scope)."""
+    return rowid, index_text(title), index_text(content), index_scope(blog_id, category)
+
+
+def _indexed_posts(conn: sqlite3.Connection, post_ids: list[str]) -> dict[str, tuple]:
+    """post_id → (rowid, title, content, blog_id, category): 색인 용어를 만드는 값.
+
+    쓰기 전후에 같은 트랜잭션에서 읽어 _sync_terms에 넘긴다. sqlite3 모듈은 첫 쓰기 직전에야
+    트랜잭션을 열므로, 호출하는 쪽이 먼저 BEGIN IMMEDIATE로 열어 그 사이의 쓰기를 막는다.
+    """
+    found: dict[str, tuple] = {}
+    ids = list(dict.fromkeys(post_ids))
+    for start in range(0, len(ids), _MAX_SQL_VARS):
+        chunk = ids[start:start + _MAX_SQL_VARS]
+        rows = conn.execute(
+            "SELECT post_id, rowid, title, content, blog_id, category FROM blog_posts "
+            "WHERE post_id IN ({})".format(",".join("?" for _ in chunk)),
+            chunk,
+        ).fetchall()
+        for row in rows:
+            found[row[0]] = tuple(row[1:])
+    return found
+
+
+def _sync_terms(conn: sqlite3.Connection, before: dict[str, tuple], after: dict[str, tuple]) -> None:
+    """바뀐 글만 blog_posts_terms에서 옛 용어를 지우고 새 용어를 넣는다.
+
+    contentless 테이블은 지울 때 넣었던 용어를 그대로 넘겨야 하므로 before는 쓰기 전 값.
+    """
+    deletes = []
+    inserts = []
+    for post_id in before.keys() | after.keys():
+        old, new = before.get(post_id), after.get(post_id)
+        if old == new:
+            continue
+        if old is not None:
+            deletes.append(_terms_row(*old))
+        if new is not None:
+            inserts.append(_terms_row(*new))
+    if deletes:
+        conn.executemany(
+            "INSERT INTO blog_posts_terms (blog_posts_terms, rowid, title, body, scope) "
+            "VALUES ('delete', ?, ?, ?, ?)",
+            deletes,
+        )
+    if inserts:
+        conn.executemany(
+            "INSERT INTO blog_posts_terms (rowid, title, body, scope) VALUES (?, ?, ?, ?)",
+            inserts,
+        )
+
+
+def _rebuild_terms(conn: sqlite3.Connection) -> None:
+    """blog_posts_terms를 비우고 모든 글로 다시 만든 뒤 TERMS_VERSION을 기록."""
+    conn.execute("INSERT INTO blog_posts_terms (blog_posts_terms) VALUES ('delete-all')")
+    cursor = conn.execute("SELECT rowid, title, content, blog_id, category FROM blog_posts")
+    while rows := cursor.fetchmany(500):
+        conn.executemany(
+            "INSERT INTO blog_posts_terms (rowid, title, body, scope) VALUES (?, ?, ?, ?)",
+            [_terms_row(*row) for row in rows],
+        )
+    conn.execute(
+        "INSERT OR REPLACE INTO app_config (key, value) VALUES (?, ?)",
+        (TERMS_VERSION_KEY, str(TERMS_VERSION)),
+    )
+
+
+def _fts_query(terms: list[str]) -> str:
+    """검색어들을 모두 포함하는 FTS5 MATCH 식 (각 검색어는 구문으로 인용)."""
+    return " AND ".join('"{}"'.format(t.replace('"', '""')) for t in terms)
+
+
+def _index_term(term: str) -> str:
+    """짧은 검색어가 blog_posts_terms의 용어 하나와 같으면 그 용어, 아니면 빈 문자열."""
+    found = query_terms(term)
+    return found[0] if len(found) == 1 and len(found[0]) == len(term) else ""
+
+
+def _like_pattern(term: str) -> str:
+    """LIKE ... ESCAPE '\\'용 부분 일치 패턴."""
+    return "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def _migration_fts(conn: sqlite3.Connection) -> None:
+    """blog_posts 전문 검색 인덱스 (FTS5 trigram이 없는 SQLite면 건너뛰고 LIKE 검색만 사용)."""
+    if not _has_trigram(conn):
+        return
+    _run_sql(conn, FTS_SQL)
+    conn.execute("INSERT INTO blog_posts_fts (blog_posts_fts) VALUES ('rebuild')")
+
+
+def _migration_published_at(conn: sqlite3.Connection) -> None:
+    """정렬용 발행 시각(epoch). pub_date 문자열은 사전순 정렬이라 순서가 틀린다.
+
+    pub_date가 없는 글(직접 추가한 글)은 저장 시각을 쓴다.
+    """
+    _add_column(conn, "blog_posts", "published_at", "INTEGER NOT NULL DEFAULT 0")
+    rows = conn.execute("SELECT post_id, pub_date, crawled_at FROM blog_posts").fetchall()
+    conn.executemany(
+        "UPDATE blog_posts SET published_at = "
+        "COALESCE(NULLIF(?, 0), CAST(strftime('%s', ?) AS INTEGER), 0) WHERE post_id = ?",
+        [(pub_date_to_ts(r["pub_date"]), r["crawled_at"], r["post_id"]) for r in rows],
+    )
+    _run_sql(conn, """
+        DROP INDEX IF EXISTS idx_blog_posts_blog_id;
+        CREATE INDEX IF NOT EXISTS idx_blog_posts_published ON blog_posts(published_at);
+        CREATE INDEX IF NOT EXISTS idx_blog_posts_category_published
+            ON blog_posts(category, published_at);
+        CREATE INDEX IF NOT EXISTS idx_blog_posts_blog_published
+            ON blog_posts(blog_id, published_at);
+        CREATE INDEX IF NOT EXISTS idx_generations_created ON generations(created_at);
+    """)
+
+
+def _migration_content_length(conn: sqlite3.Connection) -> None:
+    """목록 화면에서 본문을 읽지 않고 글자 수를 보여주기 위한 컬럼."""
+    _add_column(conn, "blog_posts", "content_length", "INTEGER NOT NULL DEFAULT 0")
+    conn.execute("UPDATE blog_posts SET content_length = length(content)")
+
+
+def _migration_corpus_stats(conn: sqlite3.Connection) -> None:
+    _run_sql(conn, CORPUS_STATS_SQL)
+    conn.execute("DELETE FROM corpus_stats")
+    conn.execute(
+        "INSERT INTO corpus_stats (category, post_count, total_chars, newest_published_at) "
+        "SELECT category, count(*), coalesce(sum(content_length), 0), coalesce(max(published_at), 0) "
+        "FROM blog_posts GROUP BY category"
+    )
+
+
+def _migration_generation_history(conn: sqlite3.Connection) -> None:
+    """생성 기록: 카테고리 컬럼, (created_at, id) 커서 인덱스, 본문 전문 검색."""
+    _add_column(conn, "generations", "category", "TEXT NOT NULL DEFAULT ''")
+    _run_sql(conn, """
+        DROP INDEX IF EXISTS idx_generations_created;
+        CREATE INDEX IF NOT EXISTS idx_generations_created_id ON generations(created_at, id);
+    """)
+    if _has_trigram(conn):
+        _run_sql(conn, GENERATIONS_FTS_SQL)
+        conn.execute("INSERT INTO generations_fts (generations_fts) VALUES ('rebuild')")
+
+
+def _migration_generation_blobs(conn: sqlite3.Connection) -> None:
+    """생성 기록의 프롬프트/스킬 원본을 blobs로 옮긴다 (기존 행도 변환)."""
+    _run_sql(conn, BLOBS_SQL)
+    _add_column(conn, "generations", "prompt_refs", "TEXT")
+    _add_column(conn, "generations", "context_refs", "TEXT")
+    rows = conn.execute(
+        "SELECT id, prompt_used, search_context FROM generations WHERE prompt_refs IS NULL"
+    ).fetchall()
+    updates = []
+    for r in rows:
+        prompt_refs, context_refs = _store_generation_text(
+            conn, r["prompt_used"], r["search_context"]
+        )
+        updates.append((prompt_refs, context_refs, r["id"]))
+    conn.executemany(
+        "UPDATE generations SET prompt_refs = ?, context_refs = ?, "
+        "prompt_used = '', search_context = NULL WHERE id = ?",
+        updates,
+    )
+
+
+def _migration_table_versions(conn: sqlite3.Connection) -> None:
+    """설정 테이블 캐시 무효화용 테이블별 버전."""
+    _run_sql(conn, _table_versions_sql())
+
+
+def _migration_skill_runs(conn: sqlite3.Connection) -> None:
+    """생성 기록별 스킬 실행 결과 (이름/상태/소요 시간) JSON."""
+    _add_column(conn, "generations", "skill_runs", "TEXT NOT NULL DEFAULT '[]'")
+
+
+def _migration_search_cache(conn: sqlite3.Connection) -> None:
+    """웹 검색 응답 캐시 (정규화한 검색어 + 검색 옵션 해시 키, 응답 JSON은 zlib 압축)."""
+    _run_sql(conn, """
+        CREATE TABLE IF NOT EXISTS search_cache (
+            key TEXT PRIMARY KEY,
+            query TEXT NOT NULL,
+            response BLOB NOT NULL,
+            created_at REAL NOT NULL,
+            last_used_at REAL NOT NULL,
+            hit_count INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_search_cache_last_used ON search_cache(last_used_at);
+    """)
+
+
+def _migration_bm25_terms(conn: sqlite3.Connection) -> None:
+    """레퍼런스 글 BM25 역색인 (FTS5가 없는 SQLite면 건너뛰고 최신순 선택만 사용)."""
+    if not _has_fts5(conn):
+        return
+    _run_sql(conn, BM25_TERMS_SQL)
+    _rebuild_terms(conn)
+
+
+def _migration_drop_terms_triggers(conn: sqlite3.Connection) -> None:
+    """blog_posts_terms를 파이썬 함수로 갱신하던 트리거 제거 (이제 Database가 직접 갱신).
+
+    트리거가 연결마다 등록한 함수를 불러 다른 연결에서는 blog_posts 쓰기가 실패했다.
+    """
+    conn.execute("DROP TRIGGER IF EXISTS blog_posts_terms_ai")
+    conn.execute("DROP TRIGGER IF EXISTS blog_posts_terms_ad")
+    conn.execute("DROP TRIGGER IF EXISTS blog_posts_terms_au")
+
+
+def _migration_crawl_state_post_count(conn: sqlite3.Connection) -> None:
+    """RSS 상태를 저장할 때의 블로그 글 수 (그 뒤에 글을 지웠으면 상태를 무시하고 다시 확인)."""
+    _add_column(conn, "crawl_state", "post_count", "INTEGER NOT NULL DEFAULT 0")
+
+
+# 순서대로 적용되며, i번째 단계를 마치면 user_version = i + 1.
+# 이미 배포된 단계는 수정하지 말고 새 단계를 뒤에 추가한다.
+MIGRATIONS = [
+    _migration_base,
+    _migration_post_hash,
+    _migration_blog_id,
+    _migration_fts,
+    _migration_published_at,
+    _migration_content_length,
+    _migration_corpus_stats,
+    _migration_generation_history,
+    _migration_generation_blobs,
+    _migration_table_versions,
+    _migration_skill_runs,
+    _migration_search_cache,
+    _migration_bm25_terms,
+    _migration_drop_terms_triggers,
+    _migration_crawl_state_post_count,
+]
+
+# list_blog_post_meta가 반환하는 컬럼 (본문 제외)
+BLOG_POST_META_COLUMNS = (
+    "post_id, blog_id, title, category, pub_date, published_at, link, content_length"
+)
+SCHEMA_VERSION = len(MIGRATIONS)
+
+# 이 프로세스에서 마이그레이션/프리셋 확인을 마친 DB 경로 (페이지마다 Database를 만들어도 한 번만)
+_migrated_paths: set[str] = set()
+_seeded_paths: set[str] = set()
+_init_lock = threading.Lock()
+
+
+def _make_snippet(text: str, terms: list[str]) -> str:
+    """검색 결과용 snippet: 처음 나오는 검색어 주변을 발췌하고 검색어를 [ ]로 표시."""
+    lowered = text.lower()
+    positions = [lowered.find(t.lower()) for t in terms]
+    positions = [p for p in positions if p >= 0]
+    if not positions:
+        return text[:SNIPPET_CHARS] + ("…" if len(text) > SNIPPET_CHARS else "")
+    pos = min(positions)
+    start = max(0, pos - SNIPPET_CHARS // 2)
+    excerpt = text[start:start + SNIPPET_CHARS]
+    for term in terms:
+        excerpt = re.sub(re.escape(term), lambda m: f"[{m.group(0)}]", excerpt, flags=re.IGNORECASE)
+    prefix = "…" if start > 0 else ""
+    suffix = "…" if start + SNIPPET_CHARS < len(text) else ""
+    return prefix + excerpt.replace("\n", " ") + suffix
+
+
+class _TableCache:
+    """CACHED_TABLES의 내용을 읽기 시점에 검증하며 재사용하는 캐시.
+
+    검증은 캐시 전용 연결의 PRAGMA data_version으로 한다. 이 값은 다른 연결(같은
+    프로세스의 다른 스레드나 다른 프로세스)이 커밋할 때만 바뀌고, 이 연결은 쓰지 않으므로
+    어디서든 쓰기가 있었는지 알 수 있다. 바뀌었으면 table_versions를 읽어 실제로
+    바뀐 테이블의 캐시만 버린다 (크롤링처럼 다른 테이블만 쓰는 동안에는 캐시 유지).
+    """
+
+    def __init__(self, db_path: Path):
+        self._conn = sqlite3.connect(str(db_path), timeout=5, check_same_thread=False)
+        self._conn.execute("PRAGMA busy_timeout = 5000")
+        self._lock = threading.Lock()
+        self._data_version: int | None = None
+        self._versions: dict[str, int] = {}
+        self._values: dict[str, object] = {}
+
+    def get(self, table: str, loader):
+        """table의 캐시된 값, 없거나 낡았으면 loader()로 새로 읽는다."""
+        with self._lock:
+            data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version != self._data_version:
+                versions = dict(self._conn.execute("SELECT name, version FROM table_versions"))
+                for name, version in versions.items():
+                    if self._versions.get(name) != version:
+                        self._values.pop(name, None)
+                self._versions = versions
+                self._data_version = data_version
+            if table in self._values:
+                return self._values[table]
+            version = self._versions.get(table)
+        # 버전을 먼저 확인한 뒤 읽으므로, 그 사이 쓰기가 있어도 다음 검증에서 다시 읽힌다
+        value = loader()
+        with self._lock:
+            if self._versions.get(table) == version:
+                self._values[table] = value
+        return value
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def _close_connections(
+    conns: list[tuple[weakref.ref, sqlite3.Connection]],
+    lock: threading.Lock,
+    cache: _TableCache,
+) -> None:
+    """Database의 연결과 캐시 연결을 닫는다 (Database.close와 finalize가 호출)."""
+    with lock:
+        for _thread_ref, conn in conns:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        conns.clear()
+    cache.close()
 
 
 class Database:
+    """스레드마다 연결 하나를 열어 두고 재사용한다.
+
+    메서드는 `with self._get_conn() as conn:`으로 트랜잭션 단위만 나누고 연결은 닫지 않는다.
+    스레드가 끝나면 그 스레드의 연결은 다음 연결을 열 때 정리되고, 나머지는 close()
+    또는 인스턴스가 수거되거나 프로세스가 끝날 때(weakref.finalize) 닫힌다.
+
+    personas/blog_styles/skills/app_config는 _TableCache로 테이블째 캐시해 읽는다.
+    """
+
     def __init__(self, db_path: Path = DB_PATH):
         ensure_app_dir()
         self._db_path = db_path
-        self._migrate()
-        self._seed_presets()
+        self._local = threading.local()
+        self._conns: list[tuple[weakref.ref, sqlite3.Connection]] = []
+        self._conns_lock = threading.Lock()
+        self._closed = False
+        self._table_exists: dict[str, bool] = {}  # _has_table 결과 (FTS 테이블 등)
+        key = str(Path(db_path).resolve())
+        with _init_lock:
+            if key not in _migrated_paths:
+                self._migrate()
+                self._check_terms()
+                _migrated_paths.add(key)
+            if key not in _seeded_paths:
+                self._seed_presets()
+                _seeded_paths.add(key)
+        self._cache = _TableCache(db_path)
+        # 인스턴스가 수거되거나 프로세스가 끝날 때 연결을 닫는다 (self를 붙잡지 않도록 finalize)
+        self._finalizer = weakref.finalize(
+            self, _close_connections, self._conns, self._conns_lock, self._cache
+        )
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(str(self._db_path))
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            return conn
+        if self._closed:
+            raise sqlite3.ProgrammingError("Database가 이미 닫혔습니다")
+        # 연결은 만든 스레드에서만 쓰지만, close()가 다른 스레드에서 닫을 수 있도록 허용
+        conn = sqlite3.connect(str(self._db_path), timeout=5, check_same_thread=False)
         conn.row_factory = sqlite3.Row
+        for pragma in CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        self._local.conn = conn
+        with self._conns_lock:
+            self._prune_dead_conns()
+            self._conns.append((weakref.ref(threading.current_thread()), conn))
         return conn
 
+    def _prune_dead_conns(self) -> None:
+        """종료된 스레드가 남긴 연결 닫기 (_conns_lock 안에서 호출)."""
+        alive = []
+        for thread_ref, conn in self._conns:
+            thread = thread_ref()
+            if thread is not None and thread.is_alive():
+                alive.append((thread_ref, conn))
+            else:
+                conn.close()
+        self._conns[:] = alive  # finalize가 같은 리스트를 들고 있다
+
+    def close(self) -> None:
+        """모든 스레드의 연결을 닫는다. 이후에는 사용할 수 없다."""
+        self._closed = True
+        self._finalizer()
+        self._local = threading.local()
+
+    def __enter__(self) -> Database:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
     def _migrate(self) -> None:
-        with self._get_conn() as conn:
-            conn.executescript(SCHEMA_SQL)
+        """user_version 이후의 마이그레이션만 단계별 트랜잭션으로 적용."""
+        conn = self._get_conn()
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+        for version, step in enumerate(MIGRATIONS, 1):
+            # 다른 프로세스가 동시에 마이그레이션할 수 있으므로 쓰기 잠금을 잡고 다시 확인
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                if conn.execute("PRAGMA user_version").fetchone()[0] >= version:
+                    conn.rollback()
+                    continue
+                step(conn)
+                conn.execute(f"PRAGMA user_version = {version}")
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+
+    def _check_terms(self) -> None:
+        """blog_posts_terms가 현재 추출 규칙으로 모든 글을 담고 있는지 확인하고 아니면 다시 만든다.
+
+        TERMS_VERSION이 바뀌었거나, Database를 거치지 않고 blog_posts에 글을 넣거나 지워
+        글 수가 어긋난 경우 (같은 글을 밖에서 고친 것은 알 수 없다).
+        """
+        if not self._has_table("blog_posts_terms"):
+            return
+
+        def current() -> bool:
+            row = conn.execute(
+                "SELECT value FROM app_config WHERE key = ?", (TERMS_VERSION_KEY,)
+            ).fetchone()
+            if row is None or row["value"] != str(TERMS_VERSION):
+                return False
+            posts = conn.execute("SELECT COUNT(*) FROM blog_posts").fetchone()[0]
+            return posts == conn.execute("SELECT COUNT(*) FROM blog_posts_terms").fetchone()[0]
+
+        conn = self._get_conn()
+        if current():
+            return
+        # _migrate와 같이 쓰기 잠금을 잡고 다시 확인 (다른 프로세스가 먼저 만들었을 수 있다)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if not current():
+                _rebuild_terms(conn)
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
 
     def _seed_presets(self) -> None:
+        """personas.json이 마지막으로 시드한 내용과 다를 때만 프리셋을 동기화."""
         presets_file = PRESETS_DIR / "personas.json"
         if not presets_file.exists():
             return
-        presets = json.loads(presets_file.read_text(encoding="utf-8"))
+        raw = presets_file.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()
+        with self._get_conn() as conn:
+            row = conn.execute(
+                "SELECT value FROM app_config WHERE key = ?", (PRESETS_HASH_KEY,)
+            ).fetchone()
+        if row is not None and row["value"] == digest:
+            return
+        presets = json.loads(raw.decode("utf-8"))
         preset_names = {p["name"] for p in presets}
         with self._get_conn() as conn:
             # 기존 프리셋 중 JSON에 없는 것 삭제
@@ -94,30 +958,35 @@ class Database:
                 list(preset_names),
             )
             # 프리셋 upsert
-            for p in presets:
-                conn.execute(
-                    "INSERT OR REPLACE INTO personas (name, description, system_prompt, is_preset) "
-                    "VALUES (?, ?, ?, 1)",
-                    (p["name"], p["description"], p["system_prompt"]),
-                )
+            conn.executemany(
+                "INSERT OR REPLACE INTO personas (name, description, system_prompt, is_preset) "
+                "VALUES (?, ?, ?, 1)",
+                [(p["name"], p["description"], p["system_prompt"]) for p in presets],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO app_config (key, value) VALUES (?, ?)",
+                (PRESETS_HASH_KEY, digest),
+            )
 
     # --- Persona ---
 
+    def _persona_rows(self) -> list[dict]:
+        def load():
+            with self._get_conn() as conn:
+                rows = conn.execute(
+                    "SELECT * FROM personas ORDER BY is_preset DESC, name"
+                ).fetchall()
+            return [dict(r) for r in rows]
+        return self._cache.get("personas", load)
+
     def get_persona(self, name: str) -> Persona | None:
-        with self._get_conn() as conn:
-            row = conn.execute(
-                "SELECT * FROM personas WHERE name = ?", (name,)
-            ).fetchone()
-        if row is None:
-            return None
-        return Persona(**dict(row))
+        for row in self._persona_rows():
+            if row["name"] == name:
+                return Persona(**row)
+        return None
 
     def list_personas(self) -> list[Persona]:
-        with self._get_conn() as conn:
-            rows = conn.execute(
-                "SELECT * FROM personas ORDER BY is_preset DESC, name"
-            ).fetchall()
-        return [Persona(**dict(r)) for r in rows]
+        return [Persona(**row) for row in self._persona_rows()]
 
     def add_persona(self, persona: Persona) -> Persona:
         with self._get_conn() as conn:
@@ -137,22 +1006,31 @@ class Database:
     # --- Generation ---
 
     def save_generation(self, gen: Generation) -> Generation:
+        """생성 기록 저장. prompt_used/search_context는 blobs에 나눠 저장하고 해시만 남긴다."""
         with self._get_conn() as conn:
+            prompt_refs, context_refs = _store_generation_text(
+                conn, gen.prompt_used, gen.search_context
+            )
             cursor = conn.execute(
                 "INSERT INTO generations "
-                "(topic, persona_name, llm_model, post_type, search_context, "
-                "prompt_used, output_markdown, output_html, tags) "
-                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                "(topic, persona_name, llm_model, post_type, category, search_context, "
+                "prompt_used, prompt_refs, context_refs, output_markdown, output_html, tags, "
+                "skill_runs) "
+                "VALUES (?, ?, ?, ?, ?, NULL, '', ?, ?, ?, ?, ?, ?)",
                 (
                     gen.topic,
                     gen.persona_name,
                     gen.llm_model,
                     gen.post_type.value,
-                    gen.search_context,
-                    gen.prompt_used,
+                    gen.category,
+                    prompt_refs,
+                    context_refs,
                     gen.output_markdown,
                     gen.output_html,
                     json.dumps(gen.tags, ensure_ascii=False),
+                    json.dumps(
+                        [run.model_dump() for run in gen.skill_runs], ensure_ascii=False
+                    ),
                 ),
             )
             gen.id = cursor.lastrowid
@@ -163,10 +1041,9 @@ class Database:
             row = conn.execute(
                 "SELECT * FROM generations WHERE id = ?", (gen_id,)
             ).fetchone()
-        if row is None:
-            return None
-        data = dict(row)
-        data["tags"] = json.loads(data.get("tags", "[]"))
+            if row is None:
+                return None
+            data = _load_generation_text(conn, [row])[0]
         return Generation(**data)
 
     def list_generations(self, limit: int = 20) -> list[Generation]:
@@ -175,26 +1052,123 @@ class Database:
                 "SELECT * FROM generations ORDER BY created_at DESC LIMIT ?",
                 (limit,),
             ).fetchall()
-        results = []
+            return [Generation(**data) for data in _load_generation_text(conn, rows)]
+
+    def list_generations_older_than(self, days: int, limit: int = 200) -> list[Generation]:
+        """days일보다 오래된 생성 기록을 오래된 순으로 (보관 정책용)."""
+        with self._get_conn() as conn:
+            rows = conn.execute(
+                "SELECT * FROM generations WHERE created_at < datetime('now', ?) "
+                "ORDER BY created_at, id LIMIT ?",
+                (f"-{int(days)} days", limit),
+            ).fetchall()
+            return [Generation(**data) for data in _load_generation_text(conn, rows)]
+
+    def delete_generations(self, gen_ids: list[int]) -> int:
+        deleted = 0
+        with self._get_conn() as conn:
+            for i in range(0, len(gen_ids), _MAX_SQL_VARS):
+                chunk = gen_ids[i:i + _MAX_SQL_VARS]
+                placeholders = ",".join("?" * len(chunk))
+                deleted += conn.execute(
+                    f"DELETE FROM generations WHERE id IN ({placeholders})", chunk
+                ).rowcount
+        return deleted
+
+    def list_generation_summaries(
+        self,
+        limit: int = 20,
+        cursor: tuple[str, int] | None = None,
+        persona_name: str = "",
+        llm_model: str = "",
+        category: str = "",
+        post_type: str = "",
+        query: str = "",
+    ) -> tuple[list[GenerationSummary], tuple[str, int] | None]:
+        """최신순 생성 기록 한 페이지와 다음 페이지 커서.
+
+        cursor는 이전 페이지 마지막 행의 (created_at, id)이며, OFFSET 없이 그 다음부터 읽는다.
+        query는 주제/생성된 본문 검색 (3글자 이상은 FTS5, 짧은 검색어는 LIKE).
+        다음 페이지가 없으면 커서로 None을 반환한다.
+        """
+        where = []
+        params: list = []
+        joins = ""
+        terms = [t for t in query.split() if t]
+        long_terms = [t for t in terms if len(t) >= FTS_MIN_TERM_LENGTH]
+        if long_terms and self._has_table("generations_fts"):
+            joins = " JOIN generations_fts ON generations_fts.rowid = g.id"
+            where.append("generations_fts MATCH ?")
+            params.append(_fts_query(long_terms))
+            like_terms = [t for t in terms if len(t) < FTS_MIN_TERM_LENGTH]
+        else:
+            like_terms = terms
+        for term in like_terms:
+            where.append("(g.topic LIKE ? ESCAPE '\\' OR g.output_markdown LIKE ? ESCAPE '\\')")
+            params.extend([_like_pattern(term)] * 2)
+        for column, value in (
+            ("persona_name", persona_name), ("llm_model", llm_model),
+            ("category", category), ("post_type", post_type),
+        ):
+            if value:
+                where.append(f"g.{column} = ?")
+                params.append(value)
+        if cursor:
+            where.append("(g.created_at, g.id) < (?, ?)")
+            params.extend(cursor)
+
+        sql = f"SELECT {GENERATION_SUMMARY_COLUMNS} FROM generations g{joins}"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY g.created_at DESC, g.id DESC LIMIT ?"
+        params.append(limit + 1)  # 한 행 더 읽어 다음 페이지 유무 확인
+
+        with self._get_conn() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = (rows[-1]["created_at"], rows[-1]["id"])
+        summaries = []
         for r in rows:
             data = dict(r)
-            data["tags"] = json.loads(data.get("tags", "[]"))
-            results.append(Generation(**data))
-        return results
+            data["tags"] = json.loads(data.get("tags") or "[]")
+            summaries.append(GenerationSummary(**data))
+        return summaries, next_cursor
+
+    def list_generation_filter_values(self) -> dict[str, list[str]]:
+        """히스토리 필터 선택지 (페르소나/모델/카테고리/글 유형별 실제 사용된 값)."""
+        values = {}
+        with self._get_conn() as conn:
+            for column in ("persona_name", "llm_model", "category", "post_type"):
+                rows = conn.execute(
+                    f"SELECT DISTINCT {column} FROM generations WHERE {column} != '' "
+                    f"ORDER BY {column}"
+                ).fetchall()
+                values[column] = [row[0] for row in rows]
+        return values
 
     # --- Skill Config ---
 
-    def get_skill_config(self, name: str) -> SkillConfig | None:
-        with self._get_conn() as conn:
-            row = conn.execute(
-                "SELECT * FROM skills WHERE name = ?", (name,)
-            ).fetchone()
-        if row is None:
-            return None
+    def _skill_rows(self) -> dict[str, dict]:
+        def load():
+            with self._get_conn() as conn:
+                rows = conn.execute("SELECT * FROM skills").fetchall()
+            return {r["name"]: dict(r) for r in rows}
+        return self._cache.get("skills", load)
+
+    @staticmethod
+    def _skill_config(row: dict) -> SkillConfig:
         data = dict(row)
         data["config"] = json.loads(data.get("config", "{}"))
         return SkillConfig(**data)
 
+    def get_skill_config(self, name: str) -> SkillConfig | None:
+        row = self._skill_rows().get(name)
+        if row is None:
+            return None
+        return self._skill_config(row)
+
     def save_skill_config(self, config: SkillConfig) -> None:
         with self._get_conn() as conn:
             conn.execute(
@@ -203,25 +1177,16 @@ class Database:
             )
 
     def list_skill_configs(self) -> list[SkillConfig]:
-        with self._get_conn() as conn:
-            rows = conn.execute("SELECT * FROM skills").fetchall()
-        results = []
-        for r in rows:
-            data = dict(r)
-            data["config"] = json.loads(data.get("config", "{}"))
-            results.append(SkillConfig(**data))
-        return results
+        return [self._skill_config(row) for row in self._skill_rows().values()]
 
     # --- App Config ---
 
     def get_config(self, key: str, default: str = "") -> str:
-        with self._get_conn() as conn:
-            row = conn.execute(
-                "SELECT value FROM app_config WHERE key = ?", (key,)
-            ).fetchone()
-        if row is None:
-            return default
-        return row["value"]
+        def load():
+            with self._get_conn() as conn:
+                rows = conn.execute("SELECT key, value FROM app_config").fetchall()
+            return {r["key"]: r["value"] for r in rows}
+        return self._cache.get("app_config", load).get(key, default)
 
     def set_config(self, key: str, value: str) -> None:
         with self._get_conn() as conn:
@@ -232,15 +1197,16 @@ class Database:
 
     # --- Blog Styles ---
 
+    def _blog_styles(self) -> dict[str, str]:
+        def load():
+            with self._get_conn() as conn:
+                rows = conn.execute("SELECT key, content FROM blog_styles").fetchall()
+            return {row["key"]: row["content"] for row in rows}
+        return self._cache.get("blog_styles", load)
+
     def get_blog_style(self, key: str) -> str | None:
         """키(common 또는 카테고리명)에 해당하는 스타일 텍스트 반환."""
-        with self._get_conn() as conn:
-            row = conn.execute(
-                "SELECT content FROM blog_styles WHERE key = ?", (key,)
-            ).fetchone()
-        if row is None:
-            return None
-        return row["content"]
+        return self._blog_styles().get(key)
 
     def save_blog_style(self, key: str, content: str) -> None:
         """스타일 텍스트를 DB에 저장 (upsert)."""
@@ -253,9 +1219,7 @@ class Database:
 
     def list_blog_styles(self) -> dict[str, str]:
         """모든 블로그 스타일을 {key: content} 형태로 반환."""
-        with self._get_conn() as conn:
-            rows = conn.execute("SELECT key, content FROM blog_styles").fetchall()
-        return {row["key"]: row["content"] for row in rows}
+        return dict(self._blog_styles())
 
     def delete_blog_style(self, key: str) -> bool:
         """스타일 삭제. common은 삭제 불가."""
@@ -269,15 +1233,167 @@ class Database:
 
     def save_blog_post(
         self, post_id: str, title: str, category: str, content: str,
-        pub_date: str = "", link: str = "",
+        pub_date: str = "", link: str = "", blog_id: str = DEFAULT_BLOG_ID,
     ) -> None:
+        self.save_blog_posts([{
+            "post_id": post_id,
+            "title": title,
+            "category": category,
+            "content": content,
+            "pub_date": pub_date,
+            "link": link,
+            "blog_id": blog_id,
+        }])
+
+    def save_blog_posts(self, posts: list[dict]) -> int:
+        """여러 글을 한 트랜잭션으로 저장 (upsert). 저장한 글 수 반환.
+
+        각 dict는 post_id, title, category, content 키가 필수이고
+        pub_date, link, blog_id(기본: DEFAULT_BLOG_ID)는 선택.
+        published_at은 pub_date에서 계산하며, pub_date가 없으면 처음 저장한 시각을 쓴다
+        (pub_date 없이 다시 저장해도 기존 값을 유지해 수정한 글이 최신 글로 올라가지 않게).
+        """
+        if not posts:
+            return 0
+        now = int(time.time())
+        rows = [
+            (
+                p["post_id"], p.get("blog_id") or DEFAULT_BLOG_ID, p["title"], p["category"],
+                p["content"], len(p["content"]), p.get("pub_date", ""),
+                pub_date_to_ts(p.get("pub_date", "")) or now,
+                p.get("link", ""), content_hash(p["content"]),
+            )
+            for p in posts
+        ]
+        # INSERT OR REPLACE는 행을 지웠다 다시 넣으면서 삭제 트리거를 건너뛰므로
+        # (전문 검색 인덱스가 어긋남) ON CONFLICT로 갱신한다.
+        terms = self._has_table("blog_posts_terms")
+        post_ids = [row[0] for row in rows]
         with self._get_conn() as conn:
-            conn.execute(
-                "INSERT OR REPLACE INTO blog_posts "
-                "(post_id, title, category, content, pub_date, link, crawled_at) "
-                "VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)",
-                (post_id, title, category, content, pub_date, link),
+            before = {}
+            if terms:
+                conn.execute("BEGIN IMMEDIATE")
+                before = _indexed_posts(conn, post_ids)
+            conn.executemany(
+                "INSERT INTO blog_posts "
+                "(post_id, blog_id, title, category, content, content_length, pub_date, "
+                "published_at, link, content_hash, crawled_at, verified_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP) "
+                "ON CONFLICT(post_id) DO UPDATE SET blog_id = excluded.blog_id, "
+                "title = excluded.title, category = excluded.category, "
+                "content = excluded.content, content_length = excluded.content_length, "
+                "pub_date = excluded.pub_date, "
+                "published_at = CASE WHEN excluded.pub_date IN ('', blog_posts.pub_date) "
+                "THEN blog_posts.published_at ELSE excluded.published_at END, "
+                "link = excluded.link, content_hash = excluded.content_hash, "
+                "crawled_at = excluded.crawled_at, verified_at = excluded.verified_at",
+                rows,
             )
+            if terms:
+                _sync_terms(conn, before, _indexed_posts(conn, post_ids))
+        return len(rows)
+
+    def existing_blog_post_ids(self, post_ids: list[str]) -> set[str]:
+        """주어진 post_id 중 이미 저장된 것만 반환 (쿼리 한 번, 변수 한도 넘으면 나눠서)."""
+        found: set[str] = set()
+        ids = list(dict.fromkeys(pid for pid in post_ids if pid))
+        with self._get_conn() as conn:
+            for start in range(0, len(ids), _MAX_SQL_VARS):
+                chunk = ids[start:start + _MAX_SQL_VARS]
+                rows = conn.execute(
+                    "SELECT post_id FROM blog_posts WHERE post_id IN ({})".format(
+                        ",".join("?" for _ in chunk)
+                    ),
+                    chunk,
+                ).fetchall()
+                found.update(row["post_id"] for row in rows)
+        return found
+
+    def update_blog_post_contents(
+        self, rows: list[tuple[str, str, str]], verified: bool = False,
+    ) -> None:
+        """(post_id, content, category) 목록을 한 트랜잭션으로 갱신 (재추출/재확인용).
+
+        verified=True면 원문을 방금 다시 확인한 것이므로 verified_at도 갱신한다.
+        """
+        if not rows:
+            return
+        verified_sql = ", verified_at = CURRENT_TIMESTAMP" if verified else ""
+        terms = self._has_table("blog_posts_terms")
+        post_ids = [post_id for post_id, _content, _category in rows]
+        with self._get_conn() as conn:
+            before = {}
+            if terms:
+                conn.execute("BEGIN IMMEDIATE")
+                before = _indexed_posts(conn, post_ids)
+            conn.executemany(
+                "UPDATE blog_posts SET content = ?, content_length = ?, category = ?, "
+                f"content_hash = ?{verified_sql} WHERE post_id = ?",
+                [
+                    (content, len(content), category, content_hash(content), post_id)
+                    for post_id, content, category in rows
+                ],
+            )
+            if terms:
+                _sync_terms(conn, before, _indexed_posts(conn, post_ids))
+
+    def delete_blog_posts(self, post_ids: list[str]) -> int:
+        """글 삭제 (BM25 색인에서도 뺀다). 삭제한 글 수 반환."""
+        terms = self._has_table("blog_posts_terms")
+        deleted = 0
+        with self._get_conn() as conn:
+            before = {}
+            if terms:
+                conn.execute("BEGIN IMMEDIATE")
+                before = _indexed_posts(conn, post_ids)
+            for start in range(0, len(post_ids), _MAX_SQL_VARS):
+                chunk = post_ids[start:start + _MAX_SQL_VARS]
+                deleted += conn.execute(
+                    "DELETE FROM blog_posts WHERE post_id IN ({})".format(
+                        ",".join("?" for _ in chunk)
+                    ),
+                    chunk,
+                ).rowcount
+            if terms:
+                _sync_terms(conn, before, {})
+        return deleted
+
+    def delete_blog_posts_by_category(self, category: str) -> int:
+        """카테고리의 글을 모두 삭제 (BM25 색인에서도 뺀다). 삭제한 글 수 반환."""
+        terms = self._has_table("blog_posts_terms")
+        with self._get_conn() as conn:
+            before = {}
+            if terms:
+                conn.execute("BEGIN IMMEDIATE")
+                rows = conn.execute(
+                    "SELECT post_id FROM blog_posts WHERE category = ?", (category,)
+                ).fetchall()
+                before = _indexed_posts(conn, [row["post_id"] for row in rows])
+            deleted = conn.execute(
+                "DELETE FROM blog_posts WHERE category = ?", (category,)
+            ).rowcount
+            if terms:
+                _sync_terms(conn, before, {})
+        return deleted
+
+    def mark_blog_posts_verified(self, post_ids: list[str]) -> None:
+        """원문을 다시 확인했지만 바뀌지 않은 글의 verified_at만 갱신."""
+        if not post_ids:
+            return
+        with self._get_conn() as conn:
+            conn.executemany(
+                "UPDATE blog_posts SET verified_at = CURRENT_TIMESTAMP WHERE post_id = ?",
+                [(pid,) for pid in post_ids],
+            )
+
+    def list_blog_post_verify_info(self) -> list[dict]:
+        """재확인 순서를 정하기 위한 가벼운 목록 (본문 제외)."""
+        with self._get_conn() as conn:
+            rows = conn.execute(
+                "SELECT post_id, blog_id, category, pub_date, published_at, content_hash, "
+                "verified_at FROM blog_posts"
+            ).fetchall()
+        return [dict(r) for r in rows]
 
     def get_blog_post(self, post_id: str) -> dict | None:
         with self._get_conn() as conn:
@@ -286,28 +1402,528 @@ class Database:
             ).fetchone()
         return dict(row) if row else None
 
-    def list_blog_posts(self, category: str = "") -> list[dict]:
+    def _select_blog_posts(
+        self, columns: str, category: str, blog_id: str,
+        limit: int | None = None, offset: int = 0,
+    ) -> list[dict]:
+        where = []
+        params: list = []
+        if category:
+            where.append("category = ?")
+            params.append(category)
+        if blog_id:
+            where.append("blog_id = ?")
+            params.append(blog_id)
+        sql = f"SELECT {columns} FROM blog_posts"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY published_at DESC"
+        if limit is not None:
+            sql += " LIMIT ? OFFSET ?"
+            params.extend([limit, offset])
         with self._get_conn() as conn:
-            if category:
+            rows = conn.execute(sql, params).fetchall()
+        return [dict(r) for r in rows]
+
+    def list_blog_posts(self, category: str = "", blog_id: str = "") -> list[dict]:
+        """저장된 글 목록 (본문 포함). category/blog_id가 비어 있으면 해당 조건으로 거르지 않는다.
+
+        본문이 필요 없으면 list_blog_post_meta + get_blog_post_contents를 쓴다.
+        """
+        return self._select_blog_posts("*", category, blog_id)
+
+    def list_blog_post_meta(
+        self, category: str = "", blog_id: str = "",
+        limit: int | None = None, offset: int = 0,
+    ) -> list[dict]:
+        """본문 없이 목록용 정보만 (post_id, title, category, published_at, content_length 등).
+
+        최신 발행순. limit/offset으로 페이지 단위 조회.
+        """
+        return self._select_blog_posts(BLOG_POST_META_COLUMNS, category, blog_id, limit, offset)
+
+    def get_blog_post_contents(self, post_ids: list[str]) -> dict[str, str]:
+        """{post_id: 본문}을 한 번에 조회 (화면에 그리거나 프롬프트에 넣을 글만)."""
+        contents: dict[str, str] = {}
+        ids = list(dict.fromkeys(pid for pid in post_ids if pid))
+        with self._get_conn() as conn:
+            for start in range(0, len(ids), _MAX_SQL_VARS):
+                chunk = ids[start:start + _MAX_SQL_VARS]
                 rows = conn.execute(
-                    "SELECT * FROM blog_posts WHERE category = ? ORDER BY pub_date DESC",
+                    "SELECT post_id, content FROM blog_posts WHERE post_id IN ({})".format(
+                        ",".join("?" for _ in chunk)
+                    ),
+                    chunk,
+                ).fetchall()
+                contents.update((row["post_id"], row["content"]) for row in rows)
+        return contents
+
+    def count_blog_posts(self, blog_id: str = "", category: str = "") -> int:
+        """저장된 글 수. 블로그 조건이 없으면 corpus_stats에서 바로 읽는다."""
+        with self._get_conn() as conn:
+            if blog_id:
+                sql = "SELECT COUNT(*) as cnt FROM blog_posts WHERE blog_id = ?"
+                params: list = [blog_id]
+                if category:
+                    sql += " AND category = ?"
+                    params.append(category)
+                row = conn.execute(sql, params).fetchone()
+            elif category:
+                row = conn.execute(
+                    "SELECT coalesce(sum(post_count), 0) as cnt FROM corpus_stats "
+                    "WHERE category = ?",
                     (category,),
+                ).fetchone()
+            else:
+                row = conn.execute(
+                    "SELECT coalesce(sum(post_count), 0) as cnt FROM corpus_stats"
+                ).fetchone()
+        return row["cnt"]
+
+    def get_blog_post_categories(self, blog_id: str = "") -> list[str]:
+        """크롤링된 포스트의 카테고리 목록."""
+        with self._get_conn() as conn:
+            if blog_id:
+                rows = conn.execute(
+                    "SELECT DISTINCT category FROM blog_posts "
+                    "WHERE category != '' AND blog_id = ? ORDER BY category",
+                    (blog_id,),
                 ).fetchall()
             else:
                 rows = conn.execute(
-                    "SELECT * FROM blog_posts ORDER BY pub_date DESC"
+                    "SELECT category FROM corpus_stats WHERE category != '' ORDER BY category"
                 ).fetchall()
-        return [dict(r) for r in rows]
+        return [row["category"] for row in rows]
 
-    def count_blog_posts(self) -> int:
+    def get_corpus_stats(self) -> dict:
+        """전체/카테고리별 글 수, 글자 수, 최신 발행 시각 (트리거로 유지되는 집계를 읽기만 함).
+
+        categories에는 카테고리가 빈 글은 빠지지만 전체 합계에는 포함된다.
+        """
         with self._get_conn() as conn:
-            row = conn.execute("SELECT COUNT(*) as cnt FROM blog_posts").fetchone()
-        return row["cnt"]
+            rows = [dict(r) for r in conn.execute(
+                "SELECT * FROM corpus_stats ORDER BY category"
+            ).fetchall()]
+        return {
+            "total_posts": sum(r["post_count"] for r in rows),
+            "total_chars": sum(r["total_chars"] for r in rows),
+            "newest_published_at": max((r["newest_published_at"] for r in rows), default=0),
+            "categories": [r for r in rows if r["category"]],
+        }
 
-    def get_blog_post_categories(self) -> list[str]:
-        """크롤링된 포스트의 카테고리 목록."""
+    def _has_table(self, name: str) -> bool:
+        """테이블 존재 여부 (FTS 테이블은 SQLite 빌드에 따라 없을 수 있다). 인스턴스별 캐시."""
+        if name not in self._table_exists:
+            with self._get_conn() as conn:
+                row = conn.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+                ).fetchone()
+            self._table_exists[name] = row is not None
+        return self._table_exists[name]
+
+    def rank_blog_posts(
+        self,
+        query: str,
+        limit: int,
+        categories: list[str] | None = None,
+        blog_id: str = "",
+    ) -> list[dict] | None:
+        """query와 관련도(BM25) 높은 순으로 글 메타데이터 (본문 제외, score 포함).
+
+        categories가 있으면 그 카테고리들 안에서만, blog_id가 있으면 그 블로그 글만 찾는다.
+        너무 흔한 용어(BM25_MAX_DF_RATIO 초과)는 빼고, 남은 용어 중 드문 것부터
+        BM25_MAX_QUERY_TERMS개만 써서 글 수가 많아도 읽는 색인 양을 제한한다.
+        색인이 없으면 None, 맞는 글이 없으면 빈 목록.
+        """
+        if not self._has_table("blog_posts_terms"):
+            return None
+        terms = query_terms(query)
+        if not terms or limit <= 0:
+            return []
+
+        total = self.count_blog_posts()
         with self._get_conn() as conn:
+            placeholders = ",".join("?" * len(terms))
+            doc_freq = dict(conn.execute(
+                f"SELECT term, doc FROM blog_posts_terms_vocab WHERE term IN ({placeholders})",
+                terms,
+            ).fetchall())
+            found = sorted((doc_freq[t], t) for t in terms if doc_freq.get(t))
+            if not found:
+                return []
+            selected = [t for df, t in found if df <= total * BM25_MAX_DF_RATIO]
+            if not selected:
+                selected = [t for _df, t in found[:2]]  # 모두 흔한 용어면 그중 드문 것으로
+            selected = selected[:BM25_MAX_QUERY_TERMS]
+
+            match = "{title body} : (" + " OR ".join(
+                '"{}"'.format(t.replace('"', '""')) for t in selected
+            ) + ")"
+            if categories:
+                match += " AND scope : (" + " OR ".join(
+                    scope_token("c", c) for c in categories
+                ) + ")"
+            if blog_id:
+                match += f" AND scope : {scope_token('b', blog_id)}"
+
+            weights = ", ".join(str(w) for w in BM25_WEIGHTS)
             rows = conn.execute(
-                "SELECT DISTINCT category FROM blog_posts WHERE category != '' ORDER BY category"
+                f"SELECT {', '.join('p.' + c for c in BLOG_POST_META_COLUMNS.split(', '))}, "
+                "-r.score AS score "
+                "FROM (SELECT rowid, bm25(blog_posts_terms, "
+                f"{weights}) AS score FROM blog_posts_terms "
+                "WHERE blog_posts_terms MATCH ? ORDER BY score LIMIT ?) r "
+                "JOIN blog_posts p ON p.rowid = r.rowid ORDER BY r.score",
+                (match, limit),
             ).fetchall()
-        return [row["category"] for row in rows]
+        return [dict(r) for r in rows]
+
+    def search_blog_posts(
+        self, query: str, category: str = "", limit: int = 20, blog_id: str = "",
+    ) -> list[dict]:
+        """제목/본문 전문 검색. 관련도 순으로 본문 대신 snippet(검색어 주변 발췌)을 반환.
+
+        공백으로 나눈 검색어를 모두 포함하는 글만 찾는다. 3글자 이상 검색어는 FTS5
+        trigram 인덱스로, (3글자 이상이 없으면) 2글자 검색어는 용어 색인(blog_posts_terms,
+        한글은 음절 bigram이라 부분 일치, 그 밖에는 단어 일치)으로 후보를 찾고 bm25(제목
+        가중치 10배)로 순위를 매긴다. 나머지 검색어와 카테고리/블로그는 같은 쿼리에서
+        LIMIT 전에 거르므로, 조건에 맞는 글은 오래된 글이라도 빠지지 않는다.
+        정렬은 FTS5의 rank(bm25로 설정)에 맡겨 FTS5가 순위대로 내주는 글을 limit개만 읽는다.
+        색인으로 찾을 수 없는 검색어(1글자 등)만 있으면 최신 글부터 LIKE로 훑는다.
+        """
+        terms = [t for t in query.split() if t]
+        if not terms:
+            return []
+
+        index = ""
+        indexed: list[str] = []
+        long_terms = [t for t in terms if len(t) >= FTS_MIN_TERM_LENGTH]
+        if long_terms and self._has_table("blog_posts_fts"):
+            index, indexed = "blog_posts_fts", long_terms
+            match = _fts_query(long_terms)
+            weights = "10.0, 1.0"
+        elif self._has_table("blog_posts_terms"):
+            short_terms = {
+                t: _index_term(t) for t in terms if len(t) < FTS_MIN_TERM_LENGTH
+            }
+            indexed = [t for t, term in short_terms.items() if term]
+            if indexed:
+                index = "blog_posts_terms"
+                match = "{title body} : " + _fts_query([short_terms[t] for t in indexed])
+                if category:
+                    match += f" AND scope : {scope_token('c', category)}"
+                if blog_id:
+                    match += f" AND scope : {scope_token('b', blog_id)}"
+                weights = "10.0, 1.0, 0.0"
+        like_terms = [t for t in terms if t not in indexed]
+
+        where = []
+        params: list = []
+        for term in like_terms:
+            where.append("(b.title LIKE ? ESCAPE '\\' OR b.content LIKE ? ESCAPE '\\')")
+            params.extend([_like_pattern(term)] * 2)
+
+        # snippet()은 정렬 전에 일치하는 모든 행에서 계산되므로 SQL에서는 순위만 매기고,
+        # 발췌는 반환할 limit개 글에 대해서만 만든다.
+        columns = "b.post_id, b.blog_id, b.title, b.category, b.pub_date, b.link, b.content"
+        if index:
+            # blog_posts_terms는 카테고리/블로그를 MATCH의 scope 토큰으로 이미 걸렀다
+            if index == "blog_posts_fts":
+                if category:
+                    where.append("b.category = ?")
+                    params.append(category)
+                if blog_id:
+                    where.append("b.blog_id = ?")
+                    params.append(blog_id)
+            sql = (
+                f"SELECT {columns}, {index}.rank AS score FROM {index} "
+                f"JOIN blog_posts b ON b.rowid = {index}.rowid "
+                f"WHERE {index} MATCH ? AND {index}.rank MATCH ? "
+                f"{''.join(' AND ' + w for w in where)} "
+                f"ORDER BY {index}.rank LIMIT ?"
+            )
+            params = [match, f"bm25({weights})"] + params + [limit]
+        else:
+            if category:
+                where.append("b.category = ?")
+                params.append(category)
+            if blog_id:
+                where.append("b.blog_id = ?")
+                params.append(blog_id)
+            sql = (
+                f"SELECT {columns}, 0.0 AS score FROM blog_posts b "
+                f"WHERE {' AND '.join(where)} ORDER BY b.published_at DESC LIMIT ?"
+            )
+            params.append(limit)
+        with self._get_conn() as conn:
+            rows = [dict(r) for r in conn.execute(sql, params).fetchall()]
+        for r in rows:
+            r["snippet"] = _make_snippet(r.pop("content"), terms)
+        return rows
+
+    # --- Search Cache (웹 검색 응답) ---
+
+    def get_search_cache(self, key: str, ttl_seconds: float) -> dict | None:
+        """ttl_seconds 안에 저장된 응답이면 반환하고 사용 시각/횟수를 갱신 (LRU용)."""
+        now = time.time()
+        with self._get_conn() as conn:
+            row = conn.execute(
+                "SELECT response FROM search_cache WHERE key = ? AND created_at >= ?",
+                (key, now - ttl_seconds),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE search_cache SET last_used_at = ?, hit_count = hit_count + 1 "
+                "WHERE key = ?",
+                (now, key),
+            )
+        return json.loads(zlib.decompress(row["response"]).decode("utf-8"))
+
+    def save_search_cache(
+        self, key: str, query: str, response: dict, ttl_seconds: float, max_entries: int,
+    ) -> None:
+        """응답 저장 후 만료된 항목과 최근 사용순 max_entries개를 넘는 항목 삭제."""
+        now = time.time()
+        data = zlib.compress(
+            json.dumps(response, ensure_ascii=False).encode("utf-8"), BLOB_COMPRESS_LEVEL
+        )
+        with self._get_conn() as conn:
+            conn.execute(
+                "INSERT INTO search_cache (key, query, response, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET query = excluded.query, "
+                "response = excluded.response, created_at = excluded.created_at, "
+                "last_used_at = excluded.last_used_at, hit_count = 0",
+                (key, query, data, now, now),
+            )
+            conn.execute("DELETE FROM search_cache WHERE created_at < ?", (now - ttl_seconds,))
+            conn.execute(
+                "DELETE FROM search_cache WHERE key IN ("
+                "SELECT key FROM search_cache ORDER BY last_used_at DESC LIMIT -1 OFFSET ?)",
+                (max(1, max_entries),),
+            )
+
+    # --- Maintenance (백업/정리) ---
+
+    def prune_blobs(self) -> int:
+        """어떤 생성 기록도 참조하지 않는 blob 삭제. 삭제한 수 반환.
+
+        save_generation이 blob 저장과 행 추가를 한 트랜잭션으로 하므로, 쓰기 잠금을 잡은
+        상태에서 참조를 모으면 방금 저장된 blob을 지우는 일이 없다.
+        """
+        conn = self._get_conn()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            referenced = set()
+            for row in conn.execute("SELECT prompt_refs, context_refs FROM generations"):
+                referenced.update(_ref_hashes(row["prompt_refs"]))
+                referenced.update(_ref_hashes(row["context_refs"]))
+            orphans = [
+                row[0] for row in conn.execute("SELECT hash FROM blobs")
+                if row[0] not in referenced
+            ]
+            conn.executemany("DELETE FROM blobs WHERE hash = ?", [(h,) for h in orphans])
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        return len(orphans)
+
+    def file_stats(self) -> dict:
+        """DB 파일 크기와 빈 페이지 수."""
+        conn = self._get_conn()
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+        freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        wal = Path(f"{self._db_path}-wal")
+        return {
+            "size_bytes": page_size * page_count,
+            "free_bytes": page_size * freelist,
+            "wal_bytes": wal.stat().st_size if wal.exists() else 0,
+            "auto_vacuum": conn.execute("PRAGMA auto_vacuum").fetchone()[0],
+        }
+
+    def enable_incremental_vacuum(self) -> bool:
+        """auto_vacuum=INCREMENTAL로 전환. 기존 DB는 전체 VACUUM이 한 번 필요하다.
+
+        이미 켜져 있으면 False. 전환 중에는 다른 연결의 쓰기가 막힌다.
+        """
+        conn = self._get_conn()
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2:
+            return False
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        return True
+
+    def incremental_vacuum(self, pages_per_step: int = VACUUM_PAGES_PER_STEP) -> int:
+        """빈 페이지를 pages_per_step씩 파일에서 잘라낸다. 줄어든 바이트 수 반환.
+
+        단계마다 커밋하므로 쓰기 잠금은 짧게만 잡는다. auto_vacuum이 INCREMENTAL이 아니면
+        아무것도 하지 않는다.
+        """
+        conn = self._get_conn()
+        if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+            return 0
+        before = self.file_stats()["size_bytes"]
+        free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        while free > 0:
+            with conn:
+                conn.execute(f"PRAGMA incremental_vacuum({int(pages_per_step)})").fetchall()
+            remaining = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if remaining >= free:
+                break
+            free = remaining
+        conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+        return before - self.file_stats()["size_bytes"]
+
+    def backup(
+        self,
+        dest: Path,
+        pages_per_step: int = BACKUP_PAGES_PER_STEP,
+        progress_callback=None,
+    ) -> None:
+        """온라인 백업 API로 dest에 스냅샷을 만든다.
+
+        원본 연결에서 읽기 트랜잭션을 열어 둔 채 복사하므로 그 시점의 일관된 스냅샷이
+        만들어진다. 그렇지 않으면 다른 연결이 쓸 때마다 백업이 처음부터 다시 시작돼
+        크롤링 중에는 끝나지 않을 수 있다. WAL이라 그동안에도 쓰기는 막히지 않는다.
+        progress_callback(remaining, total)은 단계마다 호출된다.
+        """
+        progress = None
+        if progress_callback:
+            progress = lambda _status, remaining, total: progress_callback(remaining, total)
+        src = sqlite3.connect(str(self._db_path), timeout=5, isolation_level=None)
+        dst = sqlite3.connect(str(dest))
+        try:
+            src.execute("BEGIN")
+            src.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone()
+            src.backup(dst, pages=pages_per_step, progress=progress, sleep=BACKUP_STEP_SLEEP)
+            src.execute("COMMIT")
+            # 복사본도 WAL 모드가 되므로 -wal/-shm 없이 파일 하나로 남도록 되돌린다
+            dst.execute("PRAGMA journal_mode = DELETE")
+        finally:
+            dst.close()
+            src.close()
+
+    # --- Blog Sources (크롤링 대상 블로그) ---
+
+    def list_blog_sources(self, enabled_only: bool = False) -> list[dict]:
+        """크롤링 대상 블로그 목록 (우선순위 높은 순)."""
+        sql = "SELECT * FROM blog_sources"
+        if enabled_only:
+            sql += " WHERE enabled = 1"
+        with self._get_conn() as conn:
+            rows = conn.execute(sql + " ORDER BY priority DESC, blog_id").fetchall()
+        return [dict(r) for r in rows]
+
+    def get_blog_source(self, blog_id: str) -> dict | None:
+        with self._get_conn() as conn:
+            row = conn.execute(
+                "SELECT * FROM blog_sources WHERE blog_id = ?", (blog_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def save_blog_source(
+        self, blog_id: str, name: str = "", priority: int = 0,
+        refresh_interval_min: int = 60, enabled: bool = True,
+    ) -> None:
+        """블로그 추가/수정 (upsert). 마지막 크롤링 시각은 유지한다."""
+        with self._get_conn() as conn:
+            conn.execute(
+                "INSERT INTO blog_sources (blog_id, name, priority, refresh_interval_min, enabled) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(blog_id) DO UPDATE SET name = excluded.name, "
+                "priority = excluded.priority, "
+                "refresh_interval_min = excluded.refresh_interval_min, "
+                "enabled = excluded.enabled",
+                (blog_id, name or blog_id, priority, refresh_interval_min, enabled),
+            )
+
+    def delete_blog_source(self, blog_id: str) -> bool:
+        """크롤링 대상에서만 제외 (이미 저장된 글은 유지)."""
+        with self._get_conn() as conn:
+            cursor = conn.execute("DELETE FROM blog_sources WHERE blog_id = ?", (blog_id,))
+        return cursor.rowcount > 0
+
+    def mark_blog_source_crawled(self, blog_id: str) -> None:
+        with self._get_conn() as conn:
+            conn.execute(
+                "UPDATE blog_sources SET last_crawled_at = CURRENT_TIMESTAMP WHERE blog_id = ?",
+                (blog_id,),
+            )
+
+    # --- Crawl State (RSS 증분 갱신) ---
+
+    def get_crawl_state(self, blog_id: str) -> dict | None:
+        """RSS 조건부 요청용 ETag/Last-Modified와 마지막으로 본 최신 pubDate(epoch),
+        그때 저장되어 있던 글 수(post_count)."""
+        with self._get_conn() as conn:
+            row = conn.execute(
+                "SELECT * FROM crawl_state WHERE blog_id = ?", (blog_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def save_crawl_state(
+        self, blog_id: str, etag: str | None, last_modified: str | None, newest_pub_ts: int,
+        post_count: int = 0,
+    ) -> None:
+        with self._get_conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO crawl_state "
+                "(blog_id, etag, last_modified, newest_pub_ts, post_count, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)",
+                (blog_id, etag, last_modified, newest_pub_ts, post_count),
+            )
+
+    def get_archive_checkpoint(self, blog_id: str) -> dict | None:
+        """아카이브 크롤링 재개 지점 (다음에 가져올 글 목록 페이지)."""
+        with self._get_conn() as conn:
+            row = conn.execute(
+                "SELECT * FROM archive_checkpoints WHERE blog_id = ?", (blog_id,)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def save_archive_checkpoint(
+        self, blog_id: str, next_page: int, total_count: int, done: bool = False,
+    ) -> None:
+        with self._get_conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO archive_checkpoints "
+                "(blog_id, next_page, total_count, done, updated_at) "
+                "VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)",
+                (blog_id, next_page, total_count, done),
+            )
+
+    # --- Crawl Jobs (백그라운드 크롤링 진행 상황) ---
+
+    def create_crawl_job(self) -> int:
+        with self._get_conn() as conn:
+            cursor = conn.execute("INSERT INTO crawl_jobs (status) VALUES ('running')")
+        return cursor.lastrowid
+
+    def update_crawl_job(self, job_id: int, message: str) -> None:
+        """진행 메시지 갱신 (updated_at은 작업이 살아 있다는 신호로도 쓰인다)."""
+        with self._get_conn() as conn:
+            conn.execute(
+                "UPDATE crawl_jobs SET message = ?, updated_at = CURRENT_TIMESTAMP WHERE id = ?",
+                (message, job_id),
+            )
+
+    def finish_crawl_job(
+        self, job_id: int, success: int = 0, skip: int = 0, fail: int = 0,
+        error: str | None = None,
+    ) -> None:
+        with self._get_conn() as conn:
+            conn.execute(
+                "UPDATE crawl_jobs SET status = ?, success = ?, skip = ?, fail = ?, error = ?, "
+                "updated_at = CURRENT_TIMESTAMP, finished_at = CURRENT_TIMESTAMP WHERE id = ?",
+                ("failed" if error else "done", success, skip, fail, error, job_id),
+            )
+
+    def get_latest_crawl_job(self) -> dict | None:
+        with self._get_conn() as conn:
+            row = conn.execute(
+                "SELECT * FROM crawl_jobs ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+        return dict(row) if row else None
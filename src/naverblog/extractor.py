@@ -0,0 +1,301 @@
+"""PostView HTML 본문 추출기 - 단일 패스 이벤트 방식.
+
+구조 태그(div/p/li/h*/body)와 주석만 앞에서부터 한 번 훑으며
+(.*? 백트래킹이나 구간 복사 없이) SmartEditor(se-main-container)의 문단/제목/목록
+위치를 모으고, 본문이 닫히면 블록 단위로 내보낸다. 같은 패스에서 SE 본문,
+구형 에디터(postViewArea), <body>의 시작/끝 위치도 기록해 두므로 대체 전략을 쓸 때
+문서를 다시 훑지 않는다.
+
+html.parser.HTMLParser는 태그마다 파이썬 코드가 여러 번 돌아 큰 글에서 정규식보다
+느리기 때문에, 구조 태그 경계만 컴파일된 정규식으로 찾고 이벤트 처리는 직접 한다.
+파이썬 루프는 토큰마다 비용이 드므로 연달아 나오는 div 태그들은 한 토큰으로 묶고,
+블록 텍스트는 위치만 기록했다가 <span>, <b>, <br> 같은 인라인 태그 제거와 공백 정리를
+SE 본문 전체에 한 번씩만 돌린다. scripts/bench_extract.py로 이전 정규식 구현과 비교한다.
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from html import unescape
+
+SE_CONTAINER_CLASS = "se-main-container"
+SE_PARAGRAPH_CLASS = "se-text-paragraph"
+SE_FOOTER_COMMENT = "SE_DOC_FOOTER"
+POST_VIEW_AREA_ID = "postViewArea"
+POST_VIEW_AREA_END_COMMENT = "//"
+
+SE_FALLBACK_LIMIT = 100000  # 문단이 없는 SE 본문에서 사용할 최대 길이
+BODY_MIN_LENGTH = 200
+BODY_MAX_LENGTH = 8000
+
+# 모든 대안이 "<"로 시작해야 정규식 엔진이 "<"가 아닌 위치를 빠르게 건너뛴다
+_TOKEN_RE = re.compile(
+    r"<(?:!--(.*?)-->"
+    r"|((?:/div\s*|div\b[^>]*)>(?:\s*<(?:/div\s*|div\b[^>]*)>)*\s*)"  # 연속된 div 태그 묶음
+    r"|(/?)(p|li|h[1-6]|body|script|style)\b([^>]*)>)",
+    re.DOTALL | re.IGNORECASE,
+)
+_DIV_RE = re.compile(r"<(/?)div\b([^>]*)>", re.IGNORECASE)
+_RAW_TEXT_END_RE = {
+    "script": re.compile(r"</script\s*>", re.IGNORECASE),
+    "style": re.compile(r"</style\s*>", re.IGNORECASE),
+}
+_ID_RE = re.compile(r"""\bid\s*=\s*["']?([^"'\s>]+)""", re.IGNORECASE)
+_SCRIPT_STYLE_RE = re.compile(r"<(script|style)[^>]*>.*?</\1\s*>", re.DOTALL | re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]*>")
+_BR_RE = re.compile(r"<br\b[^>]*>", re.IGNORECASE)
+# 공백 정리 정규식도 리터럴로 시작하게 써서 빠르게 건너뛰게 하고,
+# 공백 하나는 그대로 두어 치환 횟수를 줄인다 ("\n{3,}", "[ \t]+"와 결과는 같다)
+_MULTI_NEWLINE_RE = re.compile(r"\n\n\n+")
+_SPACES_RE = re.compile(r" [ \t]+|\t[ \t]*")
+_ZERO_WIDTH_CHARS = ("\u200b", "\ufeff")
+_BLOCK_SEP = "\x00"  # 블록 원문을 이어 붙일 때의 구분자
+
+
+def normalize_text(text: str) -> str:
+    """strip_html과 같은 공백 정리 (3줄 이상 개행 축소, 연속 공백 축소)."""
+    for ch in _ZERO_WIDTH_CHARS:
+        if ch in text:
+            text = text.replace(ch, "")
+    text = _MULTI_NEWLINE_RE.sub("\n\n", text)
+    text = _SPACES_RE.sub(" ", text)
+    return text.strip()
+
+
+def _clean(raw: str, tag_sep: str) -> str:
+    """태그 제거(tag_sep으로 치환) + 엔티티 복원 + 공백 정리."""
+    if "<" in raw:
+        raw = _TAG_RE.sub(tag_sep, raw)
+    if "&" in raw:
+        raw = unescape(raw)
+    return normalize_text(raw)
+
+
+def _clean_region(raw: str) -> str:
+    """대체 전략용: strip_html처럼 script/style을 버리고 태그 경계를 개행으로 바꾼다."""
+    lowered = raw.lower()
+    if "<script" in lowered or "<style" in lowered:
+        raw = _SCRIPT_STYLE_RE.sub("", raw)
+    return _clean(raw, "\n")
+
+
+class PostContentExtractor:
+    """PostView HTML을 한 번만 훑으며 본문 후보를 모은다.
+
+    루프에서는 se-main-container 안 문단/제목/목록의 텍스트 구간 위치만 기록한다.
+    본문이 닫히면 구간들을 구분자로 이어 인라인 태그 제거/엔티티 복원/공백 정리를
+    전체에 한 번씩 돌린 뒤 블록별로 나눠 blocks에 담는다.
+    문단이 없을 때 쓸 SE 본문/postViewArea/<body>는 위치만 기록해 두고 result()에서 자른다.
+    """
+
+    def __init__(self, html: str):
+        if _BLOCK_SEP in html:  # 구분자와 겹치지 않게 (HTML에 NUL이 올 일은 없다)
+            html = html.replace(_BLOCK_SEP, "")
+        self.html = html
+        self.blocks: list[str] = []
+        self.se_span: tuple[int, int] | None = None
+        self.view_area_span: tuple[int, int] | None = None
+        self.body_span: tuple[int, int] | None = None
+        # 스캔 상태 (div 깊이와 SE 본문/postViewArea가 열린 깊이, -1: 밖)
+        self._div_depth = 0
+        self._se_depth = -1
+        self._se_start = -1
+        self._se_end = -1
+        self._view_depth = -1
+        self._view_start = -1
+
+    def events(self) -> Iterator[str]:
+        """문서를 훑고 SE 본문이 닫히면 블록을 순서대로 내보낸다."""
+        html = self.html
+        search = _TOKEN_RE.search
+        # 열린 블록들의 [현재 텍스트 구간 시작, 앞서 끝난 구간 위치들, 태그] (목록 안 문단이면 중첩)
+        stack: list[list] = []
+        spans: list[int] = []  # 완성된 블록들의 구간 (시작, 끝, ...), 블록 사이에는 -1
+        body_start = -1
+        div_depth = 0
+        se_depth = -1  # _scan_divs가 바꾸는 self 상태를 루프에서는 지역 변수로 들고 있는다
+
+        pos = 0
+        # SE 문서면 컨테이너 앞부분(head, 메뉴 등)은 결과에 쓰이지 않으므로 건너뛴다
+        marker = html.find(SE_CONTAINER_CLASS)
+        if marker >= 0:
+            pos = max(0, html.rfind("<", 0, marker))
+
+        while True:
+            m = search(html, pos)
+            if m is None:
+                break
+            start = m.start()
+            pos = m.end()
+            comment, divs, closing, tag, attrs = m.groups()
+
+            if divs is not None:
+                # div 태그는 블록 안에 있어도 나중에 인라인 태그와 함께 지워지므로 깊이만 센다.
+                # SE 본문 안에서 묶음이 컨테이너를 닫을 수 없으면 개수만 세고 넘어간다
+                if se_depth >= 0:
+                    lowered = m.group().lower()
+                    closes = lowered.count("</div")
+                    if div_depth - closes >= se_depth:
+                        div_depth += lowered.count("<div") - closes
+                        continue
+                self._div_depth = div_depth
+                se_close = self._scan_divs(start, pos)
+                div_depth = self._div_depth
+                se_depth = self._se_depth
+                if se_close >= 0:
+                    # SE 본문이 끝나면 결과가 정해지므로 나머지 문서는 보지 않는다
+                    self._close_all(stack, spans, se_close)
+                    self.se_span = (self._se_start, self._se_end if self._se_end >= 0 else se_close)
+                    yield from self._emit(spans)
+                    return
+                continue
+
+            if tag is None:  # 주석
+                if stack:  # 주석은 본문이 아니므로 구간을 끊는다
+                    stack[-1][1] += (stack[-1][0], start)
+                    stack[-1][0] = pos
+                if (
+                    se_depth >= 0 and self._se_end < 0
+                    and comment.lstrip().startswith(SE_FOOTER_COMMENT)
+                ):
+                    self._se_end = start
+                elif self._view_depth >= 0 and comment.strip() == POST_VIEW_AREA_END_COMMENT:
+                    self.view_area_span = (self._view_start, start)
+                    self._view_depth = -1
+                continue
+
+            tag = tag.lower()
+            if tag in _RAW_TEXT_END_RE:
+                if not closing:
+                    end = _RAW_TEXT_END_RE[tag].search(html, pos)
+                    pos = end.end() if end else len(html)
+                    if stack:
+                        stack[-1][1] += (stack[-1][0], start)
+                        stack[-1][0] = pos
+            elif tag == "body":
+                if not closing and body_start < 0:
+                    body_start = pos
+                elif closing and body_start >= 0:
+                    self.body_span = (body_start, start)
+            elif se_depth >= 0:
+                if not closing:
+                    if tag != "p" or SE_PARAGRAPH_CLASS in attrs:
+                        if stack:  # 바깥 블록은 안쪽 블록이 닫힐 때까지 멈춘다
+                            stack[-1][1] += (stack[-1][0], start)
+                        stack.append([pos, [], tag])
+                else:
+                    # 같은 태그의 블록까지 닫는다 (넣지 않은 <p>의 </p>처럼 짝이 없으면 무시)
+                    depth = len(stack) - 1
+                    while depth >= 0 and stack[depth][2] != tag:
+                        depth -= 1
+                    if depth >= 0:
+                        self._close_all(stack, spans, start, depth)
+                        if stack:
+                            stack[-1][0] = pos
+
+        # 닫히지 않은 채 문서가 끝난 경우
+        self._close_all(stack, spans, len(html))
+        yield from self._emit(spans)
+        if self._se_depth >= 0:
+            self.se_span = (self._se_start, self._se_end if self._se_end >= 0 else len(html))
+        if self._view_depth >= 0:
+            self.view_area_span = (self._view_start, len(html))
+
+    def _scan_divs(self, start: int, end: int) -> int:
+        """div 태그 묶음을 하나씩 처리. SE 본문이 닫히면 닫는 태그 위치, 아니면 -1."""
+        for m in _DIV_RE.finditer(self.html, start, end):
+            if m.group(1):
+                if self._div_depth == self._se_depth:
+                    return m.start()
+                if self._div_depth == self._view_depth:
+                    self.view_area_span = (self._view_start, m.start())
+                    self._view_depth = -1
+                if self._div_depth > 0:
+                    self._div_depth -= 1
+                continue
+            self._div_depth += 1
+            attrs = m.group(2)
+            if self._se_depth < 0 and SE_CONTAINER_CLASS in attrs:
+                self._se_depth = self._div_depth
+                self._se_start = m.end()
+            elif (
+                self._view_depth < 0 and self.view_area_span is None
+                and POST_VIEW_AREA_ID in attrs
+            ):
+                id_match = _ID_RE.search(attrs)
+                if id_match and id_match.group(1) == POST_VIEW_AREA_ID:
+                    self._view_depth = self._div_depth
+                    self._view_start = m.end()
+        return -1
+
+    @staticmethod
+    def _close_all(stack: list[list], spans: list[int], end: int, depth: int = 0) -> None:
+        """stack[depth:]의 블록들을 end에서 닫는다 (안쪽부터)."""
+        if len(stack) > depth:  # 텍스트를 모으던 것은 맨 안쪽 블록뿐, 바깥 블록들은 이미 구간이 끊겨 있다
+            stack[-1][1] += (stack[-1][0], end)
+        while len(stack) > depth:
+            spans += stack.pop()[1]
+            spans.append(-1)
+
+    def _emit(self, spans: list[int]) -> Iterator[str]:
+        """블록 구간들을 이어 한 번에 정리한 뒤 블록별로 나눠 내보낸다."""
+        if not spans:
+            return
+        html = self.html
+        pieces = []
+        i = 0
+        n = len(spans)
+        while i < n:
+            start = spans[i]
+            if start < 0:
+                pieces.append(_BLOCK_SEP)
+                i += 1
+            else:
+                pieces.append(html[start:spans[i + 1]])
+                i += 2
+        raw = "".join(pieces)
+        if "<" in raw:
+            raw = _BR_RE.sub("\n", raw)
+            raw = _TAG_RE.sub("", raw)
+        if "&" in raw:
+            raw = unescape(raw)
+        for text in normalize_text(raw).split(_BLOCK_SEP):
+            text = text.strip()
+            if text:
+                self.blocks.append(text)
+                yield text
+
+    def result(self) -> str:
+        if self.blocks:
+            return "\n".join(self.blocks)
+        html = self.html
+        if self.se_span:
+            start, end = self.se_span
+            return _clean_region(html[start:min(end, start + SE_FALLBACK_LIMIT)])
+        if self.view_area_span:
+            start, end = self.view_area_span
+            return _clean_region(html[start:end])
+        if self.body_span:
+            start, end = self.body_span
+            text = _clean_region(html[start:end])
+            if len(text) > BODY_MIN_LENGTH:
+                return text[:BODY_MAX_LENGTH]
+        return ""
+
+
+def iter_post_blocks(html: str) -> Iterator[str]:
+    """SE 본문 블록(문단/제목/목록)을 문서 순서대로 하나씩 내보낸다."""
+    yield from PostContentExtractor(html).events()
+
+
+def extract_post_content(html: str) -> str:
+    """PostView HTML에서 본문 텍스트 추출.
+
+    SE 문단 → SE 본문 전체 → postViewArea → <body> 순으로 사용하며,
+    모두 한 번의 패스로 모은 결과에서 고른다.
+    """
+    extractor = PostContentExtractor(html)
+    for _block in extractor.events():
+        pass
+    return extractor.result()
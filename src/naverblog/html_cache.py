@@ -0,0 +1,124 @@
+"""크롤링한 PostView 원본 HTML 저장소.
+
+추출 로직을 고친 뒤 네이버에 다시 요청하지 않고 본문을 재추출할 수 있도록,
+APP_DIR/html_cache/<post_id>/<sha256 앞 16자>.html.gz 형태로 압축 저장한다.
+글마다 최신 버전 하나만 남기고, 전체 크기가 max_bytes를 넘으면 오래 쓰지 않은
+파일부터 지운다.
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import os
+import re
+import threading
+from pathlib import Path
+
+from naverblog.config import HTML_CACHE_DIR, HTML_CACHE_MAX_BYTES
+
+_POST_ID_RE = re.compile(r"^[\w-]+$")
+_SUFFIX = ".html.gz"
+
+
+def content_hash(html: str) -> str:
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()[:16]
+
+
+def read_html(path: Path) -> str:
+    """캐시 파일 하나를 읽어 문자열로 반환 (프로세스 풀 워커에서도 사용)."""
+    return gzip.decompress(path.read_bytes()).decode("utf-8")
+
+
+class HtmlCache:
+    """post_id + 내용 해시로 찾는 압축 HTML 저장소 (스레드 안전)."""
+
+    def __init__(self, root: Path = HTML_CACHE_DIR, max_bytes: int = HTML_CACHE_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._total_bytes: int | None = None  # 처음 쓸 때 한 번 계산
+
+    def _post_dir(self, post_id: str) -> Path:
+        if not _POST_ID_RE.match(post_id):
+            raise ValueError(f"잘못된 post_id: {post_id!r}")
+        return self.root / post_id
+
+    def _files(self) -> list[Path]:
+        if not self.root.exists():
+            return []
+        return list(self.root.glob(f"*/*{_SUFFIX}"))
+
+    def put(self, post_id: str, html: str) -> str:
+        """HTML 저장 후 내용 해시 반환. 같은 내용이면 파일을 다시 쓰지 않는다."""
+        digest = content_hash(html)
+        post_dir = self._post_dir(post_id)
+        path = post_dir / f"{digest}{_SUFFIX}"
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(f.stat().st_size for f in self._files())
+            if path.exists():
+                os.utime(path)
+                return digest
+
+            post_dir.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(gzip.compress(html.encode("utf-8"), compresslevel=6))
+            os.replace(tmp, path)
+            self._total_bytes += path.stat().st_size
+
+            # 같은 글의 이전 버전 정리
+            for old in post_dir.glob(f"*{_SUFFIX}"):
+                if old != path:
+                    self._total_bytes -= old.stat().st_size
+                    old.unlink(missing_ok=True)
+
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+        return digest
+
+    def _evict(self) -> None:
+        """오래 쓰지 않은 파일부터 지워 max_bytes의 90% 이하로 맞춘다. (_lock 보유 상태)"""
+        target = int(self.max_bytes * 0.9)
+        entries = []
+        for f in self._files():
+            st = f.stat()
+            entries.append((st.st_mtime, st.st_size, f))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _mtime, size, f in entries:
+            if total <= target:
+                break
+            f.unlink(missing_ok=True)
+            total -= size
+            try:
+                f.parent.rmdir()
+            except OSError:
+                pass
+        self._total_bytes = total
+
+    def path(self, post_id: str) -> Path | None:
+        """글의 최신 캐시 파일 경로 (없으면 None)."""
+        post_dir = self._post_dir(post_id)
+        if not post_dir.exists():
+            return None
+        files = sorted(post_dir.glob(f"*{_SUFFIX}"), key=lambda f: f.stat().st_mtime)
+        return files[-1] if files else None
+
+    def get(self, post_id: str) -> str | None:
+        path = self.path(post_id)
+        if path is None:
+            return None
+        os.utime(path)
+        return read_html(path)
+
+    def post_ids(self) -> list[str]:
+        if not self.root.exists():
+            return []
+        return sorted(d.name for d in self.root.iterdir() if d.is_dir())
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(f.stat().st_size for f in self._files())
+            return self._total_bytes
@@ -0,0 +1,228 @@
+"""크롤러용 HTTP 세션 - keep-alive 커넥션 풀.
+
+urlopen은 요청마다 새 TCP/TLS 연결을 맺으므로, 같은 호스트(blog.naver.com 등)에
+반복 요청할 때는 http.client 연결을 호스트별로 재사용한다.
+"""
+
+from __future__ import annotations
+
+import gzip
+import http.client
+import threading
+import zlib
+from dataclasses import dataclass, field
+from urllib.parse import urljoin, urlsplit
+
+DEFAULT_USER_AGENT = (
+    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+)
+MAX_CONNECTIONS_PER_HOST = 4
+MAX_REDIRECTS = 5
+
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+# 서버가 유휴 keep-alive 연결을 끊었을 때 나는 예외 - 새 연결로 한 번 재시도
+_STALE_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+class HTTPError(Exception):
+    """4xx/5xx 응답."""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"HTTP {status}: {url}")
+        self.status = status
+        self.url = url
+
+
+@dataclass
+class HTTPResponse:
+    """본문까지 모두 읽은(압축 해제된) 응답."""
+
+    status: int
+    url: str
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)  # 키는 소문자
+
+    @property
+    def charset(self) -> str:
+        content_type = self.headers.get("content-type", "")
+        for part in content_type.split(";")[1:]:
+            key, _, value = part.strip().partition("=")
+            if key.lower() == "charset" and value:
+                return value.strip("\"'")
+        return "utf-8"
+
+    def text(self) -> str:
+        try:
+            return self.body.decode(self.charset, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+def _decode_body(body: bytes, encoding: str) -> bytes:
+    encoding = encoding.strip().lower()
+    if encoding in ("gzip", "x-gzip"):
+        return gzip.decompress(body)
+    if encoding == "deflate":
+        # zlib 래퍼가 있는 경우와 raw deflate 모두 허용
+        try:
+            return zlib.decompress(body)
+        except zlib.error:
+            return zlib.decompress(body, -zlib.MAX_WBITS)
+    return body
+
+
+class _HostPool:
+    """한 호스트에 대한 유휴 연결 목록 + 동시 연결 수 제한."""
+
+    def __init__(self, scheme: str, host: str, port: int | None, max_connections: int):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.slots = threading.BoundedSemaphore(max_connections)
+        self.idle: list[http.client.HTTPConnection] = []
+        self.lock = threading.Lock()
+
+    def new_connection(self, timeout: float) -> http.client.HTTPConnection:
+        if self.scheme == "https":
+            return http.client.HTTPSConnection(self.host, self.port, timeout=timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=timeout)
+
+    def checkout(self, timeout: float) -> tuple[http.client.HTTPConnection, bool]:
+        """(연결, 재사용 여부) 반환. 호출 전에 slots를 획득해야 한다."""
+        with self.lock:
+            if self.idle:
+                conn = self.idle.pop()
+                conn.timeout = timeout
+                if conn.sock is not None:
+                    conn.sock.settimeout(timeout)
+                return conn, True
+        return self.new_connection(timeout), False
+
+    def checkin(self, conn: http.client.HTTPConnection) -> None:
+        with self.lock:
+            self.idle.append(conn)
+
+    def close(self) -> None:
+        with self.lock:
+            for conn in self.idle:
+                conn.close()
+            self.idle.clear()
+
+
+class HTTPSession:
+    """스레드 안전한 keep-alive HTTP 클라이언트.
+
+    호스트별로 최대 max_per_host개의 연결을 유지하고, gzip/deflate 응답을
+    자동으로 풀며, 리다이렉트를 따라간다.
+    """
+
+    def __init__(
+        self,
+        max_per_host: int = MAX_CONNECTIONS_PER_HOST,
+        timeout: float = 15,
+        headers: dict[str, str] | None = None,
+    ):
+        self.max_per_host = max(1, max_per_host)
+        self.timeout = timeout
+        self.headers = {
+            "User-Agent": DEFAULT_USER_AGENT,
+            "Accept-Encoding": "gzip, deflate",
+            "Connection": "keep-alive",
+        }
+        if headers:
+            self.headers.update(headers)
+        self._pools: dict[tuple[str, str, int | None], _HostPool] = {}
+        self._lock = threading.Lock()
+
+    def _pool_for(self, scheme: str, host: str, port: int | None) -> _HostPool:
+        key = (scheme, host, port)
+        with self._lock:
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = _HostPool(scheme, host, port, self.max_per_host)
+        return pool
+
+    def get(
+        self, url: str, headers: dict[str, str] | None = None, timeout: float | None = None,
+    ) -> HTTPResponse:
+        """GET 요청. 리다이렉트는 따라가고, 상태 코드 검사는 호출자가 한다."""
+        request_headers = {**self.headers, **(headers or {})}
+        timeout = self.timeout if timeout is None else timeout
+        for _ in range(MAX_REDIRECTS + 1):
+            response = self._request_once(url, request_headers, timeout)
+            location = response.headers.get("location")
+            if response.status not in _REDIRECT_STATUSES or not location:
+                return response
+            url = urljoin(url, location)
+        raise HTTPError(response.status, url)
+
+    def _request_once(self, url: str, headers: dict[str, str], timeout: float) -> HTTPResponse:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower() or "http"
+        if scheme not in ("http", "https"):
+            raise ValueError(f"지원하지 않는 URL: {url}")
+        pool = self._pool_for(scheme, parts.hostname or "", parts.port)
+        path = parts.path or "/"
+        if parts.query:
+            path += "?" + parts.query
+
+        with pool.slots:
+            conn, reused = pool.checkout(timeout)
+            try:
+                try:
+                    resp = self._send(conn, path, headers)
+                except _STALE_ERRORS:
+                    conn.close()
+                    if not reused:
+                        raise
+                    conn = pool.new_connection(timeout)
+                    resp = self._send(conn, path, headers)
+                body = resp.read()
+            except BaseException:
+                conn.close()
+                raise
+
+            if resp.will_close:
+                conn.close()
+            else:
+                pool.checkin(conn)
+
+        response_headers = {k.lower(): v for k, v in resp.getheaders()}
+        encoding = response_headers.get("content-encoding", "")
+        if encoding:
+            body = _decode_body(body, encoding)
+        return HTTPResponse(status=resp.status, url=url, body=body, headers=response_headers)
+
+    @staticmethod
+    def _send(
+        conn: http.client.HTTPConnection, path: str, headers: dict[str, str],
+    ) -> http.client.HTTPResponse:
+        conn.request("GET", path, headers=headers)
+        return conn.getresponse()
+
+    def close(self) -> None:
+        with self._lock:
+            pools = list(self._pools.values())
+            self._pools.clear()
+        for pool in pools:
+            pool.close()
+
+
+_default_session: HTTPSession | None = None
+_default_lock = threading.Lock()
+
+
+def get_session() -> HTTPSession:
+    """프로세스 공용 세션 (처음 호출 시 생성)."""
+    global _default_session
+    with _default_lock:
+        if _default_session is None:
+            _default_session = HTTPSession()
+        return _default_session
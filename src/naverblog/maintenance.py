@@ -0,0 +1,141 @@
+"""DB 유지보수: 온라인 백업, 오래된 생성 기록 보관, 증분 VACUUM.
+
+생성 기록은 시간이 지날수록 쌓이기만 하므로 보관 기간이 지난 기록은 gzip JSONL로
+옮기고 DB에서 지운다. 빈 페이지는 증분 VACUUM으로 조금씩 돌려주고, 백업은 정리가
+끝난 뒤에 만들어 DB 크기와 백업 시간이 기록 수에 따라 계속 늘지 않게 한다.
+"""
+
+from __future__ import annotations
+
+import gzip
+import os
+from collections.abc import Callable
+from datetime import datetime
+from pathlib import Path
+
+from naverblog.config import ARCHIVE_DIR, BACKUP_DIR, BACKUP_KEEP, GENERATION_RETENTION_DAYS
+from naverblog.database import Database
+
+ARCHIVE_BATCH_SIZE = 200
+BACKUP_PREFIX = "naverblog-"
+BACKUP_SUFFIX = ".db"
+
+
+def _timestamp() -> str:
+    return datetime.now().strftime("%Y%m%d-%H%M%S")
+
+
+def backup_database(
+    db: Database,
+    backup_dir: Path = BACKUP_DIR,
+    keep: int = BACKUP_KEEP,
+    progress_callback: Callable[[str], None] | None = None,
+) -> Path:
+    """backup_dir에 스냅샷을 만들고 최근 keep개만 남긴다. 새 백업 경로 반환.
+
+    임시 파일에 복사한 뒤 이름을 바꾸므로 중간에 실패해도 반쯤 쓴 백업이 남지 않는다.
+    """
+    backup_dir.mkdir(parents=True, exist_ok=True)
+    stamp = _timestamp()
+    dest = backup_dir / f"{BACKUP_PREFIX}{stamp}{BACKUP_SUFFIX}"
+    seq = 1
+    while dest.exists():  # 같은 초에 다시 실행한 경우
+        dest = backup_dir / f"{BACKUP_PREFIX}{stamp}-{seq}{BACKUP_SUFFIX}"
+        seq += 1
+    partial = dest.with_name(dest.name + ".partial")
+    partial.unlink(missing_ok=True)
+
+    def on_step(remaining: int, total: int) -> None:
+        if progress_callback and total:
+            progress_callback(f"백업 중... {total - remaining}/{total} 페이지")
+
+    try:
+        db.backup(partial, progress_callback=on_step)
+        os.replace(partial, dest)
+    except BaseException:
+        partial.unlink(missing_ok=True)
+        raise
+
+    backups = sorted(
+        backup_dir.glob(f"{BACKUP_PREFIX}*{BACKUP_SUFFIX}"), key=lambda p: p.stat().st_mtime,
+    )
+    for old in backups[:-keep] if keep > 0 else []:
+        old.unlink(missing_ok=True)
+        if progress_callback:
+            progress_callback(f"오래된 백업 삭제: {old.name}")
+    return dest
+
+
+def archive_generations(
+    db: Database,
+    older_than_days: int = GENERATION_RETENTION_DAYS,
+    archive_dir: Path = ARCHIVE_DIR,
+    batch_size: int = ARCHIVE_BATCH_SIZE,
+    progress_callback: Callable[[str], None] | None = None,
+) -> dict:
+    """older_than_days일보다 오래된 생성 기록을 gzip JSONL로 옮기고 DB에서 삭제.
+
+    배치마다 gzip 멤버 하나를 이어 붙여 디스크에 기록(fsync)한 뒤에 그 배치를 지운다.
+    이어 붙인 gzip 멤버는 하나의 gzip 파일로 읽히므로 `gzip -dc`로 그대로 볼 수 있고,
+    중간에 멈춰도 이미 지운 기록은 파일에 남아 있다.
+    반환: {"archived": 수, "path": 파일 경로 또는 None, "pruned_blobs": 수}
+    """
+    path = None
+    archived = 0
+    while True:
+        batch = db.list_generations_older_than(older_than_days, limit=batch_size)
+        if not batch:
+            break
+        if path is None:
+            archive_dir.mkdir(parents=True, exist_ok=True)
+            path = archive_dir / f"generations-{_timestamp()}.jsonl.gz"
+        with open(path, "ab") as raw:
+            with gzip.GzipFile(fileobj=raw, mode="wb") as gz:
+                for gen in batch:
+                    gz.write((gen.model_dump_json() + "\n").encode("utf-8"))
+            raw.flush()
+            os.fsync(raw.fileno())
+        archived += db.delete_generations([gen.id for gen in batch])
+        if progress_callback:
+            progress_callback(f"생성 기록 보관 중... {archived}개")
+
+    pruned = db.prune_blobs() if archived else 0
+    return {"archived": archived, "path": path, "pruned_blobs": pruned}
+
+
+def compact_database(
+    db: Database,
+    enable: bool = False,
+    progress_callback: Callable[[str], None] | None = None,
+) -> int:
+    """빈 페이지를 증분 VACUUM으로 돌려준다. 줄어든 바이트 수 반환.
+
+    auto_vacuum이 꺼진 기존 DB는 enable=True일 때만 전체 VACUUM으로 한 번 전환한다
+    (DB 크기만큼 시간이 걸리고 그동안 쓰기가 막힌다).
+    """
+    if enable:
+        before = db.file_stats()["size_bytes"]
+        if db.enable_incremental_vacuum():
+            if progress_callback:
+                progress_callback("auto_vacuum=INCREMENTAL로 전환 (전체 VACUUM)")
+            return before - db.file_stats()["size_bytes"]
+    elif db.file_stats()["auto_vacuum"] != 2 and progress_callback:
+        progress_callback("auto_vacuum이 꺼져 있어 증분 VACUUM을 건너뜀 (--enable-vacuum으로 전환)")
+    return db.incremental_vacuum()
+
+
+def run_maintenance(
+    db: Database,
+    retention_days: int = GENERATION_RETENTION_DAYS,
+    keep_backups: int = BACKUP_KEEP,
+    backup: bool = True,
+    progress_callback: Callable[[str], None] | None = None,
+) -> dict:
+    """보관 → blob 정리 → 증분 VACUUM → 백업 순으로 한 번에 실행."""
+    result = archive_generations(db, retention_days, progress_callback=progress_callback)
+    result["reclaimed_bytes"] = compact_database(db, progress_callback=progress_callback)
+    result["backup"] = (
+        backup_database(db, keep=keep_backups, progress_callback=progress_callback)
+        if backup else None
+    )
+    return result
@@ -23,18 +23,42 @@ class Persona(BaseModel):
     created_at: datetime = Field(default_factory=datetime.now)
 
 
+class SkillRun(BaseModel):
+    """생성 시 스킬 하나의 실행 결과 (소요 시간, 시간 초과/오류 여부)."""
+
+    name: str
+    status: str = "ok"  # ok | timeout | error
+    elapsed_ms: int = 0
+    error: str = ""
+
+
 class Generation(BaseModel):
     id: int | None = None
     topic: str
     persona_name: str
     llm_model: str
     post_type: PostType = PostType.GENERAL
+    category: str = ""
     search_context: str | None = None
     prompt_used: str = ""
     output_markdown: str = ""
     output_html: str = ""
     created_at: datetime = Field(default_factory=datetime.now)
     tags: list[str] = Field(default_factory=list)
+    skill_runs: list[SkillRun] = Field(default_factory=list)
+
+
+class GenerationSummary(BaseModel):
+    """히스토리 목록용 Generation (프롬프트/본문 같은 큰 컬럼 제외)."""
+
+    id: int
+    topic: str
+    persona_name: str
+    llm_model: str
+    post_type: PostType = PostType.GENERAL
+    category: str = ""
+    created_at: datetime
+    tags: list[str] = Field(default_factory=list)
 
 
 class SkillConfig(BaseModel):
@@ -7,9 +7,9 @@ import json
 from naverblog.database import Database
 from naverblog.formatter import markdown_to_naver_html
 from naverblog.llm import generate
-from naverblog.models import Generation, Persona, PostType
+from naverblog.models import Generation, Persona, PostType, SkillRun
 from naverblog.prompts.builder import build_system_prompt, build_user_prompt
-from naverblog.skills import SkillRegistry
+from naverblog.skills import SkillRegistry, execute_skills
 from naverblog.skills.base import SkillContext, SkillResult
 
 
@@ -24,10 +24,11 @@ def run_pipeline(
     skip_search: bool = False,
     category: str = "",
     ref_post_count: int = 3,
+    blog_id: str = "",
 ) -> Generation:
     """전체 파이프라인 실행.
 
-    1. 활성화된 스킬 실행 (검색 등)
+    1. 활성화된 스킬 실행 (검색 등, 독립적인 스킬은 병렬)
     2. 시스템 프롬프트 생성 (페르소나 기반)
     3. 사용자 프롬프트 생성 (주제 + 검색 결과 + 글 유형)
     4. LLM 호출
@@ -40,17 +41,21 @@ def run_pipeline(
         persona_name=persona.name,
         persona_prompt=persona.system_prompt,
         category=category,
+        blog_id=blog_id,
         db=db,
         ref_post_count=ref_post_count,
     )
-    skill_results: dict[str, SkillResult] = {}
-
-    for skill in skill_registry.get_enabled():
-        if skip_search and skill.name == "search":
-            continue
-        result = skill.execute(skill_context)
-        skill_results[skill.name] = result
-        skill_context.previous_results = skill_results
+    skills = [
+        skill for skill in skill_registry.get_enabled()
+        if not (skip_search and skill.name == "search")
+    ]
+    # 서로 의존하지 않는 스킬은 동시에 실행 (결과 순서는 등록 순서 그대로)
+    # 스킬마다 제한 시간이 있어 느린 외부 호출(검색 등)은 스킵 결과로 대체된다
+    skill_results: dict[str, SkillResult] = execute_skills(
+        skills,
+        skill_context,
+        timeouts={skill.name: skill_registry.get_timeout(skill.name) for skill in skills},
+    )
 
     # 2-3. 프롬프트 빌드
     system_prompt = build_system_prompt(persona)
@@ -77,6 +82,7 @@ def run_pipeline(
         persona_name=persona.name,
         llm_model=model,
         post_type=post_type,
+        category=category,
         search_context=(
             json.dumps(
                 {k: v.raw for k, v in skill_results.items()},
@@ -88,6 +94,10 @@ def run_pipeline(
         prompt_used=f"[SYSTEM]\n{system_prompt}\n\n[USER]\n{user_prompt}",
         output_markdown=output_markdown,
         output_html=output_html,
+        skill_runs=[
+            SkillRun(name=name, status=r.status, elapsed_ms=r.elapsed_ms, error=r.error)
+            for name, r in skill_results.items()
+        ],
     )
     generation = db.save_generation(generation)
 
@@ -2,12 +2,25 @@
 
 from __future__ import annotations
 
+import dataclasses
 import importlib
 import pkgutil
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
 
 from naverblog.models import SkillConfig
-from naverblog.skills.base import SkillBase
+from naverblog.skills.base import SkillBase, SkillContext, SkillResult
+
+
+# 스킬 하나에 주는 시간(초). SkillConfig.config["timeout"]으로 스킬별로 바꾸며 0이면 제한 없음.
+DEFAULT_SKILL_TIMEOUT = 20.0
+# 스킬 실행 스레드 수. 시간 초과로 버려진 스킬도 끝날 때까지 자리를 차지하므로 여유 있게.
+SKILL_MAX_WORKERS = 8
+
+_executor: ThreadPoolExecutor | None = None
+_executor_lock = threading.Lock()
 
 
 class SkillRegistry:
@@ -49,6 +62,16 @@ class SkillRegistry:
                 enabled.append(skill)
         return enabled
 
+    def get_timeout(self, name: str) -> float | None:
+        """스킬 실행 제한 시간(초). None이면 제한 없음."""
+        cfg = self._db.get_skill_config(name)
+        timeout = cfg.config.get("timeout", DEFAULT_SKILL_TIMEOUT) if cfg else DEFAULT_SKILL_TIMEOUT
+        try:
+            timeout = float(timeout)
+        except (TypeError, ValueError):
+            timeout = DEFAULT_SKILL_TIMEOUT
+        return timeout if timeout > 0 else None
+
     def get(self, name: str) -> SkillBase | None:
         return self._skills.get(name)
 
@@ -66,3 +89,122 @@ class SkillRegistry:
         if cfg:
             cfg.enabled = False
             self._db.save_skill_config(cfg)
+
+
+def _resolve_dependencies(skills: list[SkillBase]) -> dict[str, set[str]]:
+    """스킬별로 먼저 끝나야 하는 스킬 이름 (이번 실행에 없는 스킬은 무시)."""
+    names = [skill.name for skill in skills]
+    deps = {}
+    for i, skill in enumerate(skills):
+        declared = skill.depends_on
+        if declared is None:
+            deps[skill.name] = set(names[:i])
+        else:
+            deps[skill.name] = {name for name in declared if name in names and name != skill.name}
+    return deps
+
+
+def _degraded_result(
+    skill: SkillBase, status: str, reason: str, elapsed: float,
+) -> SkillResult:
+    """시간 초과/오류로 결과를 얻지 못한 스킬 대신 쓰는 결과 (프롬프트에는 스킵 문구만)."""
+    return SkillResult(
+        skill_name=skill.name,
+        data=skill.empty_data,
+        summary=f"[{skill.name} 스킵: {reason}]",
+        status=status,
+        elapsed_ms=int(elapsed * 1000),
+        error=reason,
+    )
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """스킬 실행용 스레드 풀 (프로세스에 하나, 처음 쓸 때 생성).
+
+    작업 스레드가 유지되므로 스킬이 여는 스레드별 SQLite 연결도 생성마다 새로 만들지 않는다.
+    """
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=SKILL_MAX_WORKERS, thread_name_prefix="skill"
+            )
+        return _executor
+
+
+def _run_skill(
+    skill: SkillBase, context: SkillContext,
+) -> tuple[SkillResult | None, Exception | None, float]:
+    start = time.monotonic()
+    try:
+        result, error = skill.execute(context), None
+    except Exception as exc:
+        result, error = None, exc
+    return result, error, time.monotonic() - start
+
+
+def execute_skills(
+    skills: list[SkillBase],
+    context: SkillContext,
+    timeouts: dict[str, float | None] | None = None,
+) -> dict[str, SkillResult]:
+    """의존 관계(depends_on)에 따라 스킬을 공용 스레드 풀에서 실행.
+
+    의존하는 스킬이 모두 끝난 스킬부터 바로 제출하므로 서로 독립인 스킬(로컬 DB 조회와
+    웹 검색 등)은 동시에 돈다. 각 스킬의 previous_results에는 의존하는 스킬 결과만 들어간다.
+    제출한 때부터 timeouts[이름]초 안에 끝나지 않거나 예외가 난 스킬은 기다리지 않고
+    스킵 결과로 바꾼다 (작업은 강제로 멈출 수 없으므로 그대로 두고 늦게 온 결과는 버린다).
+    반환 dict는 완료 순서와 관계없이 skills 순서를 따른다 (프롬프트 구성이 매번 같도록).
+    """
+    if not skills:
+        return {}
+    timeouts = timeouts or {}
+    by_name = {skill.name: skill for skill in skills}
+    order = list(by_name)
+    deps = _resolve_dependencies(skills)
+    results: dict[str, SkillResult] = {}
+    pending = list(order)
+    running: dict[Future, tuple[str, float, float | None]] = {}  # → (이름, 시작, 마감)
+    executor = _get_executor()
+
+    while pending or running:
+        for name in [n for n in pending if deps[n] <= results.keys()]:
+            pending.remove(name)
+            start = time.monotonic()
+            timeout = timeouts.get(name)
+            deadline = start + timeout if timeout else None
+            skill_context = dataclasses.replace(
+                context,
+                previous_results={d: results[d] for d in order if d in deps[name]},
+                deadline=deadline,
+            )
+            future = executor.submit(_run_skill, by_name[name], skill_context)
+            running[future] = (name, start, deadline)
+        if not running:
+            raise ValueError(f"스킬 의존 관계에 순환이 있습니다: {', '.join(pending)}")
+
+        deadlines = [deadline for _, _, deadline in running.values() if deadline is not None]
+        wait_for = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+        finished, _ = wait(running, timeout=wait_for, return_when=FIRST_COMPLETED)
+        for future in finished:
+            name, _start, _deadline = running.pop(future)
+            result, error, elapsed = future.result()
+            if error is not None:
+                results[name] = _degraded_result(
+                    by_name[name], "error", f"오류 - {type(error).__name__}: {error}", elapsed
+                )
+            else:
+                result.elapsed_ms = int(elapsed * 1000)
+                results[name] = result
+
+        now = time.monotonic()
+        for future, (name, start, deadline) in list(running.items()):
+            if deadline is not None and now >= deadline:
+                del running[future]
+                results[name] = _degraded_result(
+                    by_name[name], "timeout", f"시간 초과 ({deadline - start:g}초)", now - start
+                )
+
+    ordered = {name: results[name] for name in order}
+    context.previous_results = ordered
+    return ordered
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any
@@ -15,9 +16,17 @@ class SkillContext:
     persona_name: str
     persona_prompt: str
     category: str = ""
+    blog_id: str = ""  # 레퍼런스/스타일을 가져올 블로그 (빈 문자열=전체 블로그)
     db: Any = None  # Database 인스턴스 (스킬에서 DB 접근용)
     ref_post_count: int = 3  # 레퍼런스 글 수 (0=전부)
     previous_results: dict[str, SkillResult] = field(default_factory=dict)
+    deadline: float | None = None  # time.monotonic() 기준 마감 시각 (None=제한 없음)
+
+    def time_left(self) -> float | None:
+        """마감까지 남은 초. 외부 호출의 timeout으로 넘겨 마감 뒤까지 붙잡히지 않게 한다."""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
 
 
 @dataclass
@@ -28,6 +37,9 @@ class SkillResult:
     data: Any
     summary: str
     raw: dict = field(default_factory=dict)
+    status: str = "ok"  # ok | timeout | error
+    elapsed_ms: int = 0
+    error: str = ""
 
 
 class SkillBase(ABC):
@@ -41,5 +53,21 @@ class SkillBase(ABC):
     @abstractmethod
     def description(self) -> str: ...
 
+    @property
+    def depends_on(self) -> tuple[str, ...] | None:
+        """previous_results로 결과를 받아야 하는 스킬 이름들.
+
+        ()이면 의존하는 스킬이 없어 다른 스킬과 동시에 실행된다.
+        None(기본값)이면 앞서 등록된 스킬이 모두 끝난 뒤 실행된다 (순차 실행 때와 같은 동작).
+        """
+        return None
+
+    @property
+    def empty_data(self) -> Any:
+        """결과가 없을 때의 data (시간 초과/오류로 스킵될 때 쓴다). execute가 돌려주는 data와
+        같은 타입/키로 맞춰 두어 data를 읽는 쪽이 스킵 여부를 따로 확인하지 않아도 되게 한다.
+        """
+        return {}
+
     @abstractmethod
     def execute(self, context: SkillContext) -> SkillResult: ...
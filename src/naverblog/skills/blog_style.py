@@ -1,11 +1,14 @@
 """블로그 스타일 분석 스킬 - byhur99 보보쌤 블로그 기반.
 
+다른 블로그(SkillContext.blog_id)를 고르면 카테고리 목록은 그 블로그에 저장된 글 기준으로 보여줍니다.
+
 스타일 데이터는 DB에 저장되며, 웹 UI에서 편집 가능.
 DB에 없으면 아래 기본값(DEFAULT_*)을 사용하고 자동으로 DB에 시드합니다.
 """
 
 from __future__ import annotations
 
+from naverblog.config import DEFAULT_BLOG_ID
 from naverblog.skills.base import SkillBase, SkillContext, SkillResult
 
 # ──────────────────────────────────────────────
@@ -191,6 +194,14 @@ class BlogStyleSkill(SkillBase):
     def description(self) -> str:
         return "보보쌤 블로그 스타일 가이드 (카테고리별 문체/구조 적용)"
 
+    @property
+    def depends_on(self) -> tuple[str, ...]:
+        return ()
+
+    @property
+    def empty_data(self) -> dict:
+        return {"blog_name": "", "blog_id": "", "category": "", "available_categories": []}
+
     def execute(self, context: SkillContext) -> SkillResult:
         category = getattr(context, "category", None) or ""
 
@@ -225,13 +236,20 @@ class BlogStyleSkill(SkillBase):
 
         summary = "\n".join(style_parts)
 
-        available = get_available_categories(db) if db else AVAILABLE_CATEGORIES
+        blog_id = getattr(context, "blog_id", None) or DEFAULT_BLOG_ID
+        blog_name = "의대 간 보보쌤의 공부 & 입시 연구소"
+        if blog_id != DEFAULT_BLOG_ID:
+            source = db.get_blog_source(blog_id) if db else None
+            blog_name = source["name"] if source else blog_id
+            available = db.get_blog_post_categories(blog_id) if db else []
+        else:
+            available = get_available_categories(db) if db else AVAILABLE_CATEGORIES
 
         return SkillResult(
             skill_name=self.name,
             data={
-                "blog_name": "의대 간 보보쌤의 공부 & 입시 연구소",
-                "blog_id": "byhur99",
+                "blog_name": blog_name,
+                "blog_id": blog_id,
                 "category": category,
                 "available_categories": available,
             },
@@ -1,7 +1,8 @@
 """레퍼런스 포스트 스킬 - 보보쌤의 기존 글을 참조 컨텍스트로 제공.
 
-DB에 크롤링된 실제 블로그 글 중 해당 카테고리의 글을 선별하여
-LLM 프롬프트에 주입합니다. 글 생성 시 실제 문체/구조를 참고합니다.
+DB에 크롤링된 실제 블로그 글 중 해당 카테고리에서 주제와 관련도(BM25)가 높은 글을
+선별하여 LLM 프롬프트에 주입합니다. 글 생성 시 실제 문체/구조를 참고합니다.
+순위는 blog_posts_terms 역색인으로 매기므로 본문은 고른 글만 읽습니다.
 """
 from __future__ import annotations
 
@@ -19,8 +20,17 @@ class ReferencePostsSkill(SkillBase):
     def description(self) -> str:
         return "보보쌤 기존 블로그 글 참조 (실제 글을 컨텍스트로 제공)"
 
+    @property
+    def depends_on(self) -> tuple[str, ...]:
+        return ()
+
+    @property
+    def empty_data(self) -> dict:
+        return {"posts": []}
+
     def execute(self, context: SkillContext) -> SkillResult:
         category = getattr(context, "category", None) or ""
+        blog_id = getattr(context, "blog_id", None) or ""
         db = getattr(context, "db", None)
         max_posts = getattr(context, "ref_post_count", 3) or 0
 
@@ -31,27 +41,48 @@ class ReferencePostsSkill(SkillBase):
                 summary="(DB 연결 없음 - 레퍼런스 스킵)",
             )
 
-        # 해당 카테고리의 글 가져오기
-        posts = []
-        if category:
-            posts = db.list_blog_posts(category=category)
+        topic = getattr(context, "topic", "") or ""
 
-        # 카테고리 매치가 없으면 부분 매치 시도
-        if not posts and category:
-            all_posts = db.list_blog_posts()
-            for p in all_posts:
-                if category in p["category"] or p["category"] in category:
-                    posts.append(p)
-
-        # 그래도 없으면 전체에서
-        if not posts:
-            posts = db.list_blog_posts()
+        # 대상 카테고리: 정확히 일치 → 부분 일치 → (없으면) 블로그 전체
+        categories = []
+        if category:
+            if db.count_blog_posts(blog_id, category):
+                categories = [category]
+            else:
+                categories = [
+                    c for c in db.get_blog_post_categories(blog_id)
+                    if category in c or c in category
+                ]
+        if categories:
+            total_available = sum(db.count_blog_posts(blog_id, c) for c in categories)
+        else:
+            total_available = db.count_blog_posts(blog_id)
 
-        # 글 수 제한 (0이면 전부)
         if max_posts > 0:
-            selected = posts[:max_posts]
+            # 주제와 관련도(BM25) 높은 글부터, 모자라면 최신 글로 채운다
+            ranked = db.rank_blog_posts(
+                topic, max_posts, categories=categories, blog_id=blog_id
+            ) or []
+            selected = list(ranked)
+            if len(selected) < max_posts:
+                chosen = {p["post_id"] for p in selected}
+                for c in categories or [""]:
+                    recent = db.list_blog_post_meta(
+                        category=c, blog_id=blog_id, limit=max_posts * 2
+                    )
+                    for p in recent:
+                        if len(selected) >= max_posts:
+                            break
+                        if p["post_id"] not in chosen:
+                            chosen.add(p["post_id"])
+                            selected.append(p)
+            ranking = "bm25" if ranked else "recent"
         else:
-            selected = posts
+            # 0이면 전부 (최신순)
+            selected = []
+            for c in categories or [""]:
+                selected.extend(db.list_blog_post_meta(category=c, blog_id=blog_id))
+            ranking = "recent"
 
         if not selected:
             return SkillResult(
@@ -78,10 +109,12 @@ class ReferencePostsSkill(SkillBase):
             "이 글들의 문체, 구조, 표현 방식을 참고하여 새 글을 작성하세요.\n"
         ]
 
+        contents = db.get_blog_post_contents([p["post_id"] for p in selected])
+
         post_data = []
         total_chars = 0
         for i, p in enumerate(selected, 1):
-            content = p["content"]
+            content = contents.get(p["post_id"], "")
             original_len = len(content)
             if len(content) > max_len:
                 content = content[:max_len] + "\n... (이하 생략)"
@@ -96,6 +129,7 @@ class ReferencePostsSkill(SkillBase):
                 "title": p["title"],
                 "category": p["category"],
                 "post_id": p["post_id"],
+                "score": round(p["score"], 3) if "score" in p else None,
                 "content_length": original_len,
                 "truncated_length": min(original_len, max_len),
             })
@@ -106,7 +140,8 @@ class ReferencePostsSkill(SkillBase):
             skill_name=self.name,
             data={
                 "posts": post_data,
-                "total_available": len(posts),
+                "total_available": total_available,
+                "ranking": ranking,
                 "selected_count": n,
                 "total_chars": total_chars,
                 "max_len_per_post": max_len,
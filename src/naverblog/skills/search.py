@@ -1,11 +1,188 @@
-"""Tavily 웹 검색 스킬."""
+"""Tavily 웹 검색 스킬.
+
+주제 하나만 검색하면 넓은 입시 주제에서 핵심 자료를 놓치기 쉬우므로, 카테고리/주제
+키워드에 맞는 템플릿으로 보조 검색어를 만들어 함께 검색하고(동시 실행), 결과를
+Reciprocal Rank Fusion으로 합친 뒤 같은 URL/같은 내용은 하나로 묶는다.
+
+같은 주제로 페르소나/글 유형만 바꿔 여러 번 생성하는 경우가 많으므로, 응답을
+정규화한 검색어 + 검색 옵션 기준으로 SQLite(search_cache)에 캐시해 네트워크 없이 재사용한다.
+캐시 기간과 최대 항목 수는 SkillConfig.config의 cache_ttl_hours/cache_max_entries로 바꾼다.
+"""
 
 from __future__ import annotations
 
+import hashlib
+import json
 import os
+import re
+import threading
+import unicodedata
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from urllib.parse import parse_qsl, urlencode, urlsplit
 
 from naverblog.skills.base import SkillBase, SkillContext, SkillResult
 
+# 원래 주제 검색 (요약 답변 포함)
+SEARCH_PARAMS = {
+    "search_depth": "advanced",
+    "topic": "general",
+    "max_results": 5,
+    "include_answer": True,
+}
+# 보조 검색어는 빠른 basic 검색으로 - 전체 소요 시간이 주제 검색 한 번과 비슷하도록
+SUB_QUERY_PARAMS = {
+    "search_depth": "basic",
+    "topic": "general",
+    "max_results": 5,
+    "include_answer": False,
+}
+DEFAULT_CACHE_TTL_HOURS = 24.0
+DEFAULT_CACHE_MAX_ENTRIES = 500
+
+MAX_SUB_QUERIES = 3
+MAX_MERGED_RESULTS = 8
+RESULT_CONTENT_CHARS = 400
+RRF_K = 60  # Reciprocal Rank Fusion 상수 (순위 차이의 영향 완화)
+
+# (카테고리/주제에 들어 있으면 적용할 키워드, 보조 검색어 템플릿). 위에서부터 차례로 채운다.
+QUERY_TEMPLATES: list[tuple[tuple[str, ...], tuple[str, ...]]] = [
+    (("면접",), ("{topic} 기출 질문", "{topic} 합격 후기")),
+    (("자기소개서", "자소서"), ("{topic} 작성 예시", "{topic} 합격 자소서")),
+    (("생기부", "학생부", "수시", "세특"), ("{topic} 학생부종합전형", "{topic} 세특 예시")),
+    (("의대", "의예"), ("{topic} 의대 입시 결과",)),
+    (("공부", "과목", "수능", "내신"), ("{topic} 공부법", "{topic} 기출 분석")),
+    (("학원", "과외"), ("{topic} 비용 후기",)),
+    (("입시", "전략", "로드맵", "설계", "전형"), ("{topic} 모집요강", "{topic} 입시 결과 분석")),
+]
+DEFAULT_TEMPLATES = ("{topic} {year}", "{topic} 입시 정보")
+
+_WHITESPACE_RE = re.compile(r"\s+")
+_TRACKING_PARAM_PREFIXES = ("utm_", "fbclid", "gclid")
+
+_clients: dict[str, object] = {}
+_clients_lock = threading.Lock()
+
+
+def normalize_query(query: str) -> str:
+    """캐시 키용 검색어 정규화 (전각/반각 통일, 대소문자 무시, 공백 정리)."""
+    query = unicodedata.normalize("NFKC", query).casefold()
+    return _WHITESPACE_RE.sub(" ", query).strip()
+
+
+def search_cache_key(query: str, params: dict) -> str:
+    payload = json.dumps(
+        {"query": normalize_query(query), **params}, ensure_ascii=False, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def expand_queries(topic: str, category: str = "", limit: int = MAX_SUB_QUERIES) -> list[str]:
+    """주제 + 템플릿으로 만든 보조 검색어 (주제가 맨 앞, 최대 1 + limit개).
+
+    템플릿이 붙이는 단어가 이미 주제에 모두 들어 있으면 건너뛴다.
+    """
+    topic = topic.strip()
+    haystack = f"{category} {topic}"
+    templates = [
+        template
+        for keywords, group in QUERY_TEMPLATES if any(k in haystack for k in keywords)
+        for template in group
+    ]
+    templates += DEFAULT_TEMPLATES
+
+    queries = [topic]
+    seen = {normalize_query(topic)}
+    topic_words = set(normalize_query(topic).split())
+    for template in templates:
+        if len(queries) > limit:
+            break
+        query = template.format(topic=topic, year=date.today().year)
+        added = set(normalize_query(query).split()) - topic_words
+        key = normalize_query(query)
+        if not added or key in seen:
+            continue
+        seen.add(key)
+        queries.append(query)
+    return queries
+
+
+def _normalize_url(url: str) -> str:
+    """중복 판단용 URL (scheme/www/끝 슬래시/fragment/추적 파라미터 무시)."""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower().removeprefix("www.")
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query)
+        if not k.lower().startswith(_TRACKING_PARAM_PREFIXES)
+    ))
+    return f"{host}{parts.path.rstrip('/')}" + (f"?{query}" if query else "")
+
+
+def _content_key(content: str) -> str:
+    """같은 글을 옮겨 실은 페이지를 묶기 위한 내용 키 (앞부분 기준)."""
+    text = normalize_query(re.sub(r"[^\w\s]", "", content))
+    return text[:200] if len(text) >= 50 else ""
+
+
+def fuse_results(ranked_lists: list[list[dict]], limit: int = MAX_MERGED_RESULTS) -> list[dict]:
+    """여러 검색 결과 목록을 Reciprocal Rank Fusion(Σ 1/(k + 순위))으로 합친다.
+
+    URL이나 내용이 같은 결과는 하나로 보고 점수를 더하며, 가장 높은 순위로 나온 결과를 남긴다.
+    """
+    groups: list[dict] = []  # {"result", "score", "best_rank"}
+    by_key: dict[str, dict] = {}
+    for results in ranked_lists:
+        for rank, result in enumerate(results, 1):
+            keys = [f"url:{_normalize_url(result.get('url', ''))}"]
+            content_key = _content_key(result.get("content", ""))
+            if content_key:
+                keys.append(f"content:{content_key}")
+            group = next((by_key[k] for k in keys if k in by_key), None)
+            if group is None:
+                group = {"result": result, "score": 0.0, "best_rank": rank}
+                groups.append(group)
+            elif rank < group["best_rank"]:
+                group["result"], group["best_rank"] = result, rank
+            group["score"] += 1.0 / (RRF_K + rank)
+            for k in keys:
+                by_key.setdefault(k, group)
+
+    groups.sort(key=lambda g: g["score"], reverse=True)  # 안정 정렬: 동점이면 먼저 나온 순
+    return [{**g["result"], "rrf_score": round(g["score"], 5)} for g in groups[:limit]]
+
+
+def _overall_cache_status(statuses: list[str]) -> str:
+    """검색어별 캐시 상태를 하나로: 모두 hit이면 hit(네트워크 없음), 일부만이면 partial."""
+    hits = statuses.count("hit")
+    if hits == len(statuses):
+        return "hit"
+    if hits:
+        return "partial"
+    return "off" if "off" in statuses else "miss"
+
+
+def _get_client(api_key: str):
+    """API 키별 TavilyClient를 프로세스에서 하나만 만들어 재사용."""
+    from tavily import TavilyClient
+
+    with _clients_lock:
+        client = _clients.get(api_key)
+        if client is None:
+            client = _clients[api_key] = TavilyClient(api_key=api_key)
+        return client
+
+
+def _cache_settings(db) -> tuple[float, int]:
+    """(TTL 초, 최대 항목 수)."""
+    cfg = db.get_skill_config("search") if db else None
+    config = cfg.config if cfg else {}
+    try:
+        ttl_hours = float(config.get("cache_ttl_hours", DEFAULT_CACHE_TTL_HOURS))
+        max_entries = int(config.get("cache_max_entries", DEFAULT_CACHE_MAX_ENTRIES))
+    except (TypeError, ValueError):
+        ttl_hours, max_entries = DEFAULT_CACHE_TTL_HOURS, DEFAULT_CACHE_MAX_ENTRIES
+    return ttl_hours * 3600, max_entries
+
 
 class SearchSkill(SkillBase):
     @property
@@ -16,35 +193,79 @@ class SearchSkill(SkillBase):
     def description(self) -> str:
         return "Tavily API를 사용한 웹 검색 (최신 정보 수집)"
 
+    @property
+    def depends_on(self) -> tuple[str, ...]:
+        return ()
+
+    @property
+    def empty_data(self) -> dict:
+        return {"results": [], "cache": "miss", "queries": []}
+
     def execute(self, context: SkillContext) -> SkillResult:
-        api_key = os.environ.get("TAVILY_API_KEY", "")
-        if not api_key:
-            return SkillResult(
-                skill_name=self.name,
-                data=[],
-                summary="[검색 스킵: TAVILY_API_KEY가 설정되지 않았습니다]",
-            )
+        db = context.db
+        ttl_seconds, max_entries = _cache_settings(db)
+        use_cache = db is not None and ttl_seconds > 0
+
+        queries = expand_queries(context.topic, context.category)
+        params = [SEARCH_PARAMS] + [SUB_QUERY_PARAMS] * (len(queries) - 1)
+        keys = [search_cache_key(q, p) for q, p in zip(queries, params)]
+
+        # 캐시에 있는 검색어는 네트워크 없이
+        responses: list[dict | None] = [
+            db.get_search_cache(key, ttl_seconds) if use_cache else None for key in keys
+        ]
+        statuses = ["hit" if r is not None else ("miss" if use_cache else "off") for r in responses]
+        missing = [i for i, r in enumerate(responses) if r is None]
+
+        skip_reason = ""
+        if missing:
+            api_key = os.environ.get("TAVILY_API_KEY", "")
+            client = None
+            if not api_key:
+                skip_reason = "TAVILY_API_KEY가 설정되지 않았습니다"
+            else:
+                try:
+                    client = _get_client(api_key)
+                except ImportError:
+                    skip_reason = "tavily-python 패키지가 설치되지 않았습니다"
 
-        try:
-            from tavily import TavilyClient
-        except ImportError:
+            if client is not None:
+                # search(timeout=)이 HTTP 요청 제한 시간이 되는 것은 tavily-python 0.5.2부터
+                # (그 전에는 요청 본문으로 넘어가 무시된다) - requirements의 최소 버전 참고
+                time_left = context.time_left()
+                timeout = {"timeout": max(1, int(time_left))} if time_left is not None else {}
+
+                def search(i: int) -> dict:
+                    return client.search(query=queries[i], **params[i], **timeout)
+
+                # 검색어들을 동시에 - 전체 시간은 가장 느린 검색 하나 정도
+                with ThreadPoolExecutor(max_workers=len(missing)) as pool:
+                    futures = {i: pool.submit(search, i) for i in missing}
+                errors = []
+                for i, future in futures.items():
+                    try:
+                        responses[i] = future.result()
+                    except Exception as exc:
+                        statuses[i] = "error"
+                        errors.append(exc)
+                        continue
+                    if use_cache:
+                        db.save_search_cache(
+                            keys[i], queries[i], responses[i], ttl_seconds, max_entries
+                        )
+                # 모두 실패했을 때만 스킬 실패로 (일부 실패는 나머지 결과로 진행)
+                if errors and all(r is None for r in responses):
+                    raise errors[0]
+
+        if all(r is None for r in responses):
             return SkillResult(
                 skill_name=self.name,
-                data=[],
-                summary="[검색 스킵: tavily-python 패키지가 설치되지 않았습니다]",
+                data={"results": [], "cache": _overall_cache_status(statuses), "queries": []},
+                summary=f"[검색 스킵: {skip_reason}]",
             )
 
-        client = TavilyClient(api_key=api_key)
-        response = client.search(
-            query=context.topic,
-            search_depth="advanced",
-            topic="general",
-            max_results=5,
-            include_answer=True,
-        )
-
-        results = response.get("results", [])
-        answer = response.get("answer", "")
+        results = fuse_results([r.get("results", []) for r in responses if r is not None])
+        answer = responses[0].get("answer", "") if responses[0] else ""
 
         summary_parts = []
         if answer:
@@ -52,16 +273,33 @@ class SearchSkill(SkillBase):
 
         summary_parts.append("## 참고 자료")
         for i, r in enumerate(results, 1):
-            content = r.get("content", "")[:300]
+            content = r.get("content", "")[:RESULT_CONTENT_CHARS]
             summary_parts.append(
                 f"{i}. **{r['title']}** (출처: {r['url']})\n   {content}"
             )
 
         summary = "\n\n".join(summary_parts)
 
+        query_info = [
+            {
+                "query": q,
+                "cache": status,
+                "count": len(r.get("results", [])) if r is not None else 0,
+            }
+            for q, status, r in zip(queries, statuses, responses)
+        ]
         return SkillResult(
             skill_name=self.name,
-            data=results,
+            data={
+                "results": results,
+                "cache": _overall_cache_status(statuses),
+                "queries": query_info,
+            },
             summary=summary,
-            raw=response,
+            raw={
+                "query": context.topic,
+                "answer": answer,
+                "queries": query_info,
+                "results": results,
+            },
         )
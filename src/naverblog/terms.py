@@ -0,0 +1,55 @@
+"""BM25 색인용 용어 추출 - 단어 + 한글 음절 bigram.
+
+한국어는 조사/어미가 붙어 같은 말도 형태가 여러 가지이므로("면접을", "면접에서")
+단어만으로는 잘 겹치지 않는다. 한글 부분은 2음절씩 잘라(bigram) 단어와 함께 색인해
+형태가 달라도 점수가 나오게 하고, 단어 전체가 같으면 추가 점수를 받게 한다.
+
+blog_posts_terms(FTS5) 색인은 이 함수의 결과를 그대로 넣고 지울 때도 같은 결과를
+넘기므로, 추출 규칙을 바꾸면 TERMS_VERSION을 올린다 (다음 시작 때 색인을 다시 만든다).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+import unicodedata
+
+# 추출 규칙을 바꾸면 올린다 (Database가 app_config의 값과 다르면 색인을 다시 만든다)
+TERMS_VERSION = 1
+
+MIN_WORD_LENGTH = 2
+
+_WORD_RE = re.compile(r"[^\W_]+")  # FTS5 unicode61과 같이 _는 구분자로 본다
+_HANGUL_RUN_RE = re.compile(r"[가-힣]{2,}")
+
+
+def extract_terms(text: str) -> list[str]:
+    """텍스트의 색인 용어 목록 (등장 순서, 중복 포함)."""
+    terms = []
+    for word in _WORD_RE.findall(unicodedata.normalize("NFKC", text).casefold()):
+        if len(word) >= MIN_WORD_LENGTH:
+            terms.append(word)
+        for run in _HANGUL_RUN_RE.findall(word):
+            if run == word and len(run) == 2:
+                continue  # 두 음절 단어는 bigram과 같다
+            terms.extend(run[i:i + 2] for i in range(len(run) - 1))
+    return terms
+
+
+def index_text(text: str) -> str:
+    """FTS5 색인 컬럼에 넣을 공백 구분 용어 문자열."""
+    return " ".join(extract_terms(text or ""))
+
+
+def query_terms(text: str) -> list[str]:
+    """검색어의 용어 목록 (중복 제거, 등장 순서 유지)."""
+    return list(dict.fromkeys(extract_terms(text)))
+
+
+def scope_token(kind: str, value: str) -> str:
+    """블로그/카테고리 필터용 토큰 (kind: "b" 또는 "c"). 영숫자만이라 그대로 한 토큰이 된다."""
+    return kind + hashlib.md5(value.encode("utf-8")).hexdigest()[:16]
+
+
+def index_scope(blog_id: str, category: str) -> str:
+    return f"{scope_token('b', blog_id or '')} {scope_token('c', category or '')}"